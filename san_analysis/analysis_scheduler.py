@@ -0,0 +1,232 @@
+"""Module to run san_analysis stages in order of their dependencies.
+Stage is dictionary with 'name', 'function', 'args' (names of data passed to the function
+before project_constants_lst), 'returns' (names of data returned by the function),
+'io_name' (stage name in the in_out_data_names table) and 'interactive' (stage requests user input) keys.
+Stage depends on the stages producing its args and on the previous stages with outputs declared
+as its inputs in the in_out_data_names table. Independent stages are run in ANALYSIS_WORKERS threads.
+Stage is forced to run if any of its declared inputs is changed during current program execution
+so only stages with unchanged inputs load their data from the database.
+Extracted data is requested from the data registry when the first stage using it is started
+and data is released after the last stage using it is finished"""
+
+
+import io
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+import utilities.dataframe_operations as dfop
+import utilities.module_execution as meop
+import utilities.registry_operations as rgop
+from san_automation_constants import ANALYSIS_WORKERS
+
+
+class StageOutput(io.TextIOBase):
+    """Stdout replacement to collect output of the stage running in thread.
+    Output is displayed after stage is finished so outputs of the stages are not mixed.
+    Output of the main thread is displayed right away"""
+
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.thread_data = threading.local()
+
+    def write(self, s):
+        buffer = getattr(self.thread_data, 'buffer', None)
+        return (buffer or self.stdout).write(s)
+
+    def flush(self):
+        if getattr(self.thread_data, 'buffer', None) is None:
+            self.stdout.flush()
+
+
+def run_analysis_stages(stage_lst, extracted_data_registry, output_names, project_constants_lst, workers=ANALYSIS_WORKERS):
+    """Function runs stages from stage_lst and returns list of output_names data
+    (if data returned by several stages then data of the latest stage in stage_lst is taken).
+    Data used as stage args but not returned by any of the previous stages is requested from 
+    extracted_data_registry. Data is released after the last stage it is passed to is finished"""
+
+    _, _, io_data_names_df, *_ = project_constants_lst
+    schedule_dct = create_stage_schedule(stage_lst, extracted_data_registry, output_names, io_data_names_df)
+
+    if workers > 1:
+        run_stages_concurrently(stage_lst, schedule_dct, project_constants_lst, workers)
+    else:
+        for stage in stage_lst:
+            stage_args = get_stage_args(stage, schedule_dct)
+            force_changed_inputs(stage, project_constants_lst)
+            schedule_dct['results'][stage['name']] = run_stage(stage, stage_args, project_constants_lst)
+            release_stage_data(stage, schedule_dct)
+    return [schedule_dct['results'][schedule_dct['output_sources'][data_name]][data_name] for data_name in output_names]
+
+
+def create_stage_schedule(stage_lst, extracted_data_registry, output_names, io_data_names_df):
+    """Function returns dictionary with stage dependencies and stage data sources
+    (see get_stage_dependencies), data consumers {(stage_name or None, data_name): set of stage names},
+    stages returned the latest version of the output_names data, extracted_data_registry 
+    and data returned by each stage {stage_name: {data_name: data}}"""
+
+    stage_dependencies_dct, stage_sources_dct = get_stage_dependencies(stage_lst, io_data_names_df)
+    data_consumers_dct = {}
+    for stage in stage_lst:
+        for arg, producer in stage_sources_dct[stage['name']].items():
+            data_consumers_dct.setdefault((producer, arg), set()).add(stage['name'])
+    output_sources_dct = {data_name: stage['name'] for stage in stage_lst 
+                            for data_name in stage['returns'] if data_name in output_names}
+    return {'dependencies': stage_dependencies_dct, 'sources': stage_sources_dct, 'consumers': data_consumers_dct, 
+            'output_sources': output_sources_dct, 'registry': extracted_data_registry, 'results': {}}
+
+
+def get_stage_dependencies(stage_lst, io_data_names_df):
+    """Function returns dictionary with names of the stages each stage depends on {stage_name: set of stage names}
+    and dictionary with stage args sources {stage_name: {arg_name: stage_name or None if arg is extracted data}}.
+    Dependencies are taken only from the previous stages of stage_lst (stage_lst order is always valid)"""
+
+    stage_dependencies_dct = {}
+    stage_sources_dct = {}
+    # stage returned the latest version of the data {data_name: stage_name}
+    data_producer_dct = {}
+    # data names declared as stage outputs in the in_out_data_names table {stage_name: set of data names}
+    stage_out_dct = {}
+
+    for stage in stage_lst:
+        stage_sources_dct[stage['name']] = {arg: data_producer_dct.get(arg) for arg in stage['args']}
+        dependencies = {producer for producer in stage_sources_dct[stage['name']].values() if producer}
+        # dependencies declared in in_out_data_names table
+        stage_in_names = set(get_stage_io_names(stage, io_data_names_df, 'in'))
+        dependencies.update(stage_name for stage_name, stage_out_names in stage_out_dct.items()
+                            if stage_out_names & stage_in_names)
+        stage_dependencies_dct[stage['name']] = dependencies
+
+        stage_out_dct[stage['name']] = set(get_stage_io_names(stage, io_data_names_df, 'out'))
+        data_producer_dct.update((data_name, stage['name']) for data_name in stage['returns'])
+    return stage_dependencies_dct, stage_sources_dct
+
+
+def get_stage_io_names(stage, io_data_names_df, io_type):
+    """Function returns list of data names declared as stage inputs (io_type 'in')
+    or outputs (io_type 'out') in the in_out_data_names table"""
+
+    column = stage['io_name'] + '_' + io_type
+    if not column in io_data_names_df.columns:
+        return []
+    return dfop.list_from_dataframe(io_data_names_df, column)
+
+
+def get_stage_args(stage, schedule_dct):
+    """Function returns list of data passed to the stage function"""
+
+    stage_args = []
+    for arg, producer in schedule_dct['sources'][stage['name']].items():
+        if producer:
+            stage_args.append(schedule_dct['results'][producer][arg])
+        else:
+            stage_args.append(rgop.get_data(schedule_dct['registry'], arg))
+    return stage_args
+
+
+def release_stage_data(stage, schedule_dct):
+    """Function releases data which is not used by the next stages after stage is finished
+    (output data is kept)"""
+
+    for arg, producer in schedule_dct['sources'][stage['name']].items():
+        consumers = schedule_dct['consumers'][(producer, arg)]
+        consumers.discard(stage['name'])
+        if consumers:
+            continue
+        if producer:
+            release_stage_result(producer, arg, schedule_dct)
+        else:
+            rgop.release_data(schedule_dct['registry'], arg)
+    # data returned by the stage and not used by any stage
+    for data_name in stage['returns']:
+        if not schedule_dct['consumers'].get((stage['name'], data_name)):
+            release_stage_result(stage['name'], data_name, schedule_dct)
+
+
+def release_stage_result(stage_name, data_name, schedule_dct):
+    """Function releases data_name returned by the stage_name if it's not output data"""
+
+    if schedule_dct['output_sources'].get(data_name) != stage_name:
+        schedule_dct['results'][stage_name].pop(data_name, None)
+
+
+def run_stage(stage, stage_args, project_constants_lst):
+    """Function runs stage function and returns dictionary with data returned by the stage"""
+
+    result = stage['function'](*stage_args, project_constants_lst)
+    if len(stage['returns']) == 1:
+        result = [result]
+    return dict(zip(stage['returns'], result))
+
+
+def force_changed_inputs(stage, project_constants_lst):
+    """Function sets force_run flag for the stage declared inputs which were collected or analyzed
+    during current program execution. Stage is re-analyzed if any of its inputs is changed
+    and data is loaded from the database otherwise"""
+
+    project_steps_df, _, io_data_names_df, *_ = project_constants_lst
+    changed_names = [data_name for data_name in get_stage_io_names(stage, io_data_names_df, 'in')
+                     if data_name in meop.changed_data_names and data_name in project_steps_df.index]
+    if changed_names:
+        project_steps_df.loc[changed_names, 'force_run'] = 1
+
+
+def run_stages_concurrently(stage_lst, schedule_dct, project_constants_lst, workers):
+    """Function runs stages which dependencies are finished in the thread pool.
+    Interactive stages are run in the main thread. Ready stages are started in stage_lst order"""
+
+    pending_stage_lst = list(stage_lst)
+    stage_future_dct = {}
+    stage_output = StageOutput(sys.stdout)
+    sys.stdout = stage_output
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while pending_stage_lst or stage_future_dct:
+                ready_stage_lst = [stage for stage in pending_stage_lst
+                                    if schedule_dct['dependencies'][stage['name']].issubset(schedule_dct['results'])]
+                # stages in threads are started before stage in main thread
+                for stage in sorted(ready_stage_lst, key=lambda stage: stage['interactive']):
+                    stage_args = get_stage_args(stage, schedule_dct)
+                    pending_stage_lst.remove(stage)
+                    force_changed_inputs(stage, project_constants_lst)
+                    if stage['interactive']:
+                        # readiness of the stages is verified again after stage in main thread is finished
+                        schedule_dct['results'][stage['name']] = run_stage(stage, stage_args, project_constants_lst)
+                        release_stage_data(stage, schedule_dct)
+                        break
+                    # DataFrames are copied to avoid changes of the data used by other stages
+                    stage_args = [arg.copy() if isinstance(arg, (pd.DataFrame, pd.Series)) else arg for arg in stage_args]
+                    future = executor.submit(run_thread_stage, stage, stage_args, project_constants_lst, stage_output)
+                    stage_future_dct[future] = stage
+                else:
+                    if not stage_future_dct:
+                        if pending_stage_lst:
+                            print('\nERROR. Analysis stages dependencies are not resolved')
+                            sys.exit()
+                        continue
+                    finished_futures, _ = wait(stage_future_dct, return_when=FIRST_COMPLETED)
+                    for future in finished_futures:
+                        stage = stage_future_dct.pop(future)
+                        stage_result, output, error = future.result()
+                        stage_output.stdout.write(output)
+                        if error:
+                            raise error
+                        schedule_dct['results'][stage['name']] = stage_result
+                        release_stage_data(stage, schedule_dct)
+    finally:
+        sys.stdout = stage_output.stdout
+
+
+def run_thread_stage(stage, stage_args, project_constants_lst, stage_output):
+    """Function runs stage in the thread with stage output collected to the buffer.
+    Returns data returned by the stage, stage output and error raised by the stage"""
+
+    stage_output.thread_data.buffer = io.StringIO()
+    try:
+        return run_stage(stage, stage_args, project_constants_lst), stage_output.thread_data.buffer.getvalue(), None
+    except BaseException as error:
+        return None, stage_output.thread_data.buffer.getvalue(), error
+    finally:
+        stage_output.thread_data.buffer = None
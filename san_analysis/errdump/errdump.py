@@ -2,11 +2,17 @@
 within a period of six month prior to the switch configuration collection date """
 
 
+from functools import partial
+
+import pandas as pd
+
 import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+from san_automation_constants import (ERRDUMP_CHUNK_SIZE, ERRDUMP_MESSAGE_ID_LST,
+                                      ERRDUMP_PERIOD, ERRDUMP_SEVERITY_LST)
 
 from .errdump_aggregation import errdump_aggregated
 from .errdump_statistics import errdump_statistics
@@ -14,7 +20,8 @@ from .errdump_statistics import errdump_statistics
 
 def errdump_analysis(errdump_df, switchshow_df, switch_params_aggregated_df, 
                 portshow_aggregated_df, project_constants_lst):
-    """Main function to get most frequently appeared log messages"""
+    """Main function to get most frequently appeared log messages.
+    If errdump_df is None then errdump is read from the database"""
     
     # imported project constants required for module execution
     project_steps_df, max_title, io_data_names_df, _, report_headers_df, report_columns_usage_sr, *_ = project_constants_lst
@@ -37,6 +44,10 @@ def errdump_analysis(errdump_df, switchshow_df, switch_params_aggregated_df,
         raslog_message_details_df = sfop.dataframe_import('raslog_details', max_title)
         raslog_message_id_details_df = sfop.dataframe_import('raslog_id_details', max_title, columns=['Message_ID', 'Details', 'Recommended_action'])
 
+        # errdump is written to the database by chunks during collection
+        if errdump_df is None:
+            errdump_df = read_errdump(switch_params_aggregated_df, project_constants_lst)
+
         # current operation information string
         info = f'Counting RASLog messages statistics'
         print(info, end =" ")
@@ -65,6 +76,58 @@ def errdump_analysis(errdump_df, switchshow_df, switch_params_aggregated_df,
     return errdump_aggregated_df, raslog_counter_df
 
 
+def read_errdump(switch_params_aggregated_df, project_constants_lst):
+    """Function reads errdump from the database by chunks of ERRDUMP_CHUNK_SIZE messages.
+    Collection filters (ERRDUMP_PERIOD, ERRDUMP_MESSAGE_ID_LST and ERRDUMP_SEVERITY_LST) are applied
+    to each chunk so messages filtered out with current settings are not kept in memory"""
+
+    max_title, io_data_names_df = project_constants_lst[1:3]
+    data_names = dfop.list_from_dataframe(io_data_names_df, 'errorlog_collection')
+    min_message_date_sr = get_min_message_date(switch_params_aggregated_df, ERRDUMP_PERIOD)
+    errdump_df = dbop.read_database_chunks(project_constants_lst, data_names[0], 
+                                            partial(filter_errdump, min_message_date_sr=min_message_date_sr), 
+                                            ERRDUMP_CHUNK_SIZE)
+    if errdump_df is None:
+        print(f'\nERROR. {data_names[0]} is not found in the database')
+        exit()
+    # errdump with no messages
+    if errdump_df.empty:
+        return errdump_df
+    errdump_df, = dbop.verify_read_data(max_title, data_names, errdump_df)
+    return errdump_df
+
+
+def get_min_message_date(switch_params_aggregated_df, errdump_period):
+    """Function returns Series with the earliest errdump message date in errdump date format 
+    (errdump_period months prior to the config collection date) for each configname.
+    None returned if period is not defined"""
+
+    if errdump_period is None:
+        return None
+    config_collection_date_sr = switch_params_aggregated_df.drop_duplicates(subset=['configname']).set_index('configname')['config_collection_date']
+    # collection date of each config is converted separately as during errdump collection
+    config_collection_date_sr = config_collection_date_sr.map(lambda collection_date: pd.to_datetime(collection_date, errors='coerce'))
+    min_message_date_sr = pd.to_datetime(config_collection_date_sr) - pd.DateOffset(months=errdump_period)
+    return min_message_date_sr.dt.strftime('%Y/%m/%d-%H:%M:%S')
+
+
+def filter_errdump(errdump_df, min_message_date_sr=None):
+    """Function returns errdump messages not older than min_message_date for the configname 
+    (messages of configs without collection date are kept) with message id and severity in 
+    ERRDUMP_MESSAGE_ID_LST and ERRDUMP_SEVERITY_LST (if defined)"""
+
+    mask_sr = pd.Series(True, index=errdump_df.index)
+    if min_message_date_sr is not None:
+        min_message_date = errdump_df['configname'].map(min_message_date_sr).fillna('')
+        # errdump date format is YYYY/MM/DD-HH:MM:SS so dates are compared as strings
+        mask_sr &= errdump_df['Message_date'].fillna('') >= min_message_date
+    if ERRDUMP_MESSAGE_ID_LST:
+        mask_sr &= errdump_df['Message_ID'].isin(ERRDUMP_MESSAGE_ID_LST)
+    if ERRDUMP_SEVERITY_LST:
+        mask_sr &= errdump_df['Severity'].isin(ERRDUMP_SEVERITY_LST)
+    return errdump_df.loc[mask_sr]
+
+
 def raslog_report(raslog_frequent_df, data_names, report_headers_df, report_columns_usage_sr):
     """Function to check if it is required to use chassis_name columns. RASLog sometimes uses it's own
     chname not equal to switchname or chassis name thus it's better to keep default chassis names
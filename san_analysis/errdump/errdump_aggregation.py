@@ -1,7 +1,7 @@
 """Module to label errdump, extract information from error messages and
 verify match with portshow DataFrame"""
 
-import warnings
+import re
 
 import numpy as np
 import pandas as pd
@@ -118,15 +118,28 @@ def message_extract(errdump_aggregated_df, pattern_dct):
     dfop.column_to_object(errdump_aggregated_df, *extract_columns_lst)
     
     # extract corresponding values if regex pattern applicable
+    # each pattern is applied once to unique messages only and extracted values are copied to all rows with the same message
+    message_codes, message_unique_arr = pd.factorize(errdump_aggregated_df['Message'])
+    message_unique_sr = pd.Series(message_unique_arr, dtype='object')
+    # extracted values and mask of unique messages values extracted for each column
+    extracted_values_dct = {column: np.full(len(message_unique_sr), np.nan, dtype='object') for column in extract_columns_lst}
+    extracted_mask_dct = {column: np.zeros(len(message_unique_sr), dtype=bool) for column in extract_columns_lst}
+    # patterns applied in order thus values extracted by the next pattern replace values extracted by the previous one
     for pattern, extracted_columns in extract_pattern_columns_lst:
-        # pattern contains groups but str.cotains used to identify mask
-        # supress warning message
-        warnings.filterwarnings("ignore", 'This pattern is interpreted as a regular expression, and has match groups.')
-        mask = errdump_aggregated_df['Message'].str.contains(pattern, regex=True)
-        errdump_aggregated_df.loc[mask, extracted_columns] = errdump_aggregated_df.loc[mask, 'Message'].str.extract(pattern).values
+        mask, extracted_df = message_pattern_extract(message_unique_sr, pattern)
+        for i, column in enumerate(extracted_columns):
+            extracted_values_dct[column][mask] = extracted_df[i].to_numpy(dtype='object')[mask]
+            extracted_mask_dct[column] |= mask
+    # copy extracted values to all messages
+    mask_message_notna = message_codes != -1
+    for column in extract_columns_lst:
+        mask_extracted = mask_message_notna & extracted_mask_dct[column][message_codes]
+        if mask_extracted.any():
+            errdump_aggregated_df.loc[mask_extracted, column] = extracted_values_dct[column][message_codes[mask_extracted]]
     
     # sec_violation_unauthorized_host contains tcp port number and need to be removed
-    mask_unauthorized_host = errdump_aggregated_df['Message'].str.contains(pattern_dct['sec_violation_unauthorized_host'], na=False)
+    mask_unauthorized_host, _ = message_pattern_extract(message_unique_sr, pattern_dct['sec_violation_unauthorized_host'])
+    mask_unauthorized_host = mask_message_notna & mask_unauthorized_host[message_codes]
     errdump_aggregated_df.loc[mask_unauthorized_host, ['Message_portType', 'port']] = pd.Series([np.nan, np.nan])
 
     # add empty columns if they were not extracted
@@ -152,6 +165,17 @@ def message_extract(errdump_aggregated_df, pattern_dct):
     return errdump_aggregated_df
     
 
+def message_pattern_extract(message_sr, pattern):
+    """Function to extract pattern groups from message_sr. 
+    Returns mask of messages matched the pattern and DataFrame with extracted groups"""
+
+    # empty trailing group shows if pattern is found in the message
+    search_pattern = re.compile(r'(?:' + pattern.pattern + r')()', pattern.flags)
+    extracted_df = message_sr.str.extract(search_pattern, expand=True)
+    mask = extracted_df.pop(pattern.groups).notna().to_numpy()
+    return mask, extracted_df
+
+
 def errdump_portshow(errdump_aggregated_df, portshow_aggregated_df):
     """Function to add port and connected device information to errdump_aggregated_df"""
 
@@ -61,7 +61,7 @@ def fabric_label_analysis(switchshow_ports_df, switch_params_df, fabricshow_df,
         reply = meop.reply_request(query)
         if reply == 'y':
             # saving DataFrame to Excel to check during manual labeling if required
-            report.dataframe_to_excel(fabricshow_summary_df, 'fabricshow_summary', project_constants_lst, force_flag=True)
+            report.dataframe_to_excel(fabricshow_summary_df, 'fabricshow_summary', project_constants_lst, force_flag=True, write_now=True)
             fabricshow_summary_df = manual_fabrics_labeling(fabricshow_summary_df, fabricshow_summary_automatic_df, info_labels)
         
         # takes all switches working in Native and AG switches
@@ -24,7 +24,7 @@ def auto_fabrics_labeling(switchshow_ports_df, switch_params_df, fabricshow_df,
     # counts statistics for port type (F-port, E-port) and port state (Online) for each switch in fabricshow
     fabricshow_porttype_state_df = fabricshow_porttype_state(switchshow_ports_df, switch_ls_type_df, fabricshow_df)
     # saving DataFrame to Excel if manual labeling required
-    report.dataframe_to_excel(fabricshow_porttype_state_df, 'fabricshow_statistics', project_constants_lst, force_flag=True)
+    report.dataframe_to_excel(fabricshow_porttype_state_df, 'fabricshow_statistics', project_constants_lst, force_flag=True, write_now=True)
     # removing front domain and translate domain switches from DataFrame
     fabricshow_porttype_state_df = fabricshow_porttype_state_df.loc[fabricshow_porttype_state_df.Enet_IP_Addr != '0.0.0.0']
     # dividing fabricshow_porttype_state_df into groups. One group for each fabric
@@ -5,8 +5,6 @@ import re
 import numpy as np
 import pandas as pd
 
-import utilities.dataframe_operations as dfop
-
 
 def port_sfp_join(portshow_aggregated_df, sfpshow_df, sfp_model_df, pattern_dct):
     """Function to add sfp readings, sfp model details and find sfp redings intervals"""
@@ -20,7 +18,7 @@ def port_sfp_join(portshow_aggregated_df, sfpshow_df, sfp_model_df, pattern_dct)
     # add sfp model details
     port_complete_df = port_complete_df.merge(sfp_model_df, how='left', on=['Transceiver_PN'])
     # verify if transceiver is supported
-    port_complete_df['Transceiver_Supported'] = port_complete_df.apply(lambda series: verify_sfp_support(series), axis='columns')
+    port_complete_df['Transceiver_Supported'] = verify_sfp_support(port_complete_df)
     
     # mark intervals between lower_threshold and upper_threshold
     # readings column name, lower threshold, upper threshold, step, filter_online flag
@@ -44,24 +42,31 @@ def port_sfp_join(portshow_aggregated_df, sfpshow_df, sfp_model_df, pattern_dct)
     return port_complete_df
 
 
-def verify_sfp_support(series):
-    """Function to check if transceiver is supported based 
-    on transceiver part number and switch generation"""
+def verify_sfp_support(port_complete_df):
+    """Function to check if transceivers are supported based 
+    on transceiver part number and switch generation. 
+    Support is verified once for each transceiver switch generations and switch generation pair"""
     
+    support_columns = ['Transceiver_switch_gen', 'Generation']
     # no transceiver installed
-    if pd.isna(series['Transceiver_PN']):
-        return np.nan
+    sfp_support_sr = pd.Series(np.nan, index=port_complete_df.index, dtype='object')
     # transceiver is not found in imported 
     # transceiver information table
-    if pd.isna(series['Transceiver_switch_gen']):
-        return 'Unknown SFP'
+    mask_sfp_installed = port_complete_df['Transceiver_PN'].notna()
+    sfp_support_sr[mask_sfp_installed] = 'Unknown SFP'
     # switch generation is unknown
-    if pd.isna(series['Generation']):
-        return 'Unknown switch'
+    mask_sfp_known = mask_sfp_installed & port_complete_df['Transceiver_switch_gen'].notna()
+    sfp_support_sr[mask_sfp_known] = 'Unknown switch'
     # switch generation is in the supported list
-    if series['Generation'] in series['Transceiver_switch_gen']:
-        return 'Yes'
-    return 'No'
+    mask_gen_known = mask_sfp_known & port_complete_df['Generation'].notna()
+    if mask_gen_known.any():
+        port_gen_df = port_complete_df.loc[mask_gen_known, support_columns]
+        sfp_support_df = port_gen_df.drop_duplicates().copy()
+        sfp_support_df['Transceiver_Supported'] = \
+            ['Yes' if generation in switch_gen else 'No' for switch_gen, generation in sfp_support_df.itertuples(index=False)]
+        sfp_support_sr[mask_gen_known] = \
+            port_gen_df.merge(sfp_support_df, how='left', on=support_columns)['Transceiver_Supported'].values
+    return sfp_support_sr
 
 
 def extract_floats(df, source_column: str, destination_column: str, pattern_dct):
@@ -81,7 +86,6 @@ def find_readings_intervals(portshow_sfp_aggregated_df, pattern_dct, readings_co
     
     float_readings_column = readings_column + '_float'
     interval_readings_column = readings_column + '_interval'
-    interval_readings_tmp_column = interval_readings_column + '_tmp'
     
     # convert redings to float
     extract_floats(portshow_sfp_aggregated_df, readings_column, float_readings_column, pattern_dct)
@@ -94,50 +98,19 @@ def find_readings_intervals(portshow_sfp_aggregated_df, pattern_dct, readings_co
     # summary port filter
     mask_filtered_ports = mask_online & mask_sfp_present if filter_online else mask_sfp_present
     
-    # mark interval less then lower threshold
-    mask_lower_threshold = portshow_sfp_aggregated_df[float_readings_column] < lower_threshold
-    dfop.column_to_object(portshow_sfp_aggregated_df, interval_readings_column)
-    portshow_sfp_aggregated_df.loc[
-        mask_filtered_ports & mask_lower_threshold, interval_readings_column] = 'x < ' + str(lower_threshold)
-    
-    # mark intervals between lower_threshold and upper_threshold devided by step
-    current_lower_threshold = lower_threshold
-    while current_lower_threshold < upper_threshold:
-        current_upper_threshold = current_lower_threshold + step
-        # if upper_threshold on current step exceeds global upper_threshold 
-        # then reduce current_upper_threshold to global upper_threshold
-        if current_upper_threshold > upper_threshold:
-            current_upper_threshold = upper_threshold
-        mask_within_interval = portshow_sfp_aggregated_df[float_readings_column].between(
-            left=current_lower_threshold, right=current_upper_threshold, inclusive='left')
-
-        # write values which fall into current interval to temporary column 
-        dfop.column_to_object(portshow_sfp_aggregated_df, interval_readings_tmp_column)
-        portshow_sfp_aggregated_df.loc[mask_filtered_ports & mask_within_interval, interval_readings_tmp_column] = \
-            str(current_lower_threshold) + ' <= x < ' + str(current_upper_threshold)     
-        
-        # fill empty cells in interval redings column with values from temporary column
-        # portshow_sfp_aggregated_df[interval_readings_column].fillna(
-        #     portshow_sfp_aggregated_df[interval_readings_tmp_column], inplace=True) # depricated method
-        
-        portshow_sfp_aggregated_df[interval_readings_column] = \
-            portshow_sfp_aggregated_df[interval_readings_column].fillna(portshow_sfp_aggregated_df[interval_readings_tmp_column])
-        current_lower_threshold += step
-    
-    # mark interval higher then upper threshold    
-    mask_upper_threshold = portshow_sfp_aggregated_df[float_readings_column] >= upper_threshold
-    # write interval to tmp column
-    portshow_sfp_aggregated_df.loc[
-        mask_filtered_ports & mask_upper_threshold, interval_readings_tmp_column] = 'x >= ' + str(upper_threshold)
-    # fill empty cells in the interval column with values from the tmp column
-    portshow_sfp_aggregated_df[interval_readings_column].fillna(
-        portshow_sfp_aggregated_df[interval_readings_tmp_column], inplace=True)
-    
-    # fill empty cells in the interval column with values for filtered ports from the readings column (not float values)
-    portshow_sfp_aggregated_df[interval_readings_tmp_column] = \
-        portshow_sfp_aggregated_df.loc[mask_filtered_ports, interval_readings_tmp_column]
-    portshow_sfp_aggregated_df[interval_readings_column].fillna(
-        portshow_sfp_aggregated_df[interval_readings_tmp_column], inplace=True)
+    # interval bounds from lower_threshold to upper_threshold devided by step
+    # (the last interval is reduced to upper_threshold)
+    bounds_lst = [lower_threshold]
+    while bounds_lst[-1] < upper_threshold:
+        bounds_lst.append(min(bounds_lst[-1] + step, upper_threshold))
+    # labels for intervals less then lower threshold, between thresholds and higher then upper threshold
+    intervals_lst = ['x < ' + str(lower_threshold)] + \
+        [str(current_lower_threshold) + ' <= x < ' + str(current_upper_threshold) 
+            for current_lower_threshold, current_upper_threshold in zip(bounds_lst, bounds_lst[1:])] + \
+                ['x >= ' + str(upper_threshold)]
     
-    # drop tmp column
-    portshow_sfp_aggregated_df.drop(columns=interval_readings_tmp_column, inplace=True)
\ No newline at end of file
+    # mark intervals in which readings fall for filtered ports
+    readings_intervals_sr = pd.cut(portshow_sfp_aggregated_df[float_readings_column], 
+                                   bins=[-np.inf, *bounds_lst, np.inf], labels=intervals_lst, right=False)
+    portshow_sfp_aggregated_df[interval_readings_column] = \
+        readings_intervals_sr.astype('object').where(mask_filtered_ports, np.nan)
@@ -22,7 +22,7 @@ def nsshow_symb_split(nsshow_join_df, pattern_dct):
     # add  and HBA information empty columns to NameServer DataFrame
     nsshow_join_df = nsshow_join_df.reindex(columns=[*nsshow_join_df.columns.tolist(), *nsshow_symb_columns])
     # split up PortSymb and NodeSymb columns
-    nsshow_join_df[nsshow_symb_columns] = nsshow_join_df.apply(lambda series: _symb_split(series, pattern_dct, nsshow_symb_columns), axis = 1)
+    nsshow_join_df[nsshow_symb_columns] = _symb_split(nsshow_join_df, pattern_dct, nsshow_symb_columns)
     
     # show unsplit PortSymb and NodeSymb
     # mask shows rows where neither PortSymb nor NodeSymb was split up
@@ -34,281 +34,132 @@ def nsshow_symb_split(nsshow_join_df, pattern_dct):
     return nsshow_join_df, nsshow_unsplit_df
 
 
-def _symb_split(series, pattern_dct, nsshow_symb_columns):
-    """Function to extract  and HBA information from PortSymb, NodeSymb columns of the NameServer DataFrame"""
+def _nonempty(group_sr):
+    """Function returns matched group values which are not empty (others are NaN)"""
 
-    # regular expression patterns TO_REMOVE
-    # comp_keys, match_keys, comp_dct = re_pattern_lst
-    
-    port_symb = series['PortSymb']
-    node_symb = series['NodeSymb']
+    return group_sr.where(group_sr.fillna('') != '')
+
+
+def _host_name(group_sr):
+    """Function returns matched group values which are not empty and not default host names"""
 
-    match_port_dct = dict()
-    match_node_dct = dict()
-    # create dictionary with PortSymb cell match results
-    if not pd.isnull(port_symb): 
-        # match_port_dct = {match_key: comp_dct[comp_key].match(port_symb) for comp_key, match_key in zip(comp_keys, match_keys)}
-        match_port_dct = {pattern_name: pattern_dct[pattern_name].match(port_symb) for pattern_name in pattern_dct.keys()}
-    # create dictionary with NodeSymb cell match results
-    if not pd.isnull(node_symb):
-        # match_node_dct = {match_key: comp_dct[comp_key].match(node_symb) for comp_key, match_key in zip(comp_keys, match_keys)}
-        match_node_dct = {pattern_name: pattern_dct[pattern_name].match(node_symb) for pattern_name in pattern_dct.keys()}
+    group_sr = _nonempty(group_sr)
+    return group_sr.where(~group_sr.str.contains(r'localhost|none', na=True))
 
-    # 3par_node_match node_symb
-    if not pd.isnull(node_symb) and match_node_dct['3par_node']:
-        match = match_node_dct['3par_node']
-        series['Device_Manufacturer'] = match.group(3)
-        series['Device_Model'] = match.group(2)
-        series['Device_SN'] = match.group(4)
-        series['Device_Name_reserved'] = match.group(1)
-        series['Device_Fw'] = match.group(5)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 9
-        # 3par_port_match port_symb
-        if not pd.isnull(port_symb) and match_port_dct['3par_port']:
-            match = match_port_dct['3par_port']
-            series['Device_Port'] = match.group(1)
-            series['HBA_Model'] = match.group(2)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 10
-    # netapp_node_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['netapp_node']:
-        match = match_node_dct['netapp_node']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        if match.group(3):
-            series['Device_Name'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 21
-        # netapp_port_match port_symb
-        if not pd.isnull(port_symb) and match_port_dct['netapp_port']:
-            match = match_port_dct['netapp_port']
-            series['Device_Port'] = match.group(1)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 26
-    # qlogic_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['qlogic']:
-        match = match_node_dct['qlogic']
-        series['HBA_Model'] = match.group(1)
-        series['HBA_Firmware'] = match.group(2)
-        series['HBA_Driver'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 2
-        # xp_msa_match port_symb
-        if not pd.isnull(port_symb) and match_port_dct['xp_msa']:
-            match = match_port_dct['xp_msa']
-            series['Device_Manufacturer'] = match.group(2)
-            series['Device_Model'] = match.group(1)
-            series['Device_Fw'] = match.group(3)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 14
-        # qlogic_emulex_port_match port symb
-        elif not pd.isnull(port_symb) and match_port_dct['qlogic_emulex_port']:
-            match = match_port_dct['qlogic_emulex_port']
-            series['HBA_Manufacturer'] = match.group(1)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 3
-        # infinibox_match port_symb
-        elif not pd.isnull(port_symb) and match_port_dct['infinibox']:
-            match = match_port_dct['infinibox']
-            series['Device_Manufacturer'] = match.group(2)
-            series['Device_Model'] = match.group(1)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 15
-    # emulex_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['emulex']:
-        match = match_node_dct['emulex']
-        series['HBA_Manufacturer'] = match.group(1)
-        series['HBA_Model'] = match.group(2)
-        series['HBA_Firmware'] = match.group(3)
-        if match.group(4):
-            series['HBA_Driver'] = match.group(4).rstrip('.')
-        if match.group(5) and not re.search(r'localhost|none', match.group(5)):
-            series['Host_Name'] = match.group(5).rstrip('.')
-        if match.group(6):
-            series['Host_OS'] = match.group(6).rstrip('.')
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 4
-    # qlogic_fcoe_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['qlogic_fcoe']:
-        match = match_node_dct['qlogic_fcoe']
-        series['HBA_Manufacturer'] = match.group(1)
-        series['HBA_Model'] = match.group(2)
-        series['HBA_Driver'] = match.group(3)
-        series['HBA_Firmware'] = match.group(4)
-        series['Host_Name'] = match.group(5).rstrip('.')
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 20
-    # ag_switch_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['ag_switch']:
-        match = match_node_dct['ag_switch']
-        series['Device_Name'] = match.group(1)
-        series['IP_Address'] = match.group(2)
-        series['Device_Fw'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 25
-    # hpux_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['hpux']:
-        match = match_node_dct['hpux']
-        if match.group(1) and not re.search(r'localhost|none', match.group(1)):
-            series['Host_Name'] = match.group(1)
-        series['Host_OS'] = match.group(2)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 6
-    # ultrium_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['ultrium']:
-        match = match_node_dct['ultrium']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(4)
-        series['Device_Fw'] = match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 11
-    # emc_vplex_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['emc_vplex']:
-        match = match_node_dct['emc_vplex']
-        series['Device_Manufacturer'] = match.group(1)
-        series['Device_Model'] = match.group(1) + " " + match.group(2)
-        series['Device_SN'] = match.group(3)
-        series['Device_Name'] = match.group(1) + " " + match.group(2) +  " " +  match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 16
-        # emc_vplex_match port_symb
-        if not pd.isnull(port_symb) and match_port_dct['emc_vplex']:
-            match = match_port_dct['emc_vplex']
-            series['Device_Port'] = match.group(4)
-            series['portSymbUsed'] = 'yes'
-            series['portSymbPattern'] = 16
-    # huawei_manufacturer node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['huawei_manufacturer']:
-        match = match_node_dct['huawei_manufacturer']
-        series['Device_Manufacturer'] = match.group(1)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 32
-    # skip_symb node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['skip_symb']:
-        match = match_node_dct['skip_symb']
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 35
-    # qlogic_brocade_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['qlogic_brocade']:
-        match = match_port_dct['qlogic_brocade']
-        series['HBA_Manufacturer'] = match.group(2)
-        series['HBA_Model'] = match.group(1)
-        series['HBA_Driver'] = match.group(3)
-        series['Host_Name'] = match.group(4)
-        series['Host_OS'] = match.group(5)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 27
-    # storeonce_port_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['storeonce_port']:
-        match = match_port_dct['storeonce_port']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(3)
-        if match.group(3):
-            series['Device_Name'] = match.group(1) + " " + match.group(3)
-        series['Device_Port'] = match.group(4)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 8
-    # storeonce_node_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['storeonce_node']:
-        match = match_node_dct['storeonce_node']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(3)
-        if match.group(3):
-            series['Device_Name'] = match.group(1) + " " + match.group(3)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 7
-    # data_domain_match node_symb
-    elif not pd.isnull(node_symb) and match_node_dct['data_domain']:
-        match = match_node_dct['data_domain']
-        series['Device_Model'] = match.group(1)
-        series['nodeSymbUsed'] = 'yes'
-        series['nodeSymbPattern'] = 23
-    # xp_msa_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['xp_msa']:
-        match = match_port_dct['xp_msa']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_Fw'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 14
-    # eva_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['eva']:
-        match = match_port_dct['eva']
-        series['Device_Model'] = match.group(1)
-        series['Device_Name'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 13
-    # library_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['library']:
-        match = match_port_dct['library']
-        series['Device_Model'] = match.group(1)
-        # series['Device_Name'] = match.group(1)
-        series['Device_SN'] = match.group(2)
-        series['Device_Port'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 12
+
+# PortSymb and NodeSymb split rules in order of precedence. Each rule is 
+# (symb column, pattern name, pattern number, {split column: group number or function of groups DataFrame}, 
+# rules applied to the other symb column if rule matched).
+# Rule matched if the pattern matches symb column value, first matched rule is applied
+SYMB_SPLIT_RULES = [
+    ('NodeSymb', '3par_node', 9, 
+        {'Device_Manufacturer': 3, 'Device_Model': 2, 'Device_SN': 4, 'Device_Name_reserved': 1, 'Device_Fw': 5},
+        [('PortSymb', '3par_port', 10, {'Device_Port': 1, 'HBA_Model': 2}, [])]),
+    ('NodeSymb', 'netapp_node', 21, 
+        {'Device_Manufacturer': 2, 'Device_Model': 1, 'Device_Name': lambda g: _nonempty(g[3])},
+        [('PortSymb', 'netapp_port', 26, {'Device_Port': 1}, [])]),
+    ('NodeSymb', 'qlogic', 2, 
+        {'HBA_Model': 1, 'HBA_Firmware': 2, 'HBA_Driver': 3},
+        [('PortSymb', 'xp_msa', 14, {'Device_Manufacturer': 2, 'Device_Model': 1, 'Device_Fw': 3}, []),
+        ('PortSymb', 'qlogic_emulex_port', 3, {'HBA_Manufacturer': 1}, []),
+        ('PortSymb', 'infinibox', 15, {'Device_Manufacturer': 2, 'Device_Model': 1}, [])]),
+    ('NodeSymb', 'emulex', 4, 
+        {'HBA_Manufacturer': 1, 'HBA_Model': 2, 'HBA_Firmware': 3, 
+        'HBA_Driver': lambda g: _nonempty(g[4]).str.rstrip('.'),
+        'Host_Name': lambda g: _host_name(g[5]).str.rstrip('.'),
+        'Host_OS': lambda g: _nonempty(g[6]).str.rstrip('.')}, []),
+    ('NodeSymb', 'qlogic_fcoe', 20, 
+        {'HBA_Manufacturer': 1, 'HBA_Model': 2, 'HBA_Driver': 3, 'HBA_Firmware': 4, 
+        'Host_Name': lambda g: g[5].str.rstrip('.')}, []),
+    ('NodeSymb', 'ag_switch', 25, {'Device_Name': 1, 'IP_Address': 2, 'Device_Fw': 3}, []),
+    ('NodeSymb', 'hpux', 6, {'Host_Name': lambda g: _host_name(g[1]), 'Host_OS': 2}, []),
+    ('NodeSymb', 'ultrium', 11, {'Device_Manufacturer': 2, 'Device_Model': 1, 'Device_SN': 4, 'Device_Fw': 3}, []),
+    ('NodeSymb', 'emc_vplex', 16, 
+        {'Device_Manufacturer': 1, 'Device_Model': lambda g: g[1] + ' ' + g[2], 'Device_SN': 3, 
+        'Device_Name': lambda g: g[1] + ' ' + g[2] + ' ' + g[3]},
+        [('PortSymb', 'emc_vplex', 16, {'Device_Port': 4}, [])]),
+    ('NodeSymb', 'huawei_manufacturer', 32, {'Device_Manufacturer': 1}, []),
+    ('NodeSymb', 'skip_symb', 35, {}, []),
+    ('PortSymb', 'qlogic_brocade', 27, 
+        {'HBA_Manufacturer': 2, 'HBA_Model': 1, 'HBA_Driver': 3, 'Host_Name': 4, 'Host_OS': 5}, []),
+    ('PortSymb', 'storeonce_port', 8, 
+        {'Device_Manufacturer': 2, 'Device_Model': 1, 'Device_SN': 3, 
+        'Device_Name': lambda g: g[1] + ' ' + _nonempty(g[3]), 'Device_Port': 4}, []),
+    ('NodeSymb', 'storeonce_node', 7, 
+        {'Device_Manufacturer': 2, 'Device_Model': 1, 'Device_SN': 3, 
+        'Device_Name': lambda g: g[1] + ' ' + _nonempty(g[3])}, []),
+    ('NodeSymb', 'data_domain', 23, {'Device_Model': 1}, []),
+    ('PortSymb', 'xp_msa', 14, {'Device_Manufacturer': 2, 'Device_Model': 1, 'Device_Fw': 3}, []),
+    ('PortSymb', 'eva', 13, {'Device_Model': 1, 'Device_Name': 2}, []),
+    ('PortSymb', 'library', 12, {'Device_Model': 1, 'Device_SN': 2, 'Device_Port': 3}, []),
     # qlogic_cna_match port_symb duplicate with cna_adapter_match node_symb 19
-    elif not pd.isnull(port_symb) and match_port_dct['qlogic_cna']:
-        match = match_port_dct['qlogic_cna']
-        series['HBA_Model'] = match.group(1)
-        series['HBA_Driver'] = match.group(2)
-        series['Device_Port'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 5
-    # clariion_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['clarion']:
-        match = match_port_dct['clarion']
-        series['Device_Manufacturer'] = 'EMC'
-        series['Device_Model'] = 'EMC ' + match.group(1)
-        series['Device_Port'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 17
-    # ibm_flash_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['ibm_flash']:
-        match = match_port_dct['ibm_flash']
-        series['Device_Manufacturer'] = match.group(2)
-        series['Device_Model'] = match.group(1)
-        series['Device_SN'] = match.group(3)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 22
+    ('PortSymb', 'qlogic_cna', 5, {'HBA_Model': 1, 'HBA_Driver': 2, 'Device_Port': 3}, []),
+    ('PortSymb', 'clarion', 17, 
+        {'Device_Manufacturer': lambda g: 'EMC', 'Device_Model': lambda g: 'EMC ' + g[1], 'Device_Port': 2}, []),
+    ('PortSymb', 'ibm_flash', 22, {'Device_Manufacturer': 2, 'Device_Model': 1, 'Device_SN': 3}, []),
     # qlogic_emulex_port_match port_symb when node_symb is empty
-    elif not pd.isnull(port_symb) and match_port_dct['qlogic_emulex_port']:
-        match = match_port_dct['qlogic_emulex_port']
-        series['HBA_Manufacturer'] = match.group(1)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 3
-    # dell_storage_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['dell_storage']:
-        match = match_port_dct['dell_storage']
-        series['Device_Model'] = 'Compellent ' + match.group(2)
-        series['Device_Name'] = match.group(3)
-        series['Device_Port'] = match.group(1)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 28
-    # symmetrix_storage_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['symmetrix_storage']:
-        match = match_port_dct['symmetrix_storage']
-        series['Device_Model'] = match.group(1)
-        # series['Device_Name'] = match.group(1)
-        series['Device_Port'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 33
-    # cisco_sw_match port_symb
-    elif not pd.isnull(port_symb) and match_port_dct['cisco_sw']:
-        match = match_port_dct['cisco_sw']
-        series['Device_Name'] = match.group(1)
-        series['Device_Port'] = match.group(2)
-        series['portSymbUsed'] = 'yes'
-        series['portSymbPattern'] = 34
+    ('PortSymb', 'qlogic_emulex_port', 3, {'HBA_Manufacturer': 1}, []),
+    ('PortSymb', 'dell_storage', 28, 
+        {'Device_Model': lambda g: 'Compellent ' + g[2], 'Device_Name': 3, 'Device_Port': 1}, []),
+    ('PortSymb', 'symmetrix_storage', 33, {'Device_Model': 1, 'Device_Port': 2}, []),
+    ('PortSymb', 'cisco_sw', 34, {'Device_Name': 1, 'Device_Port': 2}, [])
+    ]
+
+
+def _symb_split(nsshow_join_df, pattern_dct, nsshow_symb_columns):
+    """Function to extract  and HBA information from PortSymb, NodeSymb columns of the NameServer DataFrame.
+    Each pattern is applied once to the unique values of the symb column, 
+    rules precedence is resolved with masks of rows which are not split up yet"""
+
+    symb_split_df = pd.DataFrame(index=nsshow_join_df.index, columns=nsshow_symb_columns, dtype='object')
+    # extracted groups for each (symb column, pattern name)
+    symb_groups_dct = {}
+
+    def apply_rules(rules_lst, mask_free):
+        """Function applies first matched rule from rules_lst to rows in mask_free.
+        Returns mask of rows which are not matched by any rule"""
+
+        for symb_column, pattern_name, pattern_number, split_dct, nested_rules_lst in rules_lst:
+            if not (symb_column, pattern_name) in symb_groups_dct:
+                symb_groups_dct[(symb_column, pattern_name)] = \
+                    _symb_extract(nsshow_join_df[symb_column], pattern_dct[pattern_name])
+            groups_df = symb_groups_dct[(symb_column, pattern_name)]
+            mask_rule = mask_free & groups_df['matched']
+            if not mask_rule.any():
+                continue
+            groups_df = groups_df.loc[mask_rule]
+            for split_column, group in split_dct.items():
+                symb_split_df.loc[mask_rule, split_column] = \
+                    groups_df[group] if isinstance(group, int) else group(groups_df)
+            symb_used_column = 'portSymbUsed' if symb_column == 'PortSymb' else 'nodeSymbUsed'
+            symb_split_df.loc[mask_rule, [symb_used_column, symb_used_column.replace('Used', 'Pattern')]] = \
+                ['yes', pattern_number]
+            apply_rules(nested_rules_lst, mask_rule)
+            mask_free = mask_free & ~mask_rule
+        return mask_free
+
+    mask_unsplit = apply_rules(SYMB_SPLIT_RULES, pd.Series(True, index=nsshow_join_df.index))
     # if no match was found copy values with no split
-    else:
-        if not pd.isnull(node_symb) and pd.isnull(series['nodeSymbUsed']):
-            series['Device_Name'] = series['NodeSymb']
-        if not pd.isnull(port_symb) and pd.isnull(series['portSymbUsed']):
-            series['Device_Port'] = series['PortSymb']
+    for split_column, symb_column in [('Device_Name', 'NodeSymb'), ('Device_Port', 'PortSymb')]:
+        mask_copy = mask_unsplit & nsshow_join_df[symb_column].notna()
+        symb_split_df.loc[mask_copy, split_column] = nsshow_join_df.loc[mask_copy, symb_column]
+    return symb_split_df.infer_objects()
+
+
+def _symb_extract(symb_sr, pattern):
+    """Function matches pattern with each unique value of symb_sr.
+    Returns DataFrame with match groups (numbered from 1 as in re.Match.group) 
+    and 'matched' column for each symb_sr row"""
 
-    return pd.Series([series[column] for column in nsshow_symb_columns])
+    # pattern is matched from the beginning of the string as re.match does
+    # empty trailing group shows if pattern is matched
+    match_pattern = re.compile(r'\A(?:' + pattern.pattern + r')()', pattern.flags)
+    symb_unique_sr = pd.Series(symb_sr.dropna().unique(), dtype='object')
+    groups_df = symb_unique_sr.str.extract(match_pattern, expand=True)
+    groups_df.columns = [*range(1, pattern.groups + 1), 'matched']
+    groups_df.index = symb_unique_sr
+    # groups for each symb_sr row
+    groups_df = groups_df.reindex(symb_sr)
+    groups_df['matched'] = groups_df['matched'].notna()
+    groups_df.index = symb_sr.index
+    return groups_df
@@ -84,8 +84,8 @@ def portshow_aggregated(portshow_df, switchshow_ports_df, switch_params_df, swit
     # define oui for each connected device to identify device type
     switches_oui = switch_params_aggregated_df['switchWwn'].str.slice(start = 6)
     # final device type define
-    portshow_aggregated_df[['deviceType', 'deviceSubtype']] = portshow_aggregated_df.apply(
-        lambda series: type_check(series, switches_oui, blade_servers_df, synergy_servers_df), axis = 1)
+    portshow_aggregated_df[['deviceType', 'deviceSubtype']] = \
+        type_check(portshow_aggregated_df, switches_oui, blade_servers_df, synergy_servers_df)
     # identify MSA port numbers (A1-A4, B1-B4) based on PortWwn
     portshow_aggregated_df.Device_Port = \
         portshow_aggregated_df.apply(lambda series: find_msa_port(series) \
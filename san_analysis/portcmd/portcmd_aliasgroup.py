@@ -5,6 +5,8 @@ Auxiliary to analysis_portcmd module.
 """
 
 
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 
@@ -177,8 +179,10 @@ def alias_serial_group(portshow_aggregated_df):
     return lib_sn_group_df
 
 
+@lru_cache(maxsize=None)
 def find_grp_name(aliases):
-    """Function to find find longest common string in the set of strings"""
+    """Function to find find longest common string in the set of strings.
+    Result is cached since the same aliases set is repeated for different wwnn groups"""
     
     aliases = aliases.split(', ')
     if len(aliases) == 1:
@@ -191,36 +195,80 @@ def find_grp_name(aliases):
 
 
 def get_longest_common_subseq(data):
-    """Auxiliary function for find_grp_name function"""
-    
-    substr = []
-    if len(data) > 1 and len(data[0]) > 0:
-        for i in range(len(data[0])):
-            for j in range(len(data[0])-i+1):
-                if j > len(substr) and is_subseq_of_any(data[0][i:i+j], data):
-                    substr = data[0][i:i+j]
-    return substr
-
-def is_subseq_of_any(find, data):
-    """Auxiliary function for get_longest_common_subseq function"""
-
-    if len(data) < 1 and len(find) < 1:
-        return False
-    for i in range(len(data)):
-        if not is_subseq(find, data[i]):
-            return False
-    return True
-
-# Will also return True if possible_subseq == seq.
-def is_subseq(possible_subseq, seq):
-    """Auxiliary function for is_subseq_of_any function"""
+    """Auxiliary function for find_grp_name function.
+    Returns longest common substring of all strings in data 
+    (the leftmost one in the first string if there are several). 
+    Suffix automaton of the first string is built and each other string is run through it 
+    to find the longest match ending in each automaton state"""
     
-    if len(possible_subseq) > len(seq):
-        return False
-    def get_length_n_slices(n):
-        for i in range(len(seq) + 1 - n):
-            yield seq[i:i+n]
-    for slyce in get_length_n_slices(len(possible_subseq)):
-        if slyce == possible_subseq:
-            return True
-    return False
+    if len(data) < 2 or not data[0]:
+        return ''
+    length_lst, link_lst, next_lst, firstpos_lst = build_suffix_automaton(data[0])
+    # states sorted by descending length to pass match length from state to its suffix link
+    states_desc = sorted(range(1, len(length_lst)), key=length_lst.__getitem__, reverse=True)
+    # longest substring ending in each state which is common for all strings
+    common_lst = length_lst.copy()
+
+    for seq in data[1:]:
+        match_lst = [0] * len(length_lst)
+        state, match = 0, 0
+        for char in seq:
+            while state and char not in next_lst[state]:
+                state = link_lst[state]
+                match = length_lst[state]
+            if char in next_lst[state]:
+                state = next_lst[state][char]
+                match += 1
+            else:
+                state, match = 0, 0
+            if match > match_lst[state]:
+                match_lst[state] = match
+        for state in states_desc:
+            link = link_lst[state]
+            if match_lst[state] and match_lst[link] < length_lst[link]:
+                match_lst[link] = min(max(match_lst[link], match_lst[state]), length_lst[link])
+        common_lst = [min(common, match) for common, match in zip(common_lst, match_lst)]
+
+    # longest common substring with leftmost occurence in the first string
+    substr_length, substr_end = 0, 0
+    for state in range(1, len(length_lst)):
+        if common_lst[state] > substr_length or \
+            (common_lst[state] == substr_length and substr_length and firstpos_lst[state] < substr_end):
+            substr_length, substr_end = common_lst[state], firstpos_lst[state]
+    return data[0][substr_end - substr_length + 1: substr_end + 1]
+
+
+def build_suffix_automaton(seq):
+    """Auxiliary function for get_longest_common_subseq function.
+    Returns suffix automaton states lists: longest substring length, suffix link, 
+    transitions and end position of the first substring occurence in seq"""
+
+    length_lst, link_lst, next_lst, firstpos_lst = [0], [-1], [{}], [-1]
+    last = 0
+    for pos, char in enumerate(seq):
+        cur = len(length_lst)
+        length_lst.append(length_lst[last] + 1)
+        link_lst.append(0)
+        next_lst.append({})
+        firstpos_lst.append(pos)
+        state = last
+        while state != -1 and char not in next_lst[state]:
+            next_lst[state][char] = cur
+            state = link_lst[state]
+        if state != -1:
+            next_state = next_lst[state][char]
+            if length_lst[state] + 1 == length_lst[next_state]:
+                link_lst[cur] = next_state
+            else:
+                clone = len(length_lst)
+                length_lst.append(length_lst[state] + 1)
+                link_lst.append(link_lst[next_state])
+                next_lst.append(next_lst[next_state].copy())
+                firstpos_lst.append(firstpos_lst[next_state])
+                while state != -1 and next_lst[state].get(char) == next_state:
+                    next_lst[state][char] = clone
+                    state = link_lst[state]
+                link_lst[next_state] = clone
+                link_lst[cur] = clone
+        last = cur
+    return length_lst, link_lst, next_lst, firstpos_lst
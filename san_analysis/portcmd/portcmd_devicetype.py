@@ -27,128 +27,116 @@ def oui_join(portshow_aggregated_df, oui_df, switchshow_ports_df):
     return portshow_aggregated_df
 
 
-def type_check(series, switches_oui, blade_servers_df, synergy_servers_df):
-    """Function to define device class and type"""
+def type_check(portshow_aggregated_df, switches_oui, blade_servers_df, synergy_servers_df):
+    """Function to define device class and type for all ports at once.
+    Rules are checked in priority order, first matched rule defines deviceType and deviceSubtype.
+    Returns DataFrame with 'deviceType', 'deviceSubtype' columns"""
     
     if synergy_servers_df.empty:
         synergy_servers_df['Connected_portWwn'] = np.nan
 
-    # drop rows with empty WWNp values
-    blade_hba_df = blade_servers_df.dropna(subset = ['portWwn']).copy()
-    synergy_hba_df = synergy_servers_df.dropna(subset = ['Connected_portWwn']).copy()
+    # WWNp sets of blade and synergy hba and oui of switches (empty values dropped)
+    blade_hba_wwn_set = set(blade_servers_df['portWwn'].dropna())
+    synergy_hba_wwn_set = set(synergy_servers_df['Connected_portWwn'].dropna())
+    switches_oui_set = set(switches_oui.dropna())
 
-    if series[['type', 'subtype']].notnull().all():
-        # servers type
-        # if WWNp in blade hba DataFrame
-        # if (blade_hba_df['portWwn'] == series['Connected_portWwn']).any():
-        #     return pd.Series(('BLADE_SRV', series['subtype'].split('|')[0]))
-        # elif (synergy_hba_df['Connected_portWwn'] == series['Connected_portWwn']).any():
-        #     return pd.Series(('SYNERGY_SRV', series['subtype'].split('|')[0]))
-        if (series['Connected_portWwn_switchshow_filled'] == blade_hba_df['portWwn']).any():
-            return pd.Series(('SRV_BLADE', series['subtype'].split('|')[0]))
-        elif (series['Connected_portWwn_switchshow_filled'] == synergy_hba_df['Connected_portWwn']).any():
-            return pd.Series(('SRV_SYNERGY', series['subtype'].split('|')[0]))
+    df = portshow_aggregated_df
+    # columns with empty values only are converted to object to apply string methods
+    wwnp = df['Connected_portWwn_switchshow_filled'].astype('object')
+    device_type = df['type'].astype('object')
+    device_subtype = df['subtype'].astype('object')
+    subtype_lst = device_subtype.str.split('|')
+    subtype_first, subtype_second, subtype_third = [subtype_lst.str[i] for i in range(3)]
+    type_second = device_type.str.split('|').str[1]
+    
+    def contains(column, pattern, lower=False):
+        """Function returns mask of column values containing pattern (empty values are not matched)"""
+        column_sr = df[column].astype('object')
+        column_sr = column_sr.str.lower() if lower else column_sr
+        return column_sr.str.contains(pattern, regex=False, na=False).astype(bool)
+    
+    mask_initiator = df['Device_type'].isin(['Physical Initiator', 'NPIV Initiator'])
+    mask_unknown_device = df['Device_type'] == 'Physical Unknown(initiator/target)'
+    mask_ag_link = (df['switchMode'] == 'Access Gateway Mode') & (df['portType'] == 'N-Port')
+    mask_online = df['portState'] == 'Online'
+    # type and subtype are defined by oui
+    mask_oui = df[['type', 'subtype']].notnull().all(axis=1)
+    mask_srv_switch = mask_oui & contains('type', 'SRV|SWITCH')
+    mask_storage_switch = mask_oui & ~mask_srv_switch & contains('type', 'STORAGE|SWITCH')
+    # STORAGE|SWITCH devices not matched by own rules are checked as not strictly detected devices
+    mask_oui_rest = mask_oui & ~mask_storage_switch
+    mask_storage_lib = mask_oui_rest & (device_type == 'STORAGE|LIB')
+    mask_srv_lib = mask_oui_rest & (device_type == 'SRV|LIB')
+    mask_srv_storage = mask_oui_rest & (device_type == 'SRV|STORAGE')
+    mask_srv_storage_lib = mask_oui_rest & (device_type == 'SRV|STORAGE|LIB')
+    # device type is not strictly detected
+    mask_undefined = df[['deviceType', 'deviceSubtype']].isna().any(axis=1)
 
+    # (rule mask, deviceType, deviceSubtype) in priority order
+    type_rules_lst = [
+        # servers type (WWNp in blade or synergy hba DataFrame)
+        (mask_oui & wwnp.isin(blade_hba_wwn_set), 'SRV_BLADE', subtype_first),
+        (mask_oui & wwnp.isin(synergy_hba_wwn_set), 'SRV_SYNERGY', subtype_first),
         # devices with strictly defined type and subtype
-        elif not '|' in series['type'] and not '|' in  series['subtype']:
-            return pd.Series((series.type, series.subtype))
+        (mask_oui & ~contains('type', '|') & ~contains('subtype', '|'), device_type, device_subtype),
         # check SWITCH TYPE
-        elif 'SRV|SWITCH' in series['type']:
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series.subtype))
-            elif series['portType'] in ['E-Port', 'EX-Port']:
-                return pd.Series(('SWITCH', series.subtype))
-            elif (series['Connected_portWwn_switchshow_filled'][6:] == switches_oui).any():
-                return pd.Series(('SWITCH', series.subtype))
-            elif series['switchMode'] == 'Access Gateway Mode' and series['portType'] == 'N-Port':
-                return pd.Series(('SWITCH', 'AG'))
-            elif pd.notna(series['HBA_Manufacturer']) and 'AG Brocade' in series['HBA_Manufacturer']:
-                return pd.Series(('SWITCH', series.subtype))
-            elif series['Device_type'] == "Physical Unknown(initiator/target)":
-                return pd.Series(('SWITCH', series.subtype))
-            # when device behind NPIV port
-            elif series['Connected_portId'][4:5] != '00':
-                return pd.Series(('SRV', series.subtype))
-            else:
-                return pd.Series(('SRV', series.subtype))
-
-        elif 'STORAGE|SWITCH' in series['type']:
-            if series['Device_type'] == 'Physical Unknown(initiator/target)':
-                return pd.Series(('SWITCH', series.subtype))
-            elif series['Device_type'] == 'Physical Initiator+Target':
-                return pd.Series(('STORAGE', series.subtype))           
-
+        (mask_srv_switch & mask_initiator, 'SRV', device_subtype),
+        (mask_srv_switch & df['portType'].isin(['E-Port', 'EX-Port']), 'SWITCH', device_subtype),
+        (mask_srv_switch & wwnp.str.slice(start=6).isin(switches_oui_set), 'SWITCH', device_subtype),
+        (mask_srv_switch & mask_ag_link, 'SWITCH', 'AG'),
+        (mask_srv_switch & contains('HBA_Manufacturer', 'AG Brocade'), 'SWITCH', device_subtype),
+        (mask_srv_switch & mask_unknown_device, 'SWITCH', device_subtype),
+        # device behind NPIV port or not
+        (mask_srv_switch, 'SRV', device_subtype),
+        (mask_storage_switch & mask_unknown_device, 'SWITCH', device_subtype),
+        (mask_storage_switch & (df['Device_type'] == 'Physical Initiator+Target'), 'STORAGE', device_subtype),
         # check StoreOnce and D2D devices
-        elif pd.notna(series.Device_Model) and 'storeonce' in series['Device_Model'].lower():
-            return pd.Series(('LIB', 'StoreOnce'))
-        elif pd.notna(series.Device_Model) and 'd2d' in series['Device_Model'].lower():
-            return pd.Series(('LIB', 'D2D'))
-
+        (mask_oui_rest & contains('Device_Model', 'storeonce', lower=True), 'LIB', 'StoreOnce'),
+        (mask_oui_rest & contains('Device_Model', 'd2d', lower=True), 'LIB', 'D2D'),
         # if not d2d than it's storage
-        elif series['type'] == 'STORAGE|LIB':
-            if pd.notna(series.Device_Model) and 'ultrium' in series['Device_Model'].lower():
-                return pd.Series(('LIB', series['subtype'].split('|')[1]))
-            else:
-                return pd.Series(('STORAGE', series['subtype'].split('|')[0]))
-        
+        (mask_storage_lib & contains('Device_Model', 'ultrium', lower=True), 'LIB', subtype_second),
+        (mask_storage_lib, 'STORAGE', subtype_first),
         # check if device server or library
-        elif series['type'] == 'SRV|LIB': 
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            elif series['Device_type'] in ['Physical Target', 'NPIV Target']:
-                return pd.Series(('LIB', series['subtype'].split('|')[1]))
-            # if Device_type is empty (No Physical target or Initator) and no Device_Model 
-            # and Device serial number then it's SRV
-            elif pd.isna(series[['Device_Model', 'Device_SN']]).all() and 'Unknown' in series['Device_type']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
+        (mask_srv_lib & mask_initiator, 'SRV', subtype_first),
+        (mask_srv_lib & df['Device_type'].isin(['Physical Target', 'NPIV Target']), 'LIB', subtype_second),
+        # if Device_type is empty (No Physical target or Initator) and no Device_Model 
+        # and Device serial number then it's SRV
+        (mask_srv_lib & df[['Device_Model', 'Device_SN']].isna().all(axis=1) & contains('Device_type', 'Unknown'), 
+            'SRV', subtype_first),
         # check if device server or storage
-        elif series['type'] == 'SRV|STORAGE':
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            elif pd.notna(series.HBA_Manufacturer) and 'qlogic' in series['HBA_Manufacturer'].lower():
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            else:
-                return pd.Series(('STORAGE', series['subtype'].split('|')[1]))
-            
-        elif series['type'] == 'SRV|STORAGE|LIB':
-            if series['Device_type'] in ['Physical Initiator', 'NPIV Initiator']:
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            # if ultrium type
-            elif not pd.isna(series['NodeSymb']) and 'ultrium' in series['NodeSymb'].lower():
-                return pd.Series(('LIB', series['subtype'].split('|')[2]))
-            # if host and hba info present
-            elif series[['HBA_Manufacturer', 'HBA_Model', 'Host_OS', 'HBA_Firmware', 'HBA_Driver']].notnull().all():
-                return pd.Series(('SRV', series['subtype'].split('|')[0]))
-            # if not initiator and not target ultrium than it's storage
-            else:
-                device_type = series['type'].split('|')[1]
-                device_subtype = series['subtype'].split('|')[1]
-                return pd.Series((device_type, device_subtype))
-
-    # if device type is not strictly detected
-    if pd.isna(series[['deviceType', 'deviceSubtype']]).any():
+        (mask_srv_storage & mask_initiator, 'SRV', subtype_first),
+        (mask_srv_storage & contains('HBA_Manufacturer', 'qlogic', lower=True), 'SRV', subtype_first),
+        (mask_srv_storage, 'STORAGE', subtype_second),
+        (mask_srv_storage_lib & mask_initiator, 'SRV', subtype_first),
+        # if ultrium type
+        (mask_srv_storage_lib & contains('NodeSymb', 'ultrium', lower=True), 'LIB', subtype_third),
+        # if host and hba info present
+        (mask_srv_storage_lib & df[['HBA_Manufacturer', 'HBA_Model', 'Host_OS', 'HBA_Firmware', 'HBA_Driver']].notnull().all(axis=1), 
+            'SRV', subtype_first),
+        # if not initiator and not target ultrium than it's storage
+        (mask_srv_storage_lib, type_second, subtype_second),
+        # if device type is not strictly detected
         # Connected_WWNp is not empty and device type and subtype defined
-        if series[['type', 'subtype']].notnull().all():                                
-            return pd.Series((series['type'], series['subtype']))
+        (mask_undefined & mask_oui, device_type, device_subtype),
         # Connected_WWNp is empty and no device type and subtype
-        else:
-            # define link from AG to Native switch
-            if pd.notna(series[['switchMode', 'portType']]).all() and \
-                series[['switchMode', 'portType']].equals(pd.Series({'switchMode': 'Access Gateway Mode', 'portType': 'N-Port'})):
-                return pd.Series(('SWITCH', 'SWITCH'))
-            # define ISL link
-            elif pd.notna(series[['portState', 'portType']]).all() and \
-                ('E-Port' in series['portType'] or 'EX-Port' in series['portType']):
-                return pd.Series(('SWITCH', 'SWITCH'))
-            # slave F-Port trunk ports have Online status but devices are on master port
-            elif pd.isna(series.Connected_portWwn_switchshow_filled) and series['portState'] == 'Online' \
-                and pd.notna(series['portScn_details']) and 'Trunk port' in series['portScn_details']:
-                return pd.Series((np.nan, np.nan))
-            # when device_type is not defined, oui is not founded, 
-            # and link is not slave AG or ISL but port is Online then device class is UNKNOWN
-            elif series['portState'] == 'Online' and series['portType'] != 'D-Port':
-                return pd.Series(('UNKNOWN', 'UNKNOWN'))
-            else:
-                return pd.Series((np.nan, np.nan))
-    else:
-        return pd.Series((series['deviceType'], series['deviceSubtype']))
+        # define link from AG to Native switch
+        (mask_undefined & mask_ag_link, 'SWITCH', 'SWITCH'),
+        # define ISL link
+        (mask_undefined & df['portState'].notna() & (contains('portType', 'E-Port') | contains('portType', 'EX-Port')), 
+            'SWITCH', 'SWITCH'),
+        # slave F-Port trunk ports have Online status but devices are on master port
+        (mask_undefined & wwnp.isna() & mask_online & contains('portScn_details', 'Trunk port'), np.nan, np.nan),
+        # when device_type is not defined, oui is not founded, 
+        # and link is not slave AG or ISL but port is Online then device class is UNKNOWN
+        (mask_undefined & mask_online & (df['portType'] != 'D-Port'), 'UNKNOWN', 'UNKNOWN'),
+        (mask_undefined, np.nan, np.nan)
+        ]
+
+    mask_lst = [mask.to_numpy() for mask, *_ in type_rules_lst]
+    device_type_df = pd.DataFrame(index=df.index)
+    # device with strictly detected type keeps preliminarily assigned type
+    for i, column in enumerate(['deviceType', 'deviceSubtype'], start=1):
+        choice_lst = [np.full(len(df), rule[i], dtype=object) if not isinstance(rule[i], pd.Series) 
+                        else rule[i].to_numpy(dtype=object) for rule in type_rules_lst]
+        device_type_df[column] = np.select(mask_lst, choice_lst, default=df[column].to_numpy(dtype=object))
+    return device_type_df
@@ -1,5 +1,10 @@
 """Main module to analysis extracted configuration files"""
 
+import utilities.dataframe_operations as dfop
+import utilities.registry_operations as rgop
+from san_automation_constants import PORTSHOW_ARROW_STRINGS
+
+from .analysis_scheduler import run_analysis_stages
 from .fabric_label import fabric_label_analysis
 from .blade_system import blade_system_analysis
 from .switch_params import switch_params_analysis, switch_params_sw_pair_update
@@ -12,83 +17,127 @@ from .zoning import zoning_analysis
 from .storage_host import storage_host_analysis
 from .sensor import sensor_analysis
 from .port_statistics import port_statistics_analysis
-from .port_err_sfp_cfg import port_err_sfp_cfg_analysis
 from .errdump import errdump_analysis
 from .switch_pair import switch_pair_analysis
 from .fcr_xd_proxy_devices import fcr_xd_device_analysis
 
 
-def system_configuration_analysis(extracted_configuration_lst, project_constants_lst):
+# names of the analyzed data returned by san_analysis package
+ANALYZED_DATA_NAMES = ['switch_params_aggregated_df', 'switch_pair_df', 
+                        'isl_aggregated_df', 'isl_statistics_df', 'npiv_statistics_df', 
+                        'portshow_aggregated_df', 'npv_ag_connected_devices_df', 'fcr_xd_proxydev_df']
+# portshow_aggregated_df columns used by the next stages to merge and group data only
+PORTSHOW_KEY_COLUMNS = ['Fabric_name', 'Fabric_label', 'switchName', 'switchWwn', 
+                        'Connected_portWwn', 'NodeName', 'PortName']
+
+
+def system_configuration_analysis(extracted_data_registry, project_constants_lst):
     """Main function of san_analysis package. Performs analysis of extracted configuration data, 
-    save data to database and report file"""
-
-    chassis_params_df, slot_status_df, licenseport_df, chassisshow_df, \
-        maps_params_df, switch_params_df, switchshow_ports_df,\
-            fabricshow_df, ag_principal_df, \
-                portshow_df, sfpshow_df, portcfgshow_df,\
-                    fdmi_df, nsshow_df, nscamshow_df, nsshow_dedicated_df, nsportshow_df, \
-                        isl_df, trunk_df, porttrunkarea_df, lsdb_df,\
-                            fcrfabric_df, fcrproxydev_df, fcrphydev_df, lsan_df, fcredge_df, fcrresource_df, fcrxlateconfig_df, \
-                                cfg_df, zone_df, alias_df, cfg_effective_df, zone_effective_df, peerzone_df, peerzone_effective_df,\
-                                    sensor_df, errdump_df,\
-                                        blade_module_df, blade_servers_df, blade_vc_df,\
-                                            synergy_module_df, synergy_servers_df,\
-                                                system_3par_df, port_3par_df, host_3par_df, \
-                                                    system_oceanstor_df, port_oceanstor_df, host_oceanstor_df,\
-                                                        host_id_name_oceanstor_df, host_id_fcinitiator_oceanstor_df, hostid_ctrlportid_oceanstor_df \
-                                                            = extracted_configuration_lst
-    # set fabric names and labels
-    fabricshow_ag_labels_df = \
-        fabric_label_analysis(switchshow_ports_df, switch_params_df, fabricshow_df, ag_principal_df, project_constants_lst)
-    blade_module_loc_df = blade_system_analysis(blade_module_df, synergy_module_df, project_constants_lst)
-    report_columns_usage_sr, switch_params_aggregated_df, fabric_clean_df = \
-            switch_params_analysis(fabricshow_ag_labels_df, chassis_params_df, chassisshow_df, 
-                                   switch_params_df, maps_params_df, blade_module_loc_df, ag_principal_df, project_constants_lst)
+    save data to database and report file. Analysis stages are run in order of their dependencies
+    (independent stages are run concurrently if ANALYSIS_WORKERS is more than one).
+    Extracted data is requested by name from extracted_data_registry"""
+
+    analyzed_configuration_lst = \
+        run_analysis_stages(get_analysis_stages(), extracted_data_registry, ANALYZED_DATA_NAMES, project_constants_lst)
+    # extracted data not used by analysis stages
+    rgop.release_data(extracted_data_registry, *extracted_data_registry['data'])
+    return analyzed_configuration_lst
+
+
+def get_analysis_stages():
+    """Function returns list of san_analysis stages (see analysis_scheduler module).
+    Stages are listed in the order they are run one by one"""
+
+    return [
+        # set fabric names and labels
+        create_stage('fabric_label', fabric_label_analysis, 
+                     ['switchshow_ports_df', 'switch_params_df', 'fabricshow_df', 'ag_principal_df'], 
+                     ['fabricshow_ag_labels_df'], interactive=True),
+        create_stage('blade_system', blade_system_analysis, 
+                     ['blade_module_df', 'synergy_module_df'], 
+                     ['blade_module_loc_df']),
+        create_stage('switch_params', switch_params_stage, 
+                     ['fabricshow_ag_labels_df', 'chassis_params_df', 'chassisshow_df', 'switch_params_df', 
+                      'maps_params_df', 'blade_module_loc_df', 'ag_principal_df'], 
+                     ['report_columns_usage_sr', 'switch_params_aggregated_df', 'fabric_clean_df']),
+        create_stage('isl', isl_analysis, 
+                     ['fabricshow_ag_labels_df', 'switch_params_aggregated_df', 'isl_df', 'trunk_df', 'lsdb_df', 
+                      'fcredge_df', 'portshow_df', 'sfpshow_df', 'portcfgshow_df', 'switchshow_ports_df'], 
+                     ['isl_aggregated_df', 'fcredge_aggregated_df']),
+        create_stage('portcmd', portcmd_stage, 
+                     ['portshow_df', 'switchshow_ports_df', 'switch_params_df', 'switch_params_aggregated_df', 'isl_aggregated_df', 
+                      'nsshow_df', 'nscamshow_df', 'nsshow_dedicated_df', 'nsportshow_df', 
+                      'ag_principal_df', 'porttrunkarea_df', 'alias_df', 'fdmi_df', 'blade_module_df', 
+                      'blade_servers_df', 'blade_vc_df', 'synergy_module_df', 'synergy_servers_df', 
+                      'system_3par_df', 'port_3par_df', 'system_oceanstor_df', 'port_oceanstor_df'], 
+                     ['portshow_aggregated_df'], interactive=True),
+        create_stage('fcr_xd', fcr_xd_device_analysis, 
+                     ['switch_params_aggregated_df', 'portshow_aggregated_df', 'fcrproxydev_df', 'fcrxlateconfig_df'], 
+                     ['fcr_xd_proxydev_df'], io_name='fcr_proxydevice_analysis'),
+        create_stage('port_statistics', port_statistics_analysis, 
+                     ['licenseport_df', 'portshow_aggregated_df', 'switch_params_aggregated_df'], 
+                     ['fabric_port_statistics_df']),
+        create_stage('switch_pair', switch_pair_analysis, 
+                     ['switch_params_aggregated_df', 'portshow_aggregated_df', 'fcr_xd_proxydev_df'], 
+                     ['switch_pair_df', 'npv_ag_connected_devices_df'], interactive=True),
+        create_stage('switch_params_sw_pair', switch_params_sw_pair_update, 
+                     ['switch_params_aggregated_df', 'switch_pair_df'], 
+                     ['switch_params_aggregated_df']),
+        create_stage('isl_sw_pair', isl_sw_pair_update, 
+                     ['isl_aggregated_df', 'fcredge_aggregated_df', 'switch_pair_df'], 
+                     ['isl_aggregated_df', 'isl_statistics_df']),
+        create_stage('port_err_sfp_cfg', port_err_sfp_cfg_analysis, 
+                     ['portshow_aggregated_df', 'sfpshow_df', 'portcfgshow_df'], 
+                     ['portshow_sfp_aggregated_df'], interactive=True),
+        create_stage('maps_npiv', maps_npiv_ports_analysis, 
+                     ['portshow_sfp_aggregated_df', 'switch_params_aggregated_df', 
+                      'isl_statistics_df', 'blade_module_loc_df', 'switch_pair_df'], 
+                     ['portshow_npiv_df', 'npiv_statistics_df'], io_name='maps_npiv_ports_analysis'),
+        create_stage('zoning', zoning_analysis, 
+                     ['switch_params_aggregated_df', 'portshow_aggregated_df', 'cfg_df', 'zone_df', 'alias_df', 
+                      'cfg_effective_df', 'fcrfabric_df', 'lsan_df', 'peerzone_df'], 
+                     ['zoning_aggregated_df', 'alias_aggregated_df', 'portshow_zoned_aggregated_df']),
+        create_stage('storage_host', storage_host_analysis, 
+                     ['host_3par_df', 'system_3par_df', 'port_3par_df',
+                      'system_oceanstor_df', 'port_oceanstor_df', 'host_oceanstor_df', 
+                      'host_id_name_oceanstor_df', 'host_id_fcinitiator_oceanstor_df', 
+                      'hostid_ctrlportid_oceanstor_df',
+                      'portshow_aggregated_df', 'zoning_aggregated_df'], 
+                     ['storage_host_aggregated_df']),
+        create_stage('sensor', sensor_analysis, 
+                     ['sensor_df', 'switch_params_aggregated_df'], 
+                     ['sensor_aggregated_df']),
+        create_stage('errdump', errdump_analysis, 
+                     ['errdump_df', 'switchshow_ports_df', 'switch_params_aggregated_df', 'portshow_aggregated_df'], 
+                     ['errdump_aggregated_df', 'raslog_counter_df'], io_name='errorlog_analysis'),
+        ]
+
+
+def create_stage(name, function, args, returns, io_name=None, interactive=False):
+    """Function returns san_analysis stage dictionary. 
+    io_name is stage name in the in_out_data_names table ('<name>_analysis' by default)"""
+
+    return {'name': name, 'function': function, 'args': args, 'returns': returns, 
+            'io_name': io_name or name + '_analysis', 'interactive': interactive}
+
+
+def switch_params_stage(*args):
+    """Function performs switch parameters analysis and adds report_columns_usage_sr 
+    to the project_constants_lst (used by the next stages)"""
+
+    *_, project_constants_lst = args
+    report_columns_usage_sr, switch_params_aggregated_df, fabric_clean_df = switch_params_analysis(*args)
 
     if len(project_constants_lst) == 5:
         project_constants_lst.append(report_columns_usage_sr)
+    return report_columns_usage_sr, switch_params_aggregated_df, fabric_clean_df
+
+
+def portcmd_stage(*args):
+    """Function performs ports and connected devices analysis. PORTSHOW_KEY_COLUMNS of the
+    portshow_aggregated_df passed to the next stages are converted to Arrow strings"""
 
-    isl_aggregated_df, fcredge_aggregated_df = \
-        isl_analysis(fabricshow_ag_labels_df, switch_params_aggregated_df, isl_df, trunk_df, lsdb_df, 
-                            fcredge_df, portshow_df, sfpshow_df, portcfgshow_df, switchshow_ports_df, project_constants_lst)
-    
-    portshow_aggregated_df = \
-        portcmd_analysis(portshow_df, switchshow_ports_df, switch_params_df, switch_params_aggregated_df, isl_aggregated_df, 
-                                nsshow_df, nscamshow_df, nsshow_dedicated_df, nsportshow_df, 
-                                ag_principal_df, porttrunkarea_df, alias_df, fdmi_df, blade_module_df, 
-                                blade_servers_df, blade_vc_df, synergy_module_df, synergy_servers_df, 
-                                system_3par_df, port_3par_df, system_oceanstor_df, port_oceanstor_df, 
-                                project_constants_lst)
-    fcr_xd_proxydev_df = fcr_xd_device_analysis(switch_params_aggregated_df, portshow_aggregated_df, 
-                                                fcrproxydev_df, fcrxlateconfig_df, project_constants_lst)
-    fabric_port_statistics_df = port_statistics_analysis(licenseport_df, portshow_aggregated_df, switch_params_aggregated_df, project_constants_lst)
-
-    switch_pair_df, npv_ag_connected_devices_df = switch_pair_analysis(switch_params_aggregated_df, portshow_aggregated_df, fcr_xd_proxydev_df, project_constants_lst)
-
-    switch_params_aggregated_df = switch_params_sw_pair_update(switch_params_aggregated_df, switch_pair_df, project_constants_lst)
-
-    isl_aggregated_df, isl_statistics_df = isl_sw_pair_update(isl_aggregated_df, fcredge_aggregated_df, switch_pair_df, project_constants_lst)
-
-    portshow_sfp_aggregated_df =  port_err_sfp_cfg_analysis(portshow_aggregated_df, sfpshow_df, portcfgshow_df, project_constants_lst)
-
-    portshow_npiv_df, npiv_statistics_df = maps_npiv_ports_analysis(portshow_sfp_aggregated_df, switch_params_aggregated_df, 
-                                                isl_statistics_df, blade_module_loc_df, switch_pair_df, project_constants_lst)
-    
-    zoning_aggregated_df, alias_aggregated_df, portshow_zoned_aggregated_df = \
-        zoning_analysis(switch_params_aggregated_df, portshow_aggregated_df, cfg_df, zone_df, alias_df, 
-                            cfg_effective_df, fcrfabric_df, lsan_df, peerzone_df, project_constants_lst)
-    
-    storage_host_aggregated_df = storage_host_analysis(host_3par_df, system_3par_df, port_3par_df,
-                                                    system_oceanstor_df, port_oceanstor_df, host_oceanstor_df, 
-                                                    host_id_name_oceanstor_df, host_id_fcinitiator_oceanstor_df, 
-                                                    hostid_ctrlportid_oceanstor_df,
-                                                    portshow_aggregated_df, zoning_aggregated_df, 
-                                                    project_constants_lst)
-    sensor_aggregated_df = sensor_analysis(sensor_df, switch_params_aggregated_df, project_constants_lst)
-
-    errdump_aggregated_df, raslog_counter_df = \
-        errdump_analysis(errdump_df, switchshow_ports_df, switch_params_aggregated_df, portshow_aggregated_df, project_constants_lst)
-    analyzed_configuration_lst = [switch_params_aggregated_df, switch_pair_df, 
-                                    isl_aggregated_df, isl_statistics_df, npiv_statistics_df, 
-                                    portshow_aggregated_df, npv_ag_connected_devices_df, fcr_xd_proxydev_df]
-    return analyzed_configuration_lst
\ No newline at end of file
+    portshow_aggregated_df = portcmd_analysis(*args)
+    if PORTSHOW_ARROW_STRINGS:
+        portshow_aggregated_df = dfop.convert_arrow_string(portshow_aggregated_df, PORTSHOW_KEY_COLUMNS)
+    return portshow_aggregated_df
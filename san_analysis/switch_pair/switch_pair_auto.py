@@ -66,15 +66,17 @@ def search_fd_xd_pairs(switch_params_aggregated_df, fcr_xd_proxydev_df, fabric_l
     fcr_xd_proxydev_df['switchMode'] = 'Native'
 
     # find translate domain pairs with highest proxy device match
+    fcr_xd_proxydev_index_dct = create_device_match_index(fcr_xd_proxydev_df)
     switch_pair_fd_xd[sw_pair_columns] = switch_pair_fd_xd.apply(
         lambda series: find_nonzero_device_connected_switch_pair(
-            series, sw_fd_xd_wwn_name_match_sr, fcr_xd_proxydev_df, 
+            series, sw_fd_xd_wwn_name_match_sr, fcr_xd_proxydev_index_dct, 
             fabric_labels_lst, sw_pair_columns, min_device_number_match_ratio, 
             min_sw_name_match_ratio, proxy_only=True), axis=1)
     # find switch pairs with highest switchName match for swithes without device connection (front domain)
+    switchname_candidates_index_dct = create_switchname_candidates_index(switch_pair_fd_xd)
     switch_pair_fd_xd[sw_pair_columns[3:7]] = switch_pair_fd_xd.apply(
         lambda series: find_zero_device_connected_switchname_match(
-            series, switch_pair_fd_xd.copy(), sw_fd_xd_wwn_name_match_sr, 
+            series, switchname_candidates_index_dct, sw_fd_xd_wwn_name_match_sr, 
             sw_pair_columns, min_sw_name_match_ratio), axis=1)
     return switch_pair_fd_xd
 
@@ -93,10 +95,11 @@ def search_brocade_pairs(switch_params_aggregated_df, portshow_aggregated_df, fc
     sw_brocade_wwn_name_match_sr = create_wwn_name_match_series(switch_pair_brocade_df)
     # find devices connected to Brocade switches
     brocade_connected_devices_df = find_sw_brocade_connected_devices(portshow_aggregated_df)
+    brocade_connected_devices_index_dct = create_device_match_index(brocade_connected_devices_df)
     # find switch pairs with highest connected device match
     switch_pair_brocade_df[sw_pair_columns] = switch_pair_brocade_df.apply(
         lambda series: find_nonzero_device_connected_switch_pair(
-            series, sw_brocade_wwn_name_match_sr, brocade_connected_devices_df, 
+            series, sw_brocade_wwn_name_match_sr, brocade_connected_devices_index_dct, 
             fabric_labels_lst, sw_pair_columns, min_device_number_match_ratio, 
             min_sw_name_match_ratio, npiv_only=False), axis=1)
 
@@ -106,17 +109,19 @@ def search_brocade_pairs(switch_params_aggregated_df, portshow_aggregated_df, fc
     # add enclosure switch pair for switches without device connection 
     switch_pair_brocade_df = find_zero_device_connected_enclosure_sw_pair(switch_pair_brocade_df)
     # find switch pairs with highest switchName match for swithes without device connection
+    switchname_candidates_index_dct = create_switchname_candidates_index(switch_pair_brocade_df)
     switch_pair_brocade_df[sw_pair_columns[3:7]] = \
         switch_pair_brocade_df.apply(lambda series: find_zero_device_connected_switchname_match(
-            series, switch_pair_brocade_df.copy(), sw_brocade_wwn_name_match_sr, 
+            series, switchname_candidates_index_dct, sw_brocade_wwn_name_match_sr, 
             sw_pair_columns, min_sw_name_match_ratio), axis=1)
     # find switch pairs if for any of switch in pair config is not present
     portshow_npiv_devices_df = find_sw_npv_ag_connected_devices(
         switch_pair_brocade_df, portshow_aggregated_df, merge_column='oui_board_sn')
+    portshow_npiv_devices_index_dct = create_device_match_index(portshow_npiv_devices_df)
     
     switch_pair_brocade_df[sw_pair_columns] = switch_pair_brocade_df.apply(
         lambda series: find_nonzero_device_connected_switch_pair(
-            series, sw_brocade_wwn_name_match_sr, portshow_npiv_devices_df, 
+            series, sw_brocade_wwn_name_match_sr, portshow_npiv_devices_index_dct, 
             fabric_labels_lst, sw_pair_columns, 
             min_device_number_match_ratio, min_sw_name_match_ratio, 
             npiv_only=True), axis=1)
@@ -139,15 +144,17 @@ def search_vc_cisco_pairs(portshow_aggregated_df, fabric_labels_lst):
     # find devices connected to VC and Cisco switches
     portshow_vc_cisco_devices_df = find_sw_npv_ag_connected_devices(
         vc_cisco_pair_df, portshow_aggregated_df, merge_column='NodeName')
+    portshow_vc_cisco_devices_index_dct = create_device_match_index(portshow_vc_cisco_devices_df)
     # find switch pairs with highest connected device match
     vc_cisco_pair_df[sw_pair_columns] = vc_cisco_pair_df.apply(
         lambda series: find_nonzero_device_connected_switch_pair(
-            series, vc_cisco_wwn_name_match_sr, portshow_vc_cisco_devices_df, 
+            series, vc_cisco_wwn_name_match_sr, portshow_vc_cisco_devices_index_dct, 
             fabric_labels_lst, sw_pair_columns, min_device_number_match_ratio, 
             min_sw_name_match_ratio, npiv_only=True), axis=1)
     # find switch pairs with highest switchName match for swithes without device connection
+    switchname_candidates_index_dct = create_switchname_candidates_index(vc_cisco_pair_df)
     vc_cisco_pair_df[sw_pair_columns[3:7]] = vc_cisco_pair_df.apply(
         lambda series: find_zero_device_connected_switchname_match(
-            series, vc_cisco_pair_df.copy(), vc_cisco_wwn_name_match_sr, 
+            series, switchname_candidates_index_dct, vc_cisco_wwn_name_match_sr, 
             sw_pair_columns, min_sw_name_match_ratio), axis=1)     
     return vc_cisco_pair_df, portshow_vc_cisco_devices_df
\ No newline at end of file
@@ -4,7 +4,51 @@ import utilities.dataframe_operations as dfop
 from .switchname_approach import find_max_switchname_match
 
 
-def find_nonzero_device_connected_switch_pair(switch_sr, sw_wwn_name_match_sr, portshow_devices_df, fabric_labels_lst, sw_pair_columns,
+# columns to group pair switch candidates on
+sw_candidate_group_columns = ['Fabric_name', 'Fabric_label', 'switchType', 'switchMode']
+
+
+def create_device_match_index(portshow_devices_df):
+    """Function to create index of devices connected to switches once for all switches pair search.
+    Index contains connected device rows number and connected devices number of each switch,
+    row positions of each pair switch candidates group (Fabric_name, Fabric_label, switchType, switchMode)
+    and device match numbers of all switches with candidate switches of the group (counted on first request)"""
+
+    devices_df = portshow_devices_df.reset_index(drop=True)
+    device_match_index_dct = {
+        'devices': devices_df,
+        'switch_rows': devices_df.groupby('switchWwn')['Device_Host_Name'].size().to_dict(),
+        'switch_devices': devices_df.groupby('switchWwn')['Device_Host_Name'].count().to_dict(),
+        'candidate_groups': devices_df.groupby(sw_candidate_group_columns, sort=False).indices if not devices_df.empty else {},
+        'device_match': {}
+        }
+    return device_match_index_dct
+
+
+def get_group_device_match(device_match_index_dct, group_key):
+    """Function returns list of candidate switches wwns in group_key and DataFrame with device match number 
+    (how many devices connected to the switch are connected to the candidate switch) 
+    of each switch (rows) with each candidate switch (columns)"""
+
+    if group_key in device_match_index_dct['device_match']:
+        return device_match_index_dct['device_match'][group_key]
+    
+    devices_df = device_match_index_dct['devices']
+    sw_candidates_df = devices_df.iloc[device_match_index_dct['candidate_groups'][group_key]]
+    sw_candidates_wwn_lst = sw_candidates_df['switchWwn'].unique().tolist()
+    # each device connected to the candidate switch is counted once
+    sw_candidates_devices_df = sw_candidates_df[['switchWwn', 'Device_Host_Name']].drop_duplicates()
+    sw_candidates_devices_df = sw_candidates_devices_df.rename(columns={'switchWwn': 'switchWwn_candidate'})
+    # each device connected to the switch matched with the same device connected to candidate switches
+    device_match_df = devices_df[['switchWwn', 'Device_Host_Name']].merge(sw_candidates_devices_df, how='inner', on='Device_Host_Name')
+    device_match_number_df = device_match_df.groupby(['switchWwn', 'switchWwn_candidate']).size().unstack(fill_value=0)
+    device_match_number_df = device_match_number_df.reindex(columns=sw_candidates_wwn_lst, fill_value=0)
+
+    device_match_index_dct['device_match'][group_key] = sw_candidates_wwn_lst, device_match_number_df
+    return sw_candidates_wwn_lst, device_match_number_df
+
+
+def find_nonzero_device_connected_switch_pair(switch_sr, sw_wwn_name_match_sr, device_match_index_dct, fabric_labels_lst, sw_pair_columns,
                                               min_device_number_match_ratio, min_sw_name_match_ratio, npiv_only=False, proxy_only=False):
     """Function to find pair switch for the switch_sr. Candidates switches have to be same switchType and switchMode.
     Then candidate switches are checked for connected devices. 
@@ -21,15 +65,13 @@ def find_nonzero_device_connected_switch_pair(switch_sr, sw_wwn_name_match_sr, p
     if (npiv_only or proxy_only) and pd.notna(switch_sr['switchWwn_pair']):
         return pd.Series([switch_sr[column] for column in sw_pair_columns])   
     
-    # find devices connected to the current switch
-    mask_current_switch = portshow_devices_df['switchWwn'] == switch_sr['switchWwn']
-    sw_current_devices_sr = portshow_devices_df.loc[mask_current_switch, 'Device_Host_Name']
-    connected_device_number = sw_current_devices_sr.count()
+    # find number of devices connected to the current switch
+    connected_device_number = device_match_index_dct['switch_devices'].get(switch_sr['switchWwn'], 0)
 
     # list of fabric labels to verify (all fabric labels except fabric label of the switch being checked)
     verified_label_lst = [fabric_label for fabric_label in fabric_labels_lst if fabric_label != switch_sr['Fabric_label']]
 
-    if sw_current_devices_sr.empty:
+    if not device_match_index_dct['switch_rows'].get(switch_sr['switchWwn']):
         if len(verified_label_lst) == 1:
             match_statistics = [0, 0]
         else:
@@ -56,15 +98,13 @@ def find_nonzero_device_connected_switch_pair(switch_sr, sw_wwn_name_match_sr, p
         sw_pairing_type_lst = ['device_list']
     
     for verified_label in verified_label_lst:
-        # find candidate pair switches with the same switchType and switchMode within the same Fabric_name in verified Fabric_label
-        mask_same_sw_type_mode = (portshow_devices_df[['switchType', 'switchMode']] == switch_sr[['switchType', 'switchMode']]).all(axis=1)
-        mask_same_fabric_name = portshow_devices_df['Fabric_name'] == switch_sr['Fabric_name']
-        mask_verified_label = portshow_devices_df['Fabric_label'] == verified_label
-        portshow_sw_candidates_df = portshow_devices_df.loc[mask_same_sw_type_mode & mask_same_fabric_name & mask_verified_label]
+        # candidate pair switches group with the same switchType and switchMode within the same Fabric_name in verified Fabric_label
+        group_key = (switch_sr['Fabric_name'], verified_label, switch_sr['switchType'], switch_sr['switchMode'])
         
-        # check portshow_sw_candidates_df to find switches with the largest connected device match
+        # check candidate switches group to find switches with the largest connected device match
         max_device_match_number, max_device_match_number_ratio, sw_pair_name_lst, sw_pair_wwn_lst = \
-            find_max_device_match_switch(sw_wwn_name_match_sr, sw_current_devices_sr, portshow_sw_candidates_df, min_device_number_match_ratio)
+            find_max_device_match_switch(sw_wwn_name_match_sr, switch_sr['switchWwn'], connected_device_number, 
+                                            device_match_index_dct, group_key, min_device_number_match_ratio)
         max_device_match_number_lst.append(max_device_match_number)
         max_device_match_ratio_lst.append(max_device_match_number_ratio)
         
@@ -103,30 +143,33 @@ def find_nonzero_device_connected_switch_pair(switch_sr, sw_wwn_name_match_sr, p
         return pd.Series([*match_statistics, *[None]*6])
     
 
-def find_max_device_match_switch(sw_wwn_name_match_sr, sw_current_devices_sr, portshow_sw_candidates_df, min_device_number_match_ratio):
-    """Auxiliary function to find switches which have maximum connected device match with the switch 
-    for which pair switch is being checked for(in sw_current_devices_sr)"""
+def find_max_device_match_switch(sw_wwn_name_match_sr, switch_wwn, connected_device_number, 
+                                    device_match_index_dct, group_key, min_device_number_match_ratio):
+    """Auxiliary function to find switches in candidate switches group_key which have maximum connected device match 
+    with the switch for which pair switch is being checked for (switch_wwn)"""
+    
+    # there are no candidate switches if any group parameter is empty
+    if pd.isna(list(group_key)).any() or not group_key in device_match_index_dct['candidate_groups']:
+        return [None]*4
     
     # list with wwns of the candidate switches to be pair with the current switch
-    sw_candidates_wwn_lst = portshow_sw_candidates_df['switchWwn'].unique().tolist()
+    # and device match number of all switches with the candidate switches
+    sw_candidates_wwn_lst, device_match_number_df = get_group_device_match(device_match_index_dct, group_key)
     
     if not sw_candidates_wwn_lst:
         return [None]*4
     
     # list with the number of device matches of each candidate switch with the current switch
     # how many devices from current switch connected to switch being verified
-    device_match_number_lst = []
-    
-    for sw_candidate_wwn in sw_candidates_wwn_lst:
-        mask_sw_candidate_wwn = portshow_sw_candidates_df['switchWwn'] == sw_candidate_wwn
-        # find devices connected to the candidate switch
-        sw_candidate_devices_sr = portshow_sw_candidates_df.loc[mask_sw_candidate_wwn, 'Device_Host_Name']
-        # count device match number
-        device_match_number_lst.append(sw_current_devices_sr.isin(sw_candidate_devices_sr).sum())
+    if switch_wwn in device_match_number_df.index:
+        device_match_number_lst = device_match_number_df.loc[switch_wwn].tolist()
+    else:
+        device_match_number_lst = [0]*len(sw_candidates_wwn_lst)
+    device_match_number_lst = [np.int64(device_match_number) for device_match_number in device_match_number_lst]
     
     # if there is switch with at least 80 percentage of device match
     max_device_match_number = max(device_match_number_lst)
-    max_device_match_number_ratio = round(max_device_match_number/sw_current_devices_sr.count(), 2)
+    max_device_match_number_ratio = round(max_device_match_number/connected_device_number, 2)
     
     if max_device_match_number_ratio > min_device_number_match_ratio:
         # find switch wwns with maximum device match number
@@ -135,4 +178,4 @@ def find_max_device_match_switch(sw_wwn_name_match_sr, sw_current_devices_sr, po
         sw_pair_name_lst = [sw_wwn_name_match_sr[sw_wwn] for sw_wwn in sw_pair_wwn_lst]
         return max_device_match_number, max_device_match_number_ratio, sw_pair_name_lst, sw_pair_wwn_lst
     else:
-        return max_device_match_number, max_device_match_number_ratio, None, None
\ No newline at end of file
+        return max_device_match_number, max_device_match_number_ratio, None, None
@@ -1,11 +1,33 @@
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 import re
 
 
-def find_zero_device_connected_switchname_match(switch_sr, switch_pair_df, sw_wwn_name_match_sr, sw_pair_columns, min_sw_name_match_ratio):
+def create_switchname_candidates_index(switch_pair_df):
+    """Function to create index of pair switch candidates for switches with no device connected once for all switches.
+    Index contains fabric labels list and names, wwns of candidate switches (with zero device connected or 
+    translate and front domains) for each group (Fabric_name, Fabric_label, switchType, switchMode)"""
+
+    # pair switch candidates with zero device connected
+    mask_zero_device_connected = switch_pair_df['Connected_device_number'] == 0
+    mask_fd_xd = switch_pair_df['switchName'].str.contains('fcr_[fx]d_\d+', case=False, na=False)
+    sw_candidates_df = switch_pair_df.loc[mask_zero_device_connected | mask_fd_xd]
+    # candidate names and wwns for each group
+    sw_candidates_dct = {
+        group_key: (group_df['switchName'].tolist(), group_df['switchWwn'].tolist()) 
+        for group_key, group_df in sw_candidates_df.groupby(['Fabric_name', 'Fabric_label', 'switchType', 'switchMode'], sort=False)
+        }
+    switchname_candidates_index_dct = {
+        'fabric_labels': switch_pair_df['Fabric_label'].unique().tolist(),
+        'candidates': sw_candidates_dct
+        }
+    return switchname_candidates_index_dct
+
+
+def find_zero_device_connected_switchname_match(switch_sr, switchname_candidates_index_dct, sw_wwn_name_match_sr, sw_pair_columns, min_sw_name_match_ratio):
     """Function to find highest match switchName for switches with no device connected"""
     
     sw_pairing_type = 'switch_name'
@@ -15,7 +37,7 @@ def find_zero_device_connected_switchname_match(switch_sr, switch_pair_df, sw_ww
     
     # list of fabric labels to verify (all fabric labels except fabric label of the switch being checked)
     verified_label_lst = [fabric_label for fabric_label in 
-                          switch_pair_df['Fabric_label'].unique().tolist() 
+                          switchname_candidates_index_dct['fabric_labels'] 
                           if fabric_label != switch_sr['Fabric_label']]
     # lists with names and wwnns of the pair switches
     sw_pair_wwn_final_lst = []
@@ -24,13 +46,10 @@ def find_zero_device_connected_switchname_match(switch_sr, switch_pair_df, sw_ww
 
     for verified_label in verified_label_lst:
         # pair switch candidates in verified fabric label with zero device connected with the same switchType and switchMode
-        mask_zero_device_connected = switch_pair_df['Connected_device_number'] == 0
-        mask_fd_xd = switch_pair_df['switchName'].str.contains('fcr_[fx]d_\d+', case=False, na=False)
-        mask_same_fabric_name = switch_pair_df['Fabric_name'] == switch_sr['Fabric_name']
-        mask_verified_label = switch_pair_df['Fabric_label'] == verified_label
-        mask_same_sw_type_mode = (switch_pair_df[['switchType', 'switchMode']] == switch_sr[['switchType', 'switchMode']]).all(axis=1)
-        sw_candidates_name_lst = switch_pair_df.loc[(mask_zero_device_connected | mask_fd_xd) & mask_same_fabric_name & mask_verified_label & mask_same_sw_type_mode, 'switchName'].tolist()
-        sw_candidates_wwn_lst = switch_pair_df.loc[(mask_zero_device_connected | mask_fd_xd) & mask_same_fabric_name & mask_verified_label & mask_same_sw_type_mode, 'switchWwn'].tolist()
+        group_key = (switch_sr['Fabric_name'], verified_label, switch_sr['switchType'], switch_sr['switchMode'])
+        if pd.isna(list(group_key)).any():
+            continue
+        sw_candidates_name_lst, sw_candidates_wwn_lst = switchname_candidates_index_dct['candidates'].get(group_key, ([], []))
         if sw_candidates_wwn_lst:
             # find switches with highest switchName match
             sw_pair_name_lst, sw_pair_wwn_lst = find_max_switchname_match(switch_sr['switchName'], sw_candidates_name_lst, sw_candidates_wwn_lst, sw_wwn_name_match_sr, min_sw_name_match_ratio)
@@ -54,7 +73,7 @@ def find_max_switchname_match(switch_name, sw_pair_name_lst, sw_pair_wwn_lst, sw
     """Auxiliary function to find switches in the sw_pair_name_lst which names have highest match with switch_name"""
     
     # find highest name match ratio 
-    name_match_ratio_lst = [round(SequenceMatcher(None, switch_name, sw_pair_name).ratio(), 2) for sw_pair_name in sw_pair_name_lst]
+    name_match_ratio_lst = [switchname_match_ratio(switch_name, sw_pair_name, min_sw_name_match_ratio) for sw_pair_name in sw_pair_name_lst]
     max_name_match_ratio = max(name_match_ratio_lst)
     # hisghest name match ration should exceed min_sw_name_match_ratio
     if max_name_match_ratio >= min_sw_name_match_ratio:
@@ -67,3 +86,15 @@ def find_max_switchname_match(switch_name, sw_pair_name_lst, sw_pair_wwn_lst, sw
     else:
         return (None,)*2
 
+
+@lru_cache(maxsize=None)
+def switchname_match_ratio(switch_name, sw_pair_name, min_sw_name_match_ratio=0):
+    """Auxiliary function to count switch names match ratio. 
+    Ratio is cached since the same switch names pairs are compared for each pair search approach.
+    Ratio is not counted if it's upper bound is below min_sw_name_match_ratio (-1 is returned)"""
+
+    sequence_matcher = SequenceMatcher(None, switch_name, sw_pair_name)
+    if round(sequence_matcher.real_quick_ratio(), 2) < min_sw_name_match_ratio or \
+        round(sequence_matcher.quick_ratio(), 2) < min_sw_name_match_ratio:
+        return -1
+    return round(sequence_matcher.ratio(), 2)
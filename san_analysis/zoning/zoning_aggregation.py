@@ -6,7 +6,8 @@ import pandas as pd
 
 import utilities.dataframe_operations as dfop
 
-from .zoning_aggregation_aux_fn import (alias_cfg_type, replace_domain_index,
+from .zoning_aggregation_aux_fn import (alias_cfg_type, create_wwn_index,
+                                        replace_domain_index,
                                         replace_wwnn, sort_dataframe,
                                         verify_alias_duplicate,
                                         verify_cfg_type,
@@ -30,13 +31,15 @@ def zoning_aggregated(switch_params_aggregated_df, portshow_aggregated_df,
     # create fabric labaled zoning configuration DataFrame
     zoning_aggregated_df, alias_aggregated_df = \
         zoning_from_configuration(switch_params_aggregated_df, cfg_df, cfg_effective_df, zone_df, alias_df, peerzone_df)
+    # fabric WWNs index (WWN types, WWNN -> WWNP, Domain_Index -> WWNP)
+    wwn_index_dct = create_wwn_index(portshow_aggregated_df)
     # verify which type of WWN (port or node WWN) is used for each member
-    zoning_aggregated_df, alias_aggregated_df = wwn_type(zoning_aggregated_df, alias_aggregated_df, portshow_aggregated_df)
+    zoning_aggregated_df, alias_aggregated_df = wwn_type(zoning_aggregated_df, alias_aggregated_df, wwn_index_dct)
     # replace each wwnn in zoning configuration with it's wwnp  
-    zoning_aggregated_df, alias_aggregated_df = replace_wwnn(zoning_aggregated_df, alias_aggregated_df, portshow_aggregated_df)
+    zoning_aggregated_df, alias_aggregated_df = replace_wwnn(zoning_aggregated_df, alias_aggregated_df, wwn_index_dct)
     # replace Domain_Index with wwnp
-    zoning_aggregated_df = replace_domain_index(zoning_aggregated_df, portshow_aggregated_df)
-    alias_aggregated_df = replace_domain_index(alias_aggregated_df, portshow_aggregated_df)
+    zoning_aggregated_df = replace_domain_index(zoning_aggregated_df, wwn_index_dct)
+    alias_aggregated_df = replace_domain_index(alias_aggregated_df, wwn_index_dct)
     # finds fabric connection for each zonemember (alias)
     zoning_aggregated_df, alias_aggregated_df = \
         zonemember_connection(zoning_aggregated_df, alias_aggregated_df, portshow_aggregated_df)
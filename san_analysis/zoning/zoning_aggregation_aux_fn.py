@@ -11,44 +11,44 @@ import utilities.dataframe_operations as dfop
 # import utilities.servicefile_operations as sfop
 # import utilities.filesystem_operations as fsop
 
-def wwn_type(zoning_aggregated_df, alias_aggregated_df, portshow_aggregated_df):
+def create_wwn_index(portshow_aggregated_df):
+    """Function to create fabric WWNs index once for zoning configuration processing.
+    Index contains WWN type (port or node WWN) for each WWN in Fabric, 
+    Port and Node WWNs of each fabric and Port WWN of each Domain_Index"""
+
+    wwn_index_dct = {}
+    # WWN type for each Node and Port WWN in Fabric.
+    # if Node and Port WWNs are identical than WWNP is considered to be used
+    wwn_type_dct = dict.fromkeys(portshow_aggregated_df.NodeName.dropna().unique(), 'Wwnn')
+    wwn_type_dct.update(dict.fromkeys(portshow_aggregated_df.PortName.dropna().unique(), 'Wwnp'))
+    wwn_index_dct['wwn_type'] = wwn_type_dct
+
+    # create DataFrame with WWNP and WWNN
+    port_node_name_df = portshow_aggregated_df[['Fabric_name', 'Fabric_label', 'PortName', 'NodeName']].copy()
+    port_node_name_df.dropna(subset = ['Fabric_name', 'Fabric_label', 'PortName', 'NodeName'], inplace=True)
+    wwn_index_dct['port_node_name'] = port_node_name_df
+
+    # create DataFrame with Domain_Index and WWNP
+    domain_index_df = portshow_aggregated_df[['Fabric_name', 'Fabric_label', 'Domain_Index', 'PortName']].copy()
+    domain_index_df.rename(columns={'PortName': 'Strict_Wwnp', 'Domain_Index': 'alias_member'}, inplace=True)
+    wwn_index_dct['domain_index'] = domain_index_df
+    return wwn_index_dct
+
+
+def wwn_type(zoning_aggregated_df, alias_aggregated_df, wwn_index_dct):
     """Function to verify which type of WWN (port or node WWN) is used for each alias_member"""
 
-    # list of all Node WWNs in Fabric
-    wwnn_lst = sorted(portshow_aggregated_df.NodeName.dropna().drop_duplicates().to_list())
-    # list of all Port WWns in Fabric
-    wwnp_lst = sorted(portshow_aggregated_df.PortName.dropna().drop_duplicates().to_list())
-    # list of WWNs for which Port and Node WWN values are the same
-    wwn_intersection = set(wwnp_lst).intersection(wwnn_lst)
-    # remove identical WWNs (intersection lst WWNs) from Node and Port WWNs lists
-    wwnp_clear_lst = [wwnp for wwnp in wwnp_lst if wwnp not in wwn_intersection]
-    wwnn_clear_lst = [wwnn for wwnn in wwnn_lst if wwnn not in wwn_intersection]
-    
-    def wwn_check(wwn, wwnp_lst, wwnn_lst, wwn_intersection):
-        # if Node and Port WWNs are identical
-        # than WWNP is considered to be used
-        if wwn in wwn_intersection:
-            return 'Wwnp'
-        if wwn in wwnp_lst:
-            return 'Wwnp'
-        if wwn in wwnn_lst:
-            return 'Wwnn'
-        return np.nan
-
-    zoning_aggregated_df['Wwn_type'] = zoning_aggregated_df.alias_member.apply(
-                                        lambda wwn: wwn_check(wwn, wwnp_clear_lst, wwnn_clear_lst, wwn_intersection))
-    alias_aggregated_df['Wwn_type'] = alias_aggregated_df.alias_member.apply(
-                                        lambda wwn: wwn_check(wwn, wwnp_lst, wwnn_lst, wwn_intersection))
+    zoning_aggregated_df['Wwn_type'] = zoning_aggregated_df.alias_member.map(wwn_index_dct['wwn_type'])
+    alias_aggregated_df['Wwn_type'] = alias_aggregated_df.alias_member.map(wwn_index_dct['wwn_type'])
     return zoning_aggregated_df, alias_aggregated_df
 
 
-def replace_wwnn(zoning_aggregated_df, alias_aggregated_df, portshow_aggregated_df):
+def replace_wwnn(zoning_aggregated_df, alias_aggregated_df, wwn_index_dct):
     """Function to replace each wwnn in zoning configuration with it's wwnp
     if wwnn is present in the same fabric."""
 
-    # create DataFrame with WWNP and WWNN
-    port_node_name_df = portshow_aggregated_df[['Fabric_name', 'Fabric_label', 'PortName', 'NodeName']].copy()
-    port_node_name_df.dropna(subset = ['Fabric_name', 'Fabric_label', 'PortName', 'NodeName'], inplace=True)
+    # DataFrame with WWNP and WWNN
+    port_node_name_df = wwn_index_dct['port_node_name'].copy()
     # check if Wwnn corresponds to two or more Wwnps
     port_node_name_df['Wwnn_unpack'] = np.nan
     mask_duplicated_wwnn = ~port_node_name_df.duplicated(subset=['Fabric_name', 'Fabric_label', 'NodeName'], keep=False)
@@ -70,13 +70,11 @@ def replace_wwnn(zoning_aggregated_df, alias_aggregated_df, portshow_aggregated_
     return zoning_aggregated_df, alias_aggregated_df
 
 
-def replace_domain_index(aggregated_df, portshow_aggregated_df):
+def replace_domain_index(aggregated_df, wwn_index_dct):
     """Function to replace Domain_Index with Wwpn"""
 
     aggregated_df['Strict_Wwnp'].replace(to_replace='\d+,\d+', value=np.nan, regex=True, inplace=True)
-    portshow_cp = portshow_aggregated_df.copy()
-    portshow_cp.rename(columns={'PortName': 'Strict_Wwnp', 'Domain_Index': 'alias_member'}, inplace=True)
-    aggregated_df = dfop.dataframe_fillna(aggregated_df, portshow_cp, join_lst=['Fabric_name', 'Fabric_label', 'alias_member'], 
+    aggregated_df = dfop.dataframe_fillna(aggregated_df, wwn_index_dct['domain_index'], join_lst=['Fabric_name', 'Fabric_label', 'alias_member'], 
                                             filled_lst=['Strict_Wwnp'], remove_duplicates=False)
     return aggregated_df
 
@@ -44,7 +44,44 @@ DIR_4SLOTS_TYPE = [77, 121, 165, 179]
 # All directors (8-slots, 4-slots)
 DIRECTOR_TYPE = [42, 62, 77, 120, 121, 165, 166, 179, 180]
 
+# number of processes to extract switch configuration data (1 - switches are processed one by one)
+SAN_PARSER_WORKERS = 1
+
+# number of threads to run independent san_analysis stages (1 - stages are run one by one).
+# Stages requesting user input are always run in the main thread
+ANALYSIS_WORKERS = 1
+# merge and key columns of portshow_aggregated_df (fabric and switch names, WWNs) are kept as Arrow strings
+# after portcmd analysis to reduce memory used by the DataFrame (pyarrow package is required)
+PORTSHOW_ARROW_STRINGS = True
+
+# number of processes to export supportsave files (1 - switches are exported one by one)
+SSAVE_EXPORT_WORKERS = 1
+# number of characters read from supportsave section file and written to exported file at once
+EXPORT_BLOCK_SIZE = 1024 * 1024
+
+# number of threads to download 3PAR configuration files (1 - 3PAR configurations are downloaded one by one)
+STORAGE_DOWNLOAD_WORKERS = 1
+# number of repeated 3PAR configuration file requests if download failed
+STORAGE_DOWNLOAD_RETRIES = 2
+
+# DataFrames exported to excel report are collected during program execution and 
+# each report file is written once on report completion (False - report file is written after each DataFrame)
+REPORT_BATCH_EXPORT = True
+# new report files are written in openpyxl write-only mode (lower memory usage for very large sheets, 
+# data cells keep default format)
+REPORT_WRITE_ONLY = False
+
 # raslog statistics period in months
 RASLOG_PERIOD = 6
+# errdump messages are extracted only for the period in months prior to the config collection date (None - all messages)
+ERRDUMP_PERIOD = None
+# errdump messages are extracted only for the listed message ids and severities, e.g. ['MAPS-1003'], ['WARNING', 'ERROR'] 
+# (None - all messages)
+ERRDUMP_MESSAGE_ID_LST = None
+ERRDUMP_SEVERITY_LST = None
+# number of errdump messages converted to the single DataFrame chunk during switch errdump parsing. 
+# Chunks are appended to the database as soon as they are extracted and errdump is read back by chunks 
+# of the same size in errdump analysis (messages are filtered again with the period, message ids and severities above)
+ERRDUMP_CHUNK_SIZE = 10000
 # filter raslog message occurance during the month 
 RASLOG_REPEATER_THRESHOLD = 3
\ No newline at end of file
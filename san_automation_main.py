@@ -21,9 +21,9 @@ def main():
     # supportsave parsing
     exported_sw_cfg_files_lst = san_switch_config.switch_configuration_discover(project_constants_lst, software_path_sr)
     # extract information from configuration files
-    extracted_configuration_lst = san_parser.system_configuration_extract(exported_sw_cfg_files_lst, project_constants_lst, software_path_sr)
+    extracted_data_registry = san_parser.system_configuration_extract(exported_sw_cfg_files_lst, project_constants_lst, software_path_sr)
     # perform analysis of extracted configuraion data
-    analyzed_configuration_lst = san_analysis.system_configuration_analysis(extracted_configuration_lst, project_constants_lst)
+    analyzed_configuration_lst = san_analysis.system_configuration_analysis(extracted_data_registry, project_constants_lst)
     # sort sheets and table of contents in excel report
     report.report_format_completion(project_constants_lst)
     # create san topology in Visio
@@ -12,8 +12,8 @@ def blade_enclosure_section(pattern_dct, file, enclosure_params):
     line = file.readline()
     # while not reach empty line
     while not re.search(r'UUID',line):
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line)
         # name_value_pair_match
         if match_dct['name_value_pair']:
             result = match_dct['name_value_pair']
@@ -54,8 +54,8 @@ def vc_fabric_connection_section(san_blade_vc_lst, enclosure_vc_lst,
     
     line = file.readline()
     while not re.search(r'FC-CONNECTION INFORMATION', line):
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line)
         # vc_port_match
         if match_dct['vc_port']:
             vc_port = dsop.line_to_list(pattern_dct['vc_port'], line)
@@ -77,8 +77,8 @@ def active_oa_section(file, pattern_dct):
 
     line = file.readline()
     while not re.search(r'^>SHOW', line):
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line)
         # oa_ip_match
         if match_dct['oa_ip']:
             oa_ip = match_dct['oa_ip'].group(1)
@@ -95,8 +95,8 @@ def interconnect_module_section(san_module_lst, pattern_dct,
 
     line = file.readline()
     while not re.search(r'^>SHOW', line):
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line)
         # module_type_num_match
         if match_dct['module_type_num']:
             module_dct = {}
@@ -131,8 +131,8 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
                 
     line = file.readline()
     while not re.search(r'^>SHOW', line):
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line)
         # blade_server_num_match
         if match_dct['blade_server_num']:
             blade_dct = {}
@@ -143,8 +143,8 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
             line = file.readline()
             # server_section_end_comp
             while not re.search(pattern_dct['server_section_end'], line):
-                # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+                match_dct = reop.match_line(pattern_dct, line)
                 # mezzanin hba section start
                 # mezzanine_model_match
                 if match_dct['mezzanine_description']:
@@ -154,8 +154,8 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
                     line = file.readline()
                     # mezzanine_wwn_comp
                     while re.search(pattern_dct['mezzanine_wwn'], line):
-                        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+                        match_dct = reop.match_line(pattern_dct, line)
                         # mezzanine_wwn_match
                         result = match_dct['mezzanine_wwn']
                         wwnp = result.group(1)
@@ -179,8 +179,8 @@ def server_hba_flb_section(san_blade_lst, blade_lst, pattern_dct,
                     line = file.readline()
                     # wwn_mac_line_comp
                     while re.search(pattern_dct['wwn_mac_line'], line):
-                        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+                        match_dct = reop.match_line(pattern_dct, line)
                         # flb_wwn_match
                         if match_dct['flb_wwn']:
                             result = match_dct['flb_wwn']
@@ -14,7 +14,8 @@ import utilities.module_execution as meop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
 
-from .synergy_sections import interconnect_module_extract, server_mezz_extract
+from .synergy_sections import (interconnect_module_extract, server_mezz_extract,
+                               synergy_sheets_import)
 
 
 def synergy_system_extract(project_constants_lst):
@@ -60,11 +61,13 @@ def synergy_system_extract(project_constants_lst):
                     info = f'[{i+1} of {configs_num}]: {configname} system.'
                     print(info, end =" ")
 
+                    # all required meddler file sheets are imported at once
+                    synergy_sheets_dct = synergy_sheets_import(synergy_config)
                     # interconnect modules information
-                    synergy_module_df = interconnect_module_extract(synergy_config)
+                    synergy_module_df = interconnect_module_extract(synergy_sheets_dct)
                     synergy_module_aggregated_df = pd.concat([synergy_module_aggregated_df, synergy_module_df], ignore_index=True)
                     # server and mezzanine information
-                    synergy_servers_df = server_mezz_extract(synergy_config, pattern_dct)
+                    synergy_servers_df = server_mezz_extract(synergy_sheets_dct, pattern_dct)
                     synergy_servers_aggregated_df = pd.concat([synergy_servers_aggregated_df, synergy_servers_df], ignore_index=True)
                     
                     if not all((synergy_servers_df.empty, synergy_module_df.empty)):
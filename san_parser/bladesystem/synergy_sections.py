@@ -1,16 +1,45 @@
+import os
 import re
 
 import pandas as pd
 import utilities.dataframe_operations as dfop
-from openpyxl import load_workbook
 
+# meddler file sheets required to extract synergy information
+SYNERGY_SHEETS = ['enclosures', 'interconnectbays', 'server-hardware', 'server-fw-sw']
+# meddler file sheets which are extracted if exist
+SYNERGY_OPTIONAL_SHEETS = ['server-prof-conn-details']
 
-def interconnect_module_extract(synergy_config):
+# meddler file sheets imported during current program execution
+synergy_sheets_cache = {}
+
+
+def synergy_sheets_import(synergy_config):
+    """Function to import all required sheets of the meddler file at once (workbook is opened and parsed once).
+    Returns dictionary with sheet names as keys and DataFrames as values.
+    Sheets are imported on first request and imported again only if file size or modification time changed"""
+
+    synergy_config_stat = os.stat(synergy_config)
+    synergy_config_signature = (synergy_config_stat.st_size, synergy_config_stat.st_mtime_ns)
+    synergy_config_key = os.path.abspath(synergy_config)
+
+    if synergy_config_key in synergy_sheets_cache:
+        cached_signature, synergy_sheets_dct = synergy_sheets_cache[synergy_config_key]
+        if cached_signature == synergy_config_signature:
+            return synergy_sheets_dct
+    with pd.ExcelFile(synergy_config) as synergy_workbook:
+        sheet_names = [*SYNERGY_SHEETS, 
+                       *[sheet for sheet in SYNERGY_OPTIONAL_SHEETS if sheet in synergy_workbook.sheet_names]]
+        synergy_sheets_dct = pd.read_excel(synergy_workbook, sheet_name=sheet_names)
+    synergy_sheets_cache[synergy_config_key] = (synergy_config_signature, synergy_sheets_dct)
+    return synergy_sheets_dct
+
+
+def interconnect_module_extract(synergy_sheets_dct):
     """Function to extract enclosure and interconnect modules information 
     (enclosures and interconnectbays tabs of the meddler file"""
 
-    syn_enclosure_df = pd.read_excel(synergy_config, sheet_name='enclosures')
-    syn_module_df = pd.read_excel(synergy_config, sheet_name='interconnectbays')
+    syn_enclosure_df = synergy_sheets_dct['enclosures']
+    syn_module_df = synergy_sheets_dct['interconnectbays']
 
     # enclosure information
     enclosure_columns = ['name', 'enclosuremodel', 'version', 'serialnumber']
@@ -35,26 +64,26 @@ def interconnect_module_extract(synergy_config):
     return synergy_module_df
 
 
-def server_mezz_extract(synergy_config, pattern_dct):
+def server_mezz_extract(synergy_sheets_dct, pattern_dct):
     """Function to extract synergy servers and servers mezzanine information"""
     
     # server and mezzanine information
-    synergy_server_wwn_df = synergy_server_wwn(synergy_config, pattern_dct)
+    synergy_server_wwn_df = synergy_server_wwn(synergy_sheets_dct, pattern_dct)
     # add mezzanin information to synergy_server_wwn_df from 'server-prof-conn-details' if sheet exist
-    synergy_profile_wwn_df = synergy_profile_wwn(synergy_config, synergy_server_wwn_df, pattern_dct)
+    synergy_profile_wwn_df = synergy_profile_wwn(synergy_sheets_dct, synergy_server_wwn_df, pattern_dct)
     # conctenate connection profile and server hardware
     synergy_servers_df = pd.concat([synergy_server_wwn_df, synergy_profile_wwn_df], ignore_index=True)
     synergy_servers_df.drop_duplicates(inplace=True)
     # add mezzanine firmware details
-    synergy_servers_df = synergy_mezz_fw(synergy_config, synergy_servers_df, pattern_dct)
+    synergy_servers_df = synergy_mezz_fw(synergy_sheets_dct, synergy_servers_df, pattern_dct)
     synergy_servers_df.sort_values(by=['enclosurename', 'position', 'Mezz_WWPN'], ignore_index=True, inplace=True)
     return synergy_servers_df
 
 
-def synergy_server_wwn(synergy_config, pattern_dct):
+def synergy_server_wwn(synergy_sheets_dct, pattern_dct):
     """Server and mezzanine information from server-hardware tab"""
 
-    syn_server_hw_df = pd.read_excel(synergy_config, sheet_name='server-hardware')
+    syn_server_hw_df = synergy_sheets_dct['server-hardware']
     
     # server_hardware
     server_hw_columns = [ 'enclosurename', 'position', 'servername',  'name',  'serverprofilename',  'model',  'serialnumber',  'oshint']
@@ -119,14 +148,13 @@ def synergy_server_wwn(synergy_config, pattern_dct):
     return synergy_server_wwn_df
 
 
-def synergy_profile_wwn(synergy_config, synergy_server_wwn_df, pattern_dct):
+def synergy_profile_wwn(synergy_sheets_dct, synergy_server_wwn_df, pattern_dct):
     """Add mezzanine information to synergy_server_wwn_df from 'server-prof-conn-details' if sheet exist"""
 
-    wb = load_workbook(synergy_config)
-    if not 'server-prof-conn-details' in wb.sheetnames:
+    if not 'server-prof-conn-details' in synergy_sheets_dct:
         return pd.DataFrame()
 
-    syn_server_profile_connection_df = pd.read_excel(synergy_config, sheet_name='server-prof-conn-details')
+    syn_server_profile_connection_df = synergy_sheets_dct['server-prof-conn-details']
     
     # server connection profile
     connection_profile_columns = ['profilename', 'portid', 'wwpn']
@@ -147,10 +175,10 @@ def synergy_profile_wwn(synergy_config, synergy_server_wwn_df, pattern_dct):
     return synergy_profile_wwn_df
 
 
-def synergy_mezz_fw(synergy_config, synergy_servers_df, pattern_dct):
+def synergy_mezz_fw(synergy_sheets_dct, synergy_servers_df, pattern_dct):
     """Add mezzanine firmware from server-fw-sw tab"""
 
-    syn_server_fw_sw_df = pd.read_excel(synergy_config, sheet_name='server-fw-sw')
+    syn_server_fw_sw_df = synergy_sheets_dct['server-fw-sw']
     
     # mezzaniin firmware
     server_fw_sw_columns = ['servername', 'serverprofilename', 'componentversion', 'componentlocation']
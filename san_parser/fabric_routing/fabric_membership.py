@@ -10,6 +10,7 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.sshow_index_operations as siop
 
 from .fabric_sections import agshow_section_extract
 
@@ -47,17 +48,16 @@ def fabric_membership_extract(switch_params_df, project_constants_lst):
         ag_params = dfop.list_from_dataframe(re_pattern_df, 'ag_params')          
         
         # checking each switch for switch level parameters
-        for i, switch_params_sr in switch_params_df.iterrows():        
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} fabric environment. Switch role: {switch_params_sr["switchRole"]}'
-            print(info, end =" ")
-
-            if switch_params_sr["switchRole"] == 'Principal':
-                sw_fabricshow_lst = current_config_extract(san_fabricshow_lst, san_ag_principal_lst, pattern_dct, 
-                                                                        switch_params_sr, ag_params)
-                meop.show_collection_status(sw_fabricshow_lst, max_title, len(info))
-            else:
-                meop.status_info('skip', max_title, len(info))
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} fabric environment. Switch role: {switch_params_sr["switchRole"]}' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        # only Principal switches are checked
+        skip_lst = (switch_params_df["switchRole"] != 'Principal').tolist()
+        meop.switch_config_extract(current_config_extract, [san_fabricshow_lst, san_ag_principal_lst], 
+                                    pattern_dct, switch_params_lst, info_lst, max_title, 
+                                    ag_params, skip_lst=skip_lst,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'fabric_columns', 'ag_columns')
         data_lst = dfop.list_to_dataframe(headers_lst, san_fabricshow_lst, san_ag_principal_lst)
@@ -93,17 +93,19 @@ def current_config_extract(san_fabricshow_lst, san_ag_principal_lst, pattern_dct
         principal_switch_lst = [*switch_info_lst[:6], *switch_info_lst[7:9]]
                                 
         # search control dictionary. continue to check sshow_file until all parameters groups are found
+        sshow_index = siop.get_sshow_index(sshow_file)
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()
+                # lines which can't start any section are skipped
+                line = siop.goto_next_landmark(file, sshow_index)
                 if not line:
                     break
                 # fabricshow section start
                 if re.search(pattern_dct['switchcmd_fabricshow'], line):
                     # when section is found corresponding collected dict values changed to True
                     collected['fabricshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_fabricshow_lst = reop.extract_list_from_line(san_fabricshow_lst, pattern_dct, line, file, 
                                                                                         extract_pattern_name='fabricshow', 
                                                                                         save_local=True, line_add_values=principal_switch_lst)
@@ -111,7 +113,7 @@ def current_config_extract(san_fabricshow_lst, san_ag_principal_lst, pattern_dct
                 # ag_principal section start
                 elif re.search(pattern_dct['switchcmd_agshow'], line):
                     collected['ag_principal'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = agshow_section_extract(san_ag_principal_lst, pattern_dct, principal_switch_lst, ag_params, line, file)
                 # ag_principal section end
 
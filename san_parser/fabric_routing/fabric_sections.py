@@ -3,6 +3,7 @@
 import re
 
 import utilities.data_structure_operations as dsop
+import utilities.regular_expression_operations as reop
 
 
 def agshow_section_extract(san_ag_principal_lst, pattern_dct, 
@@ -11,7 +12,7 @@ def agshow_section_extract(san_ag_principal_lst, pattern_dct,
     """Function to extract agshow information from principal switch sshow file"""
 
     while not re.search(pattern_dct['switchcmd_end'], line):
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # ag_num_match pattern #5
         if match_dct['ag_num']:
             # dictionary to store all DISCOVERED switch ports information
@@ -28,7 +29,7 @@ def agshow_section_extract(san_ag_principal_lst, pattern_dct,
             line = file.readline()                                
             # ag_switchcmd_end_comp
             while not re.search(pattern_dct['ag_switchcmd_end'], line):
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                match_dct = reop.match_line(pattern_dct, line)
                 # ag_info_match pattern #6
                 if match_dct['ag_info']:
                     ag_info_dct[match_dct['ag_info'].group(1).rstrip()] = match_dct['ag_info'].group(2).rstrip()
@@ -12,6 +12,7 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.sshow_index_operations as siop
 
 from .fcrfabric_membership_sections import (fcrfabricshow_section_extract,
                                             fcrresourceshow_section_extract,
@@ -50,30 +51,23 @@ def fcr_membership_extract(switch_params_df, project_constants_lst):
         san_fcredge_lst = []
         san_fcrresource_lst = []
         san_fcrxlateconfig_lst = []
-        
-        # dictionary to collect fcr device data
-        # first element of list is regular expression pattern name of line where section is started,
-        # second - is the list to collect data, 
-        fcrdev_dct = {'fcrproxydev': ['switchcmd_fcrproxydevshow', san_fcrproxydev_lst], 
-                        'fcrphydev': ['switchcmd_fcrphydevshow', san_fcrphydev_lst]}    
 
         # data imported from init file to extract values from config file
         pattern_dct, re_pattern_df = sfop.regex_pattern_import('fcr', max_title)
         fcrresource_params = dfop.list_from_dataframe(re_pattern_df, 'fcrresource_params')
 
-        for i, switch_params_sr in switch_params_df.iterrows():       
-
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} fabric routing. FC Routing: {switch_params_sr["FC_Router"]}'
-            print(info, end =" ")
-
-            if switch_params_sr["FC_Router"] == 'ON':
-                sw_fcredge_lst = current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, 
-                                                        san_fcrresource_lst, san_fcrxlateconfig_lst, fcrdev_dct, 
-                                                        pattern_dct, switch_params_sr, fcrresource_params)                                                            
-                meop.show_collection_status(sw_fcredge_lst, max_title, len(info))
-            else:
-                meop.status_info('skip', max_title, len(info))
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} fabric routing. FC Routing: {switch_params_sr["FC_Router"]}' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        # only FC routers are checked
+        skip_lst = (switch_params_df["FC_Router"] != 'ON').tolist()
+        meop.switch_config_extract(current_config_extract, 
+                                    [san_fcrfabric_lst, san_fcrproxydev_lst, san_fcrphydev_lst, san_lsan_lst, 
+                                        san_fcredge_lst, san_fcrresource_lst, san_fcrxlateconfig_lst], 
+                                    pattern_dct, switch_params_lst, info_lst, max_title, 
+                                    fcrresource_params, skip_lst=skip_lst,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
 
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'fcrfabric_columns', 'fcrproxydev_columns', 'fcrphydev_columns', 
@@ -93,11 +87,18 @@ def fcr_membership_extract(switch_params_df, project_constants_lst):
     return fcrfabric_df, fcrproxydev_df, fcrphydev_df, lsan_df, fcredge_df, fcrresource_df, fcrxlateconfig_df
 
 
-def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san_fcrresource_lst, san_fcrxlateconfig_lst, 
-                            fcrdev_dct, pattern_dct, switch_params_sr, fcrresource_params):
+def current_config_extract(san_fcrfabric_lst, san_fcrproxydev_lst, san_fcrphydev_lst, san_lsan_lst, 
+                            san_fcredge_lst, san_fcrresource_lst, san_fcrxlateconfig_lst, 
+                            pattern_dct, switch_params_sr, fcrresource_params):
     """Function to extract values from current switch confguration file. 
     Returns list with extracted values"""
 
+    # dictionary to collect fcr device data
+    # first element of list is regular expression pattern name of line where section is started,
+    # second - is the list to collect data, 
+    fcrdev_dct = {'fcrproxydev': ['switchcmd_fcrproxydevshow', san_fcrproxydev_lst], 
+                    'fcrphydev': ['switchcmd_fcrphydevshow', san_fcrphydev_lst]}
+
     switch_info_keys = ['configname', 'chassis_name', 'chassis_wwn', 'switch_index', 
                         'SwitchName', 'switchWwn', 'switchRole', 'Fabric_ID', 'FC_Router']
     switch_info_lst = [switch_params_sr[key] for key in switch_info_keys]
@@ -115,10 +116,12 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
     if fc_router == 'ON':
         # fcrouter_info_lst contains sshow_file, chassis_name, switch_index, switch_name, switch_fid
         fcrouter_info_lst = [*switch_info_lst[:6], switch_info_lst[7]]                                        
+        sshow_index = siop.get_sshow_index(sshow_file)
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()
+                # lines which can't start any section are skipped
+                line = siop.goto_next_landmark(file, sshow_index)
                 if not line:
                     break
                 # check configs of Principal switches only                        
@@ -126,7 +129,7 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
                     # fcrfabricshow section start
                     if re.search(pattern_dct['switchcmd_fcrfabricshow'], line) and not collected['fcrfabric']:
                         collected['fcrfabric'] = True
-                        line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid)
+                        line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid, sshow_index)
                         line = fcrfabricshow_section_extract(san_fcrfabric_lst, pattern_dct, 
                                                                 fcrouter_info_lst, line, file)
                     # fcrfabricshow section end
@@ -136,7 +139,7 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
                         switchcmd_pattern_name, san_fcrdev_lst = fcrdev_dct[fcrdev_type]
                         if re.search(pattern_dct[switchcmd_pattern_name], line) and not collected[fcrdev_type]:
                             collected[fcrdev_type] = True                                    
-                            line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid)
+                            line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid, sshow_index)
                             line = reop.extract_list_from_line(san_fcrdev_lst, pattern_dct, 
                                                                 line, file, extract_pattern_name=fcrdev_type, 
                                                                 line_add_values=fcrouter_info_lst)
@@ -144,7 +147,7 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
                     # lsanzoneshow section start
                     if re.search(pattern_dct['switchcmd_lsanzoneshow'], line) and not collected['lsanzone']:
                         collected['lsanzone'] = True
-                        line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid)
+                        line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid, sshow_index)
                         line = lsanzoneshow_section_extract(san_lsan_lst, pattern_dct, fcrouter_info_lst,
                                                             line, file)
                     # lsanzoneshow section end
@@ -152,7 +155,7 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
                 # fcredgeshow section start
                 if re.search(pattern_dct['switchcmd_fcredgeshow'], line) and not collected['fcredge']:
                     collected['fcredge'] = True
-                    line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid)
+                    line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid, sshow_index)
                     line, sw_fcredge_lst = reop.extract_list_from_line(san_fcredge_lst, pattern_dct, 
                                                         line, file, extract_pattern_name='fcredgeshow',
                                                         save_local=True, line_add_values=fcrouter_info_lst)
@@ -160,7 +163,7 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
                 # fcrxlateconfig section start
                 if re.search(pattern_dct['switchcmd_fcrxlateconfig'], line) and not collected['fcrxlateconfig']:
                     collected['fcrxlateconfig'] = True
-                    line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid)
+                    line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid, sshow_index)
                     line = reop.extract_list_from_line(san_fcrxlateconfig_lst, pattern_dct, 
                                                         line, file, extract_pattern_name='fcrxlateconfig',
                                                         line_add_values=fcrouter_info_lst)
@@ -168,7 +171,7 @@ def current_config_extract(san_fcrfabric_lst, san_lsan_lst, san_fcredge_lst, san
                 # fcrresourceshow section start
                 if re.search(pattern_dct['switchcmd_fcrresourceshow'], line) and not collected['fcrresource']:
                     collected['fcrresource'] = True
-                    line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid)
+                    line = goto_baseswitch_context_fid(ls_mode_on, line, file, fid, sshow_index)
                     line = fcrresourceshow_section_extract(san_fcrresource_lst, pattern_dct,
                                                             fcrouter_info_lst, fcrresource_params,
                                                             line, file)
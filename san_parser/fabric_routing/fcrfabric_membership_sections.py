@@ -6,13 +6,17 @@ import re
 
 import utilities.data_structure_operations as dsop
 import utilities.regular_expression_operations as reop
+import utilities.sshow_index_operations as siop
 
 
-def goto_baseswitch_context_fid(ls_mode_on, line, file, fid):
+def goto_baseswitch_context_fid(ls_mode_on, line, file, fid, sshow_index=None):
     """Function to move cursor to the fid context 
-    within section of the corresponding command if Logical switch mode is ON"""
+    within section of the corresponding command if Logical switch mode is ON.
+    If sshow_index is passed cursor is moved with base switch context offsets from the index"""
 
-    if ls_mode_on:
+    if ls_mode_on and sshow_index:
+        line = siop.goto_baseswitch_context(file, sshow_index, fid)
+    elif ls_mode_on:
         while not re.search(fr'^BASE +SWITCH +CONTEXT *-- *FID: *{fid} *$',line):
             line = file.readline()
             if not line:
@@ -27,15 +31,15 @@ def fcrfabricshow_section_extract(san_fcrfabric_lst, pattern_dct, fcrouter_info_
 
     while not re.search(pattern_dct['switchcmd_end'], line):
         line = file.readline()
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line)
         # fc_router_match'
         if match_dct['fc_router']:                                   
             fcrouter_params_lst = dsop.line_to_list(pattern_dct['fc_router'], line)
             # check if line is empty                                    
             while not re.match('\r?\n', line):
                 line = file.readline()
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                match_dct = reop.match_line(pattern_dct, line)
                 # fcr_info_match
                 if match_dct['fcr_info']:
                     fcrouter_name = match_dct['fcr_info'].group(1)
@@ -57,7 +61,7 @@ def lsanzoneshow_section_extract(san_lsan_lst, pattern_dct, fcrouter_info_lst,
     for the base switch context fid from the sshow file"""
 
     while not re.search(pattern_dct['switchcmd_end'], line):
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # lsan_name_match
         if match_dct['lsan_name']:
             # switch_info and current connected device wwnp
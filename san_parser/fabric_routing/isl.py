@@ -9,6 +9,7 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.sshow_index_operations as siop
 
 from .isl_sections import lsdbshow_section_extract
 
@@ -47,18 +48,17 @@ def interswitch_connection_extract(switch_params_df, project_constants_lst):
         san_lsdb_lst = []
 
         # checking each switch for switch level parameters
-        for i, switch_params_sr in switch_params_df.iterrows():
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} isl, trunk and trunk area ports. Switch mode: {switch_params_sr["switchMode"]}'
-            print(info, end =" ")   
-
-            if switch_params_sr["switchMode"] == 'Native':
-                sw_isl_lst = current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, san_lsdb_lst, pattern_dct, 
-                                        switch_params_sr, lsdb_params)
-                meop.show_collection_status(sw_isl_lst, max_title, len(info))
-            # if switch in Access Gateway mode then skip
-            else:
-                meop.status_info('skip', max_title, len(info))        
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} isl, trunk and trunk area ports. Switch mode: {switch_params_sr["switchMode"]}' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        # if switch in Access Gateway mode then skip
+        skip_lst = (switch_params_df["switchMode"] != 'Native').tolist()
+        meop.switch_config_extract(current_config_extract, 
+                                    [san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, san_lsdb_lst], 
+                                    pattern_dct, switch_params_lst, info_lst, max_title, 
+                                    lsdb_params, skip_lst=skip_lst,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'isl_columns', 'trunk_columns', 'porttrunkarea_columns', 'lsdb_columns')
         data_lst = dfop.list_to_dataframe(headers_lst, san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, san_lsdb_lst)
@@ -91,16 +91,18 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
     collected = {'isl': False, 'trunk': False, 'trunkarea': False, 'lsdb': False}
 
     if switch_mode == 'Native':
+        sshow_index = siop.get_sshow_index(sshow_file)
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()                        
+                # lines which can't start any section are skipped
+                line = siop.goto_next_landmark(file, sshow_index)
                 if not line:
                     break
                 # isl section start   
                 if re.search(pattern_dct['switchcmd_islshow'], line) and not collected['isl']:
                     collected['isl'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_isl_lst = reop.extract_list_from_line(san_isl_lst, pattern_dct, line, file, 
                                                                     extract_pattern_name='islshow', 
                                                                     save_local=True, line_add_values=switch_info_lst[:-1])                               
@@ -109,7 +111,7 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
                 # switchcmd_trunkshow_comp
                 elif re.search(pattern_dct['switchcmd_trunkshow'], line) and not collected['trunk']:
                     collected['trunk'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = reop.extract_list_from_line(san_trunk_lst, pattern_dct, line, file, 
                                                         extract_pattern_name='trunkshow', 
                                                         first_line_skip=False, line_add_values=switch_info_lst[:-1])
@@ -117,7 +119,7 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
                 # porttrunkarea section start
                 elif re.search(pattern_dct['switchcmd_trunkarea'], line) and not collected['trunkarea']:
                     collected['trunkarea'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = reop.extract_list_from_line(san_porttrunkarea_lst, pattern_dct, line, file, 
                                                         extract_pattern_name='porttrunkarea', 
                                                         line_add_values=switch_info_lst[:6])
@@ -125,7 +127,7 @@ def current_config_extract(san_isl_lst, san_trunk_lst, san_porttrunkarea_lst, sa
                 # lsdb section start
                 elif re.search(pattern_dct['switchcmd_lsdbshow'], line) and not collected['lsdb']:
                     collected['lsdb'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line = lsdbshow_section_extract(san_lsdb_lst, pattern_dct, switch_info_lst, lsdb_params, line, file)
                 # lsdb section end
     return sw_isl_lst
@@ -10,6 +10,7 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.sshow_index_operations as siop
 
 from .nameserver_sections import (nsshow_file_extract,
                                   san_device_ports_section_extract)
@@ -53,14 +54,15 @@ def connected_devices_extract(switch_params_df, project_constants_lst):
         # list with zoning enforcement information (HARD WWN,  HARD PORT, etc) in san
         san_nsportshow_lst = []
         
-        for i, switch_params_sr in switch_params_df.iterrows():       
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} connected devices'
-            print(info, end =" ")
-            sw_fdmi_lst = current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_nsportshow_lst, 
-                                                    pattern_dct, switch_params_sr,
-                                                    fdmi_params, fdmi_params_add, nsshow_params, nsshow_params_add)                   
-            meop.show_collection_status(sw_fdmi_lst, max_title, len(info))
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} connected devices' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        meop.switch_config_extract(current_config_extract, 
+                                    [san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_nsportshow_lst], 
+                                    pattern_dct, switch_params_lst, info_lst, max_title, 
+                                    fdmi_params, fdmi_params_add, nsshow_params, nsshow_params_add,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
         
         nsshow_folder = report_requisites_sr['switch_nsshow_folder']
         # check files in dedicated nsshow folder
@@ -108,16 +110,18 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
     collected = {'fdmi': False, 'nsshow': False, 'nscamshow': False, 'nsportshow': False} \
         if switch_mode == 'Native' else {'fdmi': False, 'nsportshow': False}
 
+    sshow_index = siop.get_sshow_index(sshow_file)
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()                        
+            # lines which can't start any section are skipped
+            line = siop.goto_next_landmark(file, sshow_index)
             if not line:
                 break
             # fdmi section start   
             if re.search(pattern_dct['switchcmd_fdmishow'], line) and not collected['fdmi']:
                 collected['fdmi'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line, sw_fdmi_lst = san_device_ports_section_extract(san_fdmi_lst, pattern_dct, line, file, 
                                                                         switch_info_lst, fdmi_params, fdmi_params_add,
                                                                         device_start_pattern_name='wwpn', 
@@ -127,7 +131,7 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
             # ns_portshow section start (zoning_enforcement information (HARD WWN,  HARD PORT, etc)) 
             elif re.search(pattern_dct['switchcmd_nsportshow'], line) and not collected['nsportshow']:
                 collected['nsportshow'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line, sw_nsportshow_lst = reop.extract_list_from_line(san_nsportshow_lst, pattern_dct, line, file, 
                                                                         extract_pattern_name='ns_portshow', 
                                                                         save_local=True, line_add_values=switch_info_lst[:6])                                               
@@ -137,7 +141,7 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
                 # nsshow section start
                 if re.search(pattern_dct['switchcmd_nsshow'], line) and not collected['nsshow']:
                     collected['nsshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_nsshow_lst = san_device_ports_section_extract(san_nsshow_lst, pattern_dct, line, file, 
                                                                             switch_info_lst, nsshow_params, nsshow_params_add,
                                                                             device_start_pattern_name='port_pid', 
@@ -145,7 +149,7 @@ def current_config_extract(san_fdmi_lst, san_nsshow_lst, san_nscamshow_lst, san_
                 # nscamshow section start
                 elif re.search(pattern_dct['switchcmd_nscamshow'], line) and not collected['nscamshow']:
                     collected['nscamshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                     line, sw_nscamshow_lst = san_device_ports_section_extract(san_nscamshow_lst, pattern_dct, line, file, 
                                                                                 switch_info_lst, nsshow_params, nsshow_params_add,
                                                                                 device_start_pattern_name='port_pid', 
@@ -20,7 +20,7 @@ def san_device_ports_section_extract(san_device_ports_lst, pattern_dct, line, fi
     switch_device_ports_lst = []
 
     while not re.search(pattern_dct[cmd_stop_pattern_name], line):
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         if match_dct[device_start_pattern_name]:
             # dictionary to store current port information
             san_device_ports_dct = {}
@@ -49,7 +49,7 @@ def nsshow_file_extract(nsshow_file, san_nsshow_manual_lst, pattern_dct, nsshow_
     with open(nsshow_file, encoding='utf-8', errors='ignore') as file:
         line = file.readline()
         while line:
-            match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+            match_dct = reop.match_line(pattern_dct, line)
             # port_pid_match
             if match_dct['port_pid']:
                 # dictionary to store all DISCOVERED switch ports information
@@ -1,5 +1,9 @@
 """Main module to extract data from switch, blade system, synergy system, 3PAR configuration files"""
 
+from functools import partial
+
+import utilities.registry_operations as rgop
+
 from .bladesystem import blade_system_extract, synergy_system_extract
 from .fabric_routing import (fabric_membership_extract, fcr_membership_extract,
                              interswitch_connection_extract)
@@ -13,60 +17,60 @@ from .switch_ports import portcfg_sfp_extract, portcmd_extract
 
 
 def system_configuration_extract(parsed_sshow_maps_lst, project_constants_lst, software_path_sr):
-    """Main function to extract system configuration files"""
+    """Main function to extract system configuration files.
+    Returns data registry with loaders for extracted data. Configuration data is extracted 
+    (or loaded from the database) on the first request of any data of the extraction function"""
+
+    extracted_data_registry = rgop.create_data_registry()
+    register_loader = partial(rgop.register_data_loader, extracted_data_registry)
 
     # chassis parameters parsing
-    chassis_params_df, slot_status_df, licenseport_df, chassisshow_df = chassis_params_extract(parsed_sshow_maps_lst, project_constants_lst)
+    register_loader(['chassis_params_df', 'slot_status_df', 'licenseport_df', 'chassisshow_df'], 
+                    partial(chassis_params_extract, parsed_sshow_maps_lst, project_constants_lst))
     # maps parameters parsing
-    maps_params_df = maps_params_extract(parsed_sshow_maps_lst, project_constants_lst)
+    register_loader(['maps_params_df'], partial(maps_params_extract, parsed_sshow_maps_lst, project_constants_lst))
     # switch parameters parsing
-    switch_params_df, switchshow_ports_df = switch_params_extract(chassis_params_df, project_constants_lst)
+    register_loader(['switch_params_df', 'switchshow_ports_df'], 
+                    partial(switch_params_extract, project_constants_lst=project_constants_lst), 'chassis_params_df')
     # fabric membership pasing (AG swithe information extracted from Principal switches)
-    fabricshow_df, ag_principal_df = fabric_membership_extract(switch_params_df, project_constants_lst)
+    register_loader(['fabricshow_df', 'ag_principal_df'], 
+                    partial(fabric_membership_extract, project_constants_lst=project_constants_lst), 'switch_params_df')
     # portshow statistics parsing
-    portshow_df = portcmd_extract(chassis_params_df, project_constants_lst)
+    register_loader(['portshow_df'], 
+                    partial(portcmd_extract, project_constants_lst=project_constants_lst), 'chassis_params_df')
     # port sfp and cfg parsing
-    sfpshow_df, portcfgshow_df = portcfg_sfp_extract(switch_params_df, project_constants_lst)
+    register_loader(['sfpshow_df', 'portcfgshow_df'], 
+                    partial(portcfg_sfp_extract, project_constants_lst=project_constants_lst), 'switch_params_df')
     # nameserver parsing
-    fdmi_df, nsshow_df, nscamshow_df, nsshow_dedicated_df, nsportshow_df = connected_devices_extract(switch_params_df, project_constants_lst)
+    register_loader(['fdmi_df', 'nsshow_df', 'nscamshow_df', 'nsshow_dedicated_df', 'nsportshow_df'], 
+                    partial(connected_devices_extract, project_constants_lst=project_constants_lst), 'switch_params_df')
     # inter switch connection parsing
-    isl_df, trunk_df, porttrunkarea_df, lsdb_df = interswitch_connection_extract(switch_params_df, project_constants_lst)
+    register_loader(['isl_df', 'trunk_df', 'porttrunkarea_df', 'lsdb_df'], 
+                    partial(interswitch_connection_extract, project_constants_lst=project_constants_lst), 'switch_params_df')
     # fabric routing parsing
-    fcrfabric_df, fcrproxydev_df, fcrphydev_df, lsan_df, fcredge_df, fcrresource_df, fcrxlateconfig_df = \
-        fcr_membership_extract(switch_params_df, project_constants_lst)
+    register_loader(['fcrfabric_df', 'fcrproxydev_df', 'fcrphydev_df', 'lsan_df', 'fcredge_df', 'fcrresource_df', 'fcrxlateconfig_df'], 
+                    partial(fcr_membership_extract, project_constants_lst=project_constants_lst), 'switch_params_df')
     # zoning configuration parsing
-    cfg_df, zone_df, alias_df, cfg_effective_df, zone_effective_df, peerzone_df, peerzone_effective_df = \
-        zoning_extract(switch_params_df, project_constants_lst)
+    register_loader(['cfg_df', 'zone_df', 'alias_df', 'cfg_effective_df', 'zone_effective_df', 'peerzone_df', 'peerzone_effective_df'], 
+                    partial(zoning_extract, project_constants_lst=project_constants_lst), 'switch_params_df')
     # switch sensors parsing
-    sensor_df = sensor_extract(chassis_params_df, project_constants_lst)
+    register_loader(['sensor_df'], 
+                    partial(sensor_extract, project_constants_lst=project_constants_lst), 'chassis_params_df')
     # error log parsing
-    errdump_df = log_extract(chassis_params_df, project_constants_lst)
+    register_loader(['errdump_df'], 
+                    partial(log_extract, project_constants_lst=project_constants_lst), 'chassis_params_df')
     # blade system configuration parsing
-    blade_module_df, blade_servers_df, blade_vc_df = blade_system_extract(project_constants_lst)
+    register_loader(['blade_module_df', 'blade_servers_df', 'blade_vc_df'], 
+                    partial(blade_system_extract, project_constants_lst))
     # synergy system configuration parsing
-    synergy_module_df, synergy_servers_df = synergy_system_extract(project_constants_lst)
+    register_loader(['synergy_module_df', 'synergy_servers_df'], 
+                    partial(synergy_system_extract, project_constants_lst))
     # 3PAR storage system configuration download and parsing
-    system_3par_df, port_3par_df, host_3par_df = \
-            storage_3par_extract(nsshow_df, nscamshow_df, project_constants_lst, software_path_sr)
-
+    register_loader(['system_3par_df', 'port_3par_df', 'host_3par_df'], 
+                    partial(storage_3par_extract, project_constants_lst=project_constants_lst, software_path_sr=software_path_sr), 
+                    'nsshow_df', 'nscamshow_df')
     # Huawei OceanStor storage system configuration download and parsing
-    system_oceanstor_df, port_oceanstor_df, host_oceanstor_df, \
-        host_id_name_oceanstor_df, host_id_fcinitiator_oceanstor_df, hostid_ctrlportid_oceanstor_df \
-            = storage_oceanstor_extract(project_constants_lst)
-
-    extracted_configuration_lst = [chassis_params_df, slot_status_df, licenseport_df, chassisshow_df, 
-                                    maps_params_df, switch_params_df, switchshow_ports_df,
-                                    fabricshow_df, ag_principal_df, 
-                                    portshow_df, sfpshow_df, portcfgshow_df,
-                                    fdmi_df, nsshow_df, nscamshow_df, nsshow_dedicated_df, nsportshow_df,
-                                    isl_df, trunk_df, porttrunkarea_df, lsdb_df,
-                                    fcrfabric_df, fcrproxydev_df, fcrphydev_df, lsan_df, fcredge_df, fcrresource_df, fcrxlateconfig_df,
-                                    cfg_df, zone_df, alias_df, cfg_effective_df, zone_effective_df, peerzone_df, peerzone_effective_df,
-                                    sensor_df, errdump_df,
-                                    blade_module_df, blade_servers_df, blade_vc_df,
-                                    synergy_module_df, synergy_servers_df,
-                                    system_3par_df, port_3par_df, host_3par_df,
-                                    system_oceanstor_df, port_oceanstor_df, host_oceanstor_df,
-                                    host_id_name_oceanstor_df, host_id_fcinitiator_oceanstor_df, hostid_ctrlportid_oceanstor_df]
-    return extracted_configuration_lst
-        
\ No newline at end of file
+    register_loader(['system_oceanstor_df', 'port_oceanstor_df', 'host_oceanstor_df', 
+                     'host_id_name_oceanstor_df', 'host_id_fcinitiator_oceanstor_df', 'hostid_ctrlportid_oceanstor_df'], 
+                    partial(storage_oceanstor_extract, project_constants_lst))
+    return extracted_data_registry
@@ -66,20 +66,15 @@ def storage_3par_extract(nsshow_df, nscamshow_df, project_constants_lst, softwar
                 # number of files to check
                 configs_num = len(configs_3par_lst)  
 
-                for i, config_3par in enumerate(configs_3par_lst):       
-                    # file name
-                    configname = os.path.basename(config_3par)
-                    # current operation information string
-                    info = f'[{i+1} of {configs_num}]: {configname} system'
-                    print(info, end =" ")
-                    showsys_lst, port_lst, host_lst = storage_params_extract(config_3par, system_params, system_params_add, pattern_dct)
-                    san_system_3par_lst.extend(showsys_lst)
-                    san_port_3par_lst.extend(port_lst)
-                    san_host_3par_lst.extend(host_lst)
-                    if port_lst or host_lst:
-                        meop.status_info('ok', max_title, len(info))
-                    else:
-                        meop.status_info('no data', max_title, len(info))
+                # each config file is fingerprinted and extracted only if it's new or changed since previous extraction
+                config_file_lst = [[config_3par] for config_3par in configs_3par_lst]
+                # current operation information strings
+                info_lst = [f'[{i+1} of {configs_num}]: {os.path.basename(config_3par)} system' 
+                            for i, config_3par in enumerate(configs_3par_lst)]
+                meop.switch_config_extract(current_config_extract, [san_system_3par_lst, san_port_3par_lst, san_host_3par_lst], 
+                                            pattern_dct, config_file_lst, info_lst, max_title, 
+                                            system_params, system_params_add, 
+                                            cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
         else:
             # current operation information string
             info = f'Collecting 3PAR storage systems information'
@@ -102,6 +97,20 @@ def storage_3par_extract(nsshow_df, nscamshow_df, project_constants_lst, softwar
     return system_3par_df, port_3par_df, host_3par_df
 
 
+def current_config_extract(san_system_3par_lst, san_port_3par_lst, san_host_3par_lst, 
+                            pattern_dct, config_3par_lst, system_params, system_params_add):
+    """Function to extract values from current 3PAR configuration file. 
+    Returns list with extracted port and host values to show collection status"""
+
+    config_3par, = config_3par_lst
+    showsys_lst, port_lst, host_lst = storage_params_extract(config_3par, system_params, system_params_add, pattern_dct)
+    san_system_3par_lst.extend(showsys_lst)
+    san_port_3par_lst.extend(port_lst)
+    san_host_3par_lst.extend(host_lst)
+    # if both lists are empty status_info shows NO_DATA for current file
+    return [port_lst[:1], host_lst[:1]]
+
+
 def verify_ns_3par(nsshow_df, nscamshow_df, pattern_dct):
     """Function to verify if 3PAR storage systems present in fabrics by checking
     local and cached Name Server DataFrames"""
@@ -2,8 +2,7 @@
 
 import os
 import re
-import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
 import numpy as np
@@ -11,7 +10,13 @@ import numpy as np
 import utilities.dataframe_operations as dfop
 import utilities.filesystem_operations as fsop
 import utilities.module_execution as meop
+import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
+from san_automation_constants import (STORAGE_DOWNLOAD_RETRIES,
+                                      STORAGE_DOWNLOAD_WORKERS)
+
+from .storage_3par_fetcher import (copy_local_configs, fetch_config,
+                                   get_stats_fetcher)
 
 
 def configs_download(ns_3par_df, pattern_dct, project_constants_lst, software_path_sr):
@@ -54,7 +59,7 @@ def configs_download(ns_3par_df, pattern_dct, project_constants_lst, software_pa
         reply = meop.reply_request(query)
         if reply == 'y':
             # download configs from STATs
-            ns_3par_df = stats_download(ns_3par_df, download_folder, software_path_sr, max_title)
+            ns_3par_df = stats_download(ns_3par_df, download_folder, get_stats_fetcher(software_path_sr), max_title)
         else:
             print('STATs is only available within HPE network.')
 
@@ -114,9 +119,11 @@ def remove_files(files_lst, max_title):
     print('\n')
 
 
-def stats_download(ns_3par_df, download_folder, software_path_sr, max_title):
+def stats_download(ns_3par_df, download_folder, fetcher, max_title):
     """Function to download 3PAR configuration files from STATs with
-    help of s3mft program"""
+    help of fetcher (s3mft program or local folder fetcher). 
+    Configuration files are downloaded in STORAGE_DOWNLOAD_WORKERS threads, 
+    download status is displayed in ns_3par_df order"""
 
     # verify if download folder exist and create one if not (default behaviour)
     verify_download_folder(download_folder, max_title)
@@ -124,58 +131,34 @@ def stats_download(ns_3par_df, download_folder, software_path_sr, max_title):
     sn_lst = ns_3par_df['Serial_Number'].tolist()
     model_lst = ns_3par_df['System_Model'].tolist()
 
-    # s3mft_path = os.path.join(S3MFT_DIR, S3MFT)
-    # s3mft_path = os.path.normpath(s3mft_path)
-    s3mft_path = software_path_sr['s3mft']
-
     today = date.today().strftime("%y%m%d")
     yesterday = (date.today() - timedelta(1)).strftime("%y%m%d")
 
     print('\n')
 
-    for i, (model, sn) in enumerate(zip(model_lst, sn_lst)):
-        info = ' '*16 + f'[{i+1} of {len(sn_lst)}]: Downloading config for {model} {sn}'
-        print(info, end=" ")
-
-        # request for latest 3par config file
-        # config_str = subprocess.check_output(f'"{s3mft_path}" -n {sn} -p config -stlatest', shell=True, text=True)
-        output = subprocess.run(f'"{s3mft_path}" -n {sn} -stlatest -filetype config -quiet', text=True, capture_output=True)
-
-        # if s3mft was not able to retreive config filename
-        if output.returncode:
-            if 'no data found' in output.stderr:
-                config = None
-                status = meop.status_info('no data', max_title, len(info))
-            else:
+    with ThreadPoolExecutor(max_workers=max(STORAGE_DOWNLOAD_WORKERS, 1)) as executor:
+        download_lst = [executor.submit(fetch_config, fetcher, sn, download_folder, 
+                                        [today, yesterday], STORAGE_DOWNLOAD_RETRIES) for sn in sn_lst]
+        # results are taken in 3PAR order to display status lines in ns_3par_df order
+        for i, (model, sn, download) in enumerate(zip(model_lst, sn_lst, download_lst)):
+            info = ' '*16 + f'[{i+1} of {len(sn_lst)}]: Downloading config for {model} {sn}'
+            print(info, end=" ")
+            status, config, error = download.result()
+            # if fetcher was not able to retreive config filename
+            if status == 'error':
                 meop.status_info('fail', max_title, len(info))
-                print(output.stderr)
+                print(error)
+                executor.shutdown(cancel_futures=True)
                 exit()
-        else:
-            output_str = output.stdout.strip('\n')
-            *_, config = output_str.split('\n')
-
-            # download configs within one day only
-            if today in config or yesterday in config:
-                # download config if it's exist
-                download =  subprocess.run(fr'"{s3mft_path}" -filename "{config}" -fnp -fo -outdir "{download_folder}" -quiet', shell=True, capture_output=True)
-                # verify if file exist (downloaded) and return corresponnding status
-                config_filename = os.path.basename(config)
-                config_filename = 'array_' + sn + '_' + config_filename
-                config_file = os.path.join(download_folder, config_filename)        
-                if not download.returncode and os.path.isfile(config_file):
-                    status = meop.status_info('ok', max_title, len(info))
-                else:
-                    status = meop.status_info('fail', max_title, len(info))
-            else:
-                status = meop.status_info('skip', max_title, len(info))
-        
-        ns_3par_df.loc[i, ['configname', 'STATs_status']] = [config, status.lower()]
+            status = meop.status_info(status, max_title, len(info))
+            ns_3par_df.loc[i, ['configname', 'STATs_status']] = [config, status.lower()]
     return ns_3par_df
 
 
 def local_download(ns_3par_df, configs_local_lst, download_folder, pattern_dct, max_title):
     """Function to copy 3PAR configuration files from local folder
-    to download folder"""
+    to download folder. Configuration files are parsed and copied in STORAGE_DOWNLOAD_WORKERS threads
+    (files of the same 3PAR are copied one by one), copy status is displayed in configs_local_lst order"""
 
     # verifu if download folder exist and create one if not (default behaviour)
     verify_download_folder(download_folder, max_title)
@@ -189,38 +172,48 @@ def local_download(ns_3par_df, configs_local_lst, download_folder, pattern_dct,
     ns_3par_df[['filename', 'Local_status']] = np.nan
 
     sn_lst = ns_3par_df['Serial_Number'].tolist()
-
-    print('\n')
-    # copy files from configs_local_lst to download folder
-    for i, source_file in enumerate(configs_local_lst):
-        filename = os.path.basename(source_file)
-        if os.path.isfile(source_file) or os.path.islink(source_file):
-            # extract model and seral number from config file
-            model, sn = parse_serial(source_file, pattern_dct)
+    # serial numbers of 3PARs downloaded from STATs
+    stats_ok_sn_lst = ns_3par_df.loc[ns_3par_df['STATs_status'] == 'ok', 'Serial_Number'].tolist()
+
+    with ThreadPoolExecutor(max_workers=max(STORAGE_DOWNLOAD_WORKERS, 1)) as executor:
+        # extract model and seral number from each config file
+        config_exist_lst = [os.path.isfile(source_file) or os.path.islink(source_file) for source_file in configs_local_lst]
+        serial_lst = list(executor.map(lambda source_file, exist: parse_serial(source_file, pattern_dct) if exist else (None, None), 
+                                       configs_local_lst, config_exist_lst))
+        # config files to copy for each 3PAR which is in NameServer and was not downloaded from STATs
+        sn_source_files_dct = {}
+        for source_file, exist, (_, sn) in zip(configs_local_lst, config_exist_lst, serial_lst):
+            if exist and sn in sn_lst and not sn in stats_ok_sn_lst:
+                sn_source_files_dct.setdefault(sn, []).append(source_file)
+        # files of each 3PAR are copied until one of them is copied
+        copy_dct = {sn: executor.submit(copy_local_configs, source_file_lst, download_folder, STORAGE_DOWNLOAD_RETRIES) 
+                        for sn, source_file_lst in sn_source_files_dct.items()}
+
+        print('\n')
+        # copy status for each source file
+        copy_status_dct = {}
+        for i, (source_file, exist, (model, sn)) in enumerate(zip(configs_local_lst, config_exist_lst, serial_lst)):
+            filename = os.path.basename(source_file)
+            if not exist:
+                info = ' '*16 + f'[{i+1} of {len(configs_local_lst)}]: copying {filename}'
+                print(info, end=' ')
+                meop.status_info('skip', max_title, len(info))
+                continue
             info = ' '*16 + f'[{i+1} of {len(configs_local_lst)}]: Copying {filename} for {model} {sn}'
             print(info, end=' ')
-            # verify if config for current sn was downloaded from STATs or local folder before
+            if sn in copy_dct and not sn in copy_status_dct:
+                copy_status_dct[sn] = dict(zip(sn_source_files_dct[sn], copy_dct[sn].result()))
+            status, error = copy_status_dct.get(sn, {}).get(source_file, (None, None))
+            # config is not copied if 3par is not in NameServer or was downloaded from STATs or local folder before
+            if status is None:
+                meop.status_info('skip', max_title, len(info))
+                continue
+            status = meop.status_info(status, max_title, len(info))
+            if error:
+                print('\n')
+                print(error)
             mask_sn = ns_3par_df['Serial_Number'] == sn
-            status_ok = (ns_3par_df.loc[mask_sn, ['STATs_status', 'Local_status']] == 'ok').any().any()
-            # copy config if 3par is in NameServer and was not downloaded from STATs or local folder before
-            if sn in sn_lst and not status_ok:
-                # destination_file = os.path.join(download_folder, filename)
-                status = 'unknown'
-                try:
-                    shutil.copy2(source_file, download_folder)
-                    status = meop.status_info('ok', max_title, len(info))
-                except shutil.Error as e:
-                    status = meop.status_info('failed', max_title, len(info))
-                    print('\n')
-                    print(e)
-                finally:
-                    ns_3par_df.loc[mask_sn, ['filename', 'Local_status']] = [filename, status.lower()]
-            else:
-                status = meop.status_info('skip', max_title, len(info))
-        else:
-            info = ' '*16 + f'[{i+1} of {len(configs_local_lst)}]: copying {filename}'
-            print(info, end=' ')
-            meop.status_info('skip', max_title, len(info))
+            ns_3par_df.loc[mask_sn, ['filename', 'Local_status']] = [filename, status.lower()]
     
     if drop_stats_column:
         ns_3par_df.drop(columns=['STATs_status'], inplace=True)
@@ -248,8 +241,8 @@ def parse_serial(config_3par, pattern_dct):
                 # while not reach empty line
                 while not re.search(pattern_dct['section_end'],line):
                     line = file.readline()
-                    # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-                    match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                    # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+                    match_dct = reop.match_line(pattern_dct, line)
                     # name_value_pair_match
                     if match_dct['serial_number']:
                         result = match_dct['serial_number']
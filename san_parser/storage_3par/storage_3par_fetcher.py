@@ -0,0 +1,135 @@
+"""Auxiliary module for storage_3par_download module with 3PAR configuration fetchers.
+Fetcher is dictionary with 'find_config' and 'download_config' functions:
+find_config(sn) returns (status, config, error) for the latest configuration of the 3PAR with serial number sn
+(status is 'ok', 'no data' or 'fail'),
+download_config(config, sn, download_folder) returns (status, error) after configuration is downloaded
+to the download_folder as 'array_<sn>_<config filename>' file (status is 'ok' or 'fail').
+Fetcher is selected with software paths from the 'software' sheet of the report_info.xlsx file:
+'s3mft' - path to s3mft program to download configurations from STATs,
+'stats_folder' (optional) - folder with 3PAR configuration files used instead of STATs 
+(directory column is the folder path, file column is empty)"""
+
+import os
+import shutil
+import subprocess
+
+
+def get_stats_fetcher(software_path_sr):
+    """Function returns fetcher to download 3PAR configuration files.
+    If optional 'stats_folder' path is defined in software_path_sr ('stats_folder' row 
+    in the 'software' sheet of the report_info.xlsx file) then configuration files are taken from
+    this folder (offline STATs stand-in) otherwise configuration files are downloaded from STATs with s3mft
+    ('s3mft' path in software_path_sr)"""
+
+    stats_folder = software_path_sr.get('stats_folder')
+    if isinstance(stats_folder, str) and stats_folder:
+        return create_folder_fetcher(stats_folder)
+    return create_s3mft_fetcher(software_path_sr['s3mft'])
+
+
+def create_s3mft_fetcher(s3mft_path):
+    """Function returns fetcher to download 3PAR configuration files from STATs with s3mft program"""
+
+    def find_config(sn):
+        """Function requests the latest 3PAR configuration filename from STATs"""
+
+        output = subprocess.run(f'"{s3mft_path}" -n {sn} -stlatest -filetype config -quiet', text=True, capture_output=True)
+        # if s3mft was not able to retreive config filename
+        if output.returncode:
+            if 'no data found' in output.stderr:
+                return 'no data', None, None
+            return 'fail', None, output.stderr
+        output_str = output.stdout.strip('\n')
+        *_, config = output_str.split('\n')
+        return 'ok', config, None
+
+    def download_config(config, sn, download_folder):
+        """Function downloads 3PAR configuration file from STATs and
+        verifies if file exist (downloaded)"""
+
+        download = subprocess.run(fr'"{s3mft_path}" -filename "{config}" -fnp -fo -outdir "{download_folder}" -quiet',
+                                  shell=True, capture_output=True)
+        config_file = get_config_file(config, sn, download_folder)
+        if not download.returncode and os.path.isfile(config_file):
+            return 'ok', None
+        return 'fail', download.stderr
+
+    return {'find_config': find_config, 'download_config': download_config}
+
+
+def create_folder_fetcher(stats_folder):
+    """Function returns fetcher to copy 3PAR configuration files from stats_folder.
+    The latest file (by modification time) with serial number in filename is considered
+    to be the latest 3PAR configuration. Used to download configurations without STATs access"""
+
+    def find_config(sn):
+        """Function finds the latest 3PAR configuration file in stats_folder"""
+
+        if not os.path.isdir(stats_folder):
+            return 'fail', None, f'Folder {stats_folder} not found'
+        config_lst = [entry.path for entry in os.scandir(stats_folder) if entry.is_file() and str(sn) in entry.name]
+        if not config_lst:
+            return 'no data', None, None
+        return 'ok', max(config_lst, key=os.path.getmtime), None
+
+    def download_config(config, sn, download_folder):
+        """Function copies 3PAR configuration file from stats_folder to the download_folder"""
+
+        try:
+            shutil.copy2(config, get_config_file(config, sn, download_folder))
+        except OSError as e:
+            return 'fail', str(e)
+        return 'ok', None
+
+    return {'find_config': find_config, 'download_config': download_config}
+
+
+def get_config_file(config, sn, download_folder):
+    """Function returns path of the downloaded 3PAR configuration file"""
+
+    config_filename = 'array_' + sn + '_' + os.path.basename(config)
+    return os.path.join(download_folder, config_filename)
+
+
+def fetch_config(fetcher, sn, download_folder, config_dates, retries=0):
+    """Function downloads the latest 3PAR configuration file with fetcher if config was created
+    on one of the config_dates. Failed requests are repeated retries times.
+    Returns (status, config, error) tuple (status is 'ok', 'no data', 'skip', 'fail' or 'error'
+    if fetcher is not able to request configuration)"""
+
+    for _ in range(retries + 1):
+        status, config, error = fetcher['find_config'](sn)
+        if status != 'fail':
+            break
+    if status == 'fail':
+        return 'error', config, error
+    if status == 'no data':
+        return status, config, error
+    # download configs within one day only
+    if not any(config_date in config for config_date in config_dates):
+        return 'skip', config, None
+    for _ in range(retries + 1):
+        status, error = fetcher['download_config'](config, sn, download_folder)
+        if status == 'ok':
+            break
+    return status, config, error
+
+
+def copy_local_configs(source_file_lst, download_folder, retries=0):
+    """Function copies local 3PAR configuration files of the single 3PAR to the download_folder.
+    Files are copied one by one until one of them is copied. Failed copies are repeated retries times.
+    Returns list of (status, error) tuples for each file in source_file_lst (status is 'ok', 'failed' or
+    None if file is not copied since configuration is already copied)"""
+
+    copy_status_lst = [(None, None)] * len(source_file_lst)
+    for i, source_file in enumerate(source_file_lst):
+        for _ in range(retries + 1):
+            try:
+                shutil.copy2(source_file, download_folder)
+                copy_status_lst[i] = ('ok', None)
+                break
+            except OSError as e:
+                copy_status_lst[i] = ('failed', e)
+        if copy_status_lst[i][0] == 'ok':
+            break
+    return copy_status_lst
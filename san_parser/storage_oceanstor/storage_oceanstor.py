@@ -57,33 +57,39 @@ def storage_oceanstor_extract(project_constants_lst):
             configs_num = len(oceanstor_configs_lst)
         
             if configs_num:
-                for i, storage_config in enumerate(oceanstor_configs_lst):       
-                    # file name with extension
-                    configname_wext = os.path.basename(storage_config)
-                    # remove extension from filename
-                    configname, _ = os.path.splitext(configname_wext)
-                    # current operation information string
-                    info = f'[{i+1} of {configs_num}]: {configname} file.'
-                    print(info, end =" ")
-                    # extract params from the current config file
-                    storage_oceanstore_lst, info, duplicated_configname  = storage_params_extract(storage_config, san_extracted_oceanstor_dct,
-                                                                                                    system_params, system_params_add, fcport_params, host_params, 
-                                                                                                    pattern_dct, info)                    
-                    # add current storage config data to the total storage configs
-                    for current_storage_lst, san_storage_lst in zip(storage_oceanstore_lst, 
-                                                                    [san_system_oceanstor_lst, san_fcport_oceanstor_lst, san_host_oceanstor_lst,
-                                                                     san_host_id_name_oceanstor_lst, san_host_id_fcinitiator_oceanstor_lst,
-                                                                     san_hostid_ctrlportid_oceanstor_lst]):
-                        if current_storage_lst:
-                            san_storage_lst.extend(current_storage_lst)
-                    
-                    if duplicated_configname:
+                # containers to store extracted data of all storage configs
+                san_storage_oceanstor_lst = [san_system_oceanstor_lst, san_fcport_oceanstor_lst, san_host_oceanstor_lst,
+                                             san_host_id_name_oceanstor_lst, san_host_id_fcinitiator_oceanstor_lst,
+                                             san_hostid_ctrlportid_oceanstor_lst]
+                # file names without extension
+                configname_lst = [os.path.splitext(os.path.basename(storage_config))[0] for storage_config in oceanstor_configs_lst]
+                # current operation information strings
+                info_lst = [f'[{i+1} of {configs_num}]: {configname} file.' for i, configname in enumerate(configname_lst)]
+                # each config file is fingerprinted and extracted only if it's new or changed since previous extraction
+                config_file_lst = [[storage_config] for storage_config in oceanstor_configs_lst]
+                # config files are extracted independently (in process pool if SAN_PARSER_WORKERS is more than one)
+                # and config duplication is verified in config files order
+                storage_config_results = meop.switch_config_results(current_config_extract, san_storage_oceanstor_lst, pattern_dct, 
+                                                                    config_file_lst, info_lst, 
+                                                                    system_params, system_params_add, fcport_params, host_params,
+                                                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
+                for configname, (info, storage_oceanstore_lst, (info_system, sn), _) in zip(configname_lst, storage_config_results):
+                    if info_system:
+                        print(info_system, end = " ")
+                        info = info + " " + info_system
+                    # check if storage config was extracted before (config duplication)
+                    if sn in san_extracted_oceanstor_dct:
                         meop.status_info('skip', max_title, len(info))
-                        print(f'Note. Duplication with extracted config {duplicated_configname}')
+                        print(f'Note. Duplication with extracted config {san_extracted_oceanstor_dct[sn]}')
                         print('\n')
-                    else:
-                        # show status if any configuration data is collected
-                        meop.show_collection_status(storage_oceanstore_lst, max_title, len(info))
+                        continue
+                    if sn is not None:
+                        san_extracted_oceanstor_dct[sn] = configname
+                    # add current storage config data to the total storage configs
+                    for current_storage_lst, san_storage_lst in zip(storage_oceanstore_lst, san_storage_oceanstor_lst):
+                        san_storage_lst.extend(current_storage_lst)
+                    # show status if any configuration data is collected
+                    meop.show_collection_status(storage_oceanstore_lst, max_title, len(info))
         else:
             # current operation information string
             info = f'Collecting OceanStor storage systems information'
@@ -114,4 +120,27 @@ def storage_oceanstor_extract(project_constants_lst):
         report.dataframe_to_excel(data_frame, data_name, project_constants_lst)            
     return san_system_oceanstor_df, san_fcport_oceanstor_df, san_host_oceanstor_df, \
         san_host_id_name_oceanstor_df, san_host_id_fcinitiator_oceanstor_df, san_hostid_ctrlportid_oceanstor_df
-            
\ No newline at end of file
+            
+
+
+def current_config_extract(san_system_oceanstor_lst, san_fcport_oceanstor_lst, san_host_oceanstor_lst, 
+                            san_host_id_name_oceanstor_lst, san_host_id_fcinitiator_oceanstor_lst, 
+                            san_hostid_ctrlportid_oceanstor_lst, pattern_dct, config_file_lst, 
+                            system_params, system_params_add, fcport_params, host_params):
+    """Function to extract values from current OceanStor configuration file. 
+    Returns list with system information string and storage serial number 
+    to verify config duplication"""
+
+    storage_config, = config_file_lst
+    # config is extracted independently from other configs thus it's not verified for duplication here
+    extracted_oceanstor_dct = {}
+    storage_oceanstore_lst, info_system, _ = storage_params_extract(storage_config, extracted_oceanstor_dct,
+                                                                    system_params, system_params_add, fcport_params, host_params, 
+                                                                    pattern_dct, info='')
+    for current_storage_lst, san_storage_lst in zip(storage_oceanstore_lst, 
+                                                    [san_system_oceanstor_lst, san_fcport_oceanstor_lst, san_host_oceanstor_lst,
+                                                     san_host_id_name_oceanstor_lst, san_host_id_fcinitiator_oceanstor_lst,
+                                                     san_hostid_ctrlportid_oceanstor_lst]):
+        san_storage_lst.extend(current_storage_lst)
+    sn = next(iter(extracted_oceanstor_dct), None)
+    return [info_system.strip(), sn]
@@ -56,7 +56,6 @@ def storage_params_extract(storage_config, san_extracted_oceanstor_dct,
             if re.search(pattern_dct['storage_profile'], line) and not collected['system']:
                 info_system = "System " + re.search(pattern_dct['storage_profile'], line).group(1)
                 config_datetime = re.search(pattern_dct['storage_profile'], line).group(2)
-                print(info_system, end = " ")
                 info = info + " " + info_system
                 collected['system'] = True
                 line = reop.extract_key_value_from_line(system_summary_dct, pattern_dct, line, file, 
@@ -2,17 +2,24 @@
 
 
 import re
+from itertools import islice
+
+import pandas as pd
 
 import utilities.dataframe_operations as dfop
 import utilities.database_operations as dbop
 import utilities.module_execution as meop
 import utilities.servicefile_operations as sfop
-import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
+import utilities.sshow_index_operations as siop
+from san_automation_constants import (ERRDUMP_CHUNK_SIZE, ERRDUMP_MESSAGE_ID_LST,
+                                      ERRDUMP_PERIOD, ERRDUMP_SEVERITY_LST)
 
 
 def log_extract(chassis_params_df, project_constants_lst):
-    """Function to extract logs"""
+    """Function to extract logs. Errdump is written to the database by chunks during extraction
+    and read back only if it's exported to the report (None is returned, errdump analysis reads
+    errdump from the database)"""
 
     # imported project constants required for module execution
     project_steps_df, max_title, io_data_names_df, *_ = project_constants_lst
@@ -21,8 +28,8 @@ def log_extract(chassis_params_df, project_constants_lst):
     data_names = dfop.list_from_dataframe(io_data_names_df, 'errorlog_collection')
     # module information
     meop.show_module_info(project_steps_df, data_names)
-    # read data from database if they were saved on previos program execution iteration
-    data_lst = dbop.read_database(project_constants_lst, *data_names)
+    # check if data were saved on previos program execution iteration (errdump is not loaded)
+    data_lst = dbop.find_database_data(project_constants_lst, *data_names)
     
     # force run when any output data from data_lst is not found in database or 
     # procedure execution explicitly requested (force_run flag is on) for any output data 
@@ -36,58 +43,113 @@ def log_extract(chassis_params_df, project_constants_lst):
         # data imported from init file to extract values from config file
         pattern_dct, re_pattern_df = sfop.regex_pattern_import('log', max_title)
 
-        # nested list(s) to store required values of the module in defined order for all switches in SAN
-        san_errdump_lst = []  
+        # errdump DataFrame chunks of all switches in SAN are written to the database as soon as they are extracted
+        # (switch cache is not used since it keeps all extracted messages)
+        san_errdump_lst = dbop.AppendDatabaseList(project_constants_lst, data_names[0])
+        headers_lst = dfop.list_from_dataframe(re_pattern_df, 'errdump_columns')
 
+        chassis_params_lst = [chassis_params_sr for _, chassis_params_sr in chassis_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch logs' 
+                    for i, chassis_params_sr in chassis_params_df.iterrows()]
         # checking each chassis for switch level parameters
-        for i, chassis_params_sr in chassis_params_df.iterrows():       
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch logs'
-            print(info, end =" ")
-            
-            sw_errdump_lst = current_config_extract(san_errdump_lst, pattern_dct, chassis_params_sr)
-            meop.show_collection_status(sw_errdump_lst, max_title, len(info))
-            
-        # convert list to DataFrame
-        headers_lst = dfop.list_from_dataframe(re_pattern_df, 'errdump_columns')
-        data_lst = dfop.list_to_dataframe(headers_lst, san_errdump_lst)
-        errdump_df, *_ = data_lst    
-        # write data to sql db
-        dbop.write_database(project_constants_lst, data_names, *data_lst)   
-    # verify if loaded data is empty after first iteration and replace information string with empty list
-    else:
+        meop.switch_config_extract(current_config_extract, [san_errdump_lst], 
+                                    pattern_dct, chassis_params_lst, info_lst, max_title, 
+                                    headers_lst, ERRDUMP_PERIOD, ERRDUMP_MESSAGE_ID_LST, ERRDUMP_SEVERITY_LST)
+        # complete errdump table (empty errdump is written if no messages extracted)
+        if not dbop.close_append_database(project_constants_lst, data_names[0]):
+            errdump_df, = dfop.list_to_dataframe(headers_lst, [])
+            dbop.write_database(project_constants_lst, data_names, errdump_df)
+    # errdump is read from the database only to be saved to excel file
+    if project_steps_df.loc[data_names[0], 'export_to_excel']:
+        data_lst = dbop.read_database(project_constants_lst, *data_names)
         data_lst = dbop.verify_read_data(max_title, data_names, *data_lst)
-        errdump_df, *_ = data_lst
+    else:
+        data_lst = [pd.DataFrame()]
     # save data to excel file if it's required
     for data_name, data_frame in zip(data_names, data_lst):
         report.dataframe_to_excel(data_frame, data_name, project_constants_lst)
-    return errdump_df
+    return None
 
 
-def current_config_extract(san_errdump_lst, pattern_dct, chassis_params_sr):
+def current_config_extract(san_errdump_lst, pattern_dct, chassis_params_sr, 
+                            errdump_columns, errdump_period, message_id_lst, severity_lst):
     """Function to extract values from current switch confguration file. 
-    Returns list with extracted values"""
+    Errdump messages are filtered during extraction (collection period, message ids and severities) and 
+    added to san_errdump_lst as DataFrame chunks of ERRDUMP_CHUNK_SIZE messages 
+    (chunks are written to the database by san_errdump_lst in serial extraction).
+    Returns list with number of messages in each chunk"""
 
     chassis_info_keys = ['configname', 'chassis_name', 'chassis_wwn']
     chassis_info_lst = [chassis_params_sr[key] for key in chassis_info_keys]
 
     sshow_file, *_ = chassis_info_lst
+    # list to show collection status
+    sw_errdump_lst = []
 
     # search control dictionary. continue to check sshow_file until all parameters groups are found
     collected = {'errdump': False}
     
+    sshow_index = siop.get_sshow_index(sshow_file)
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()
+            # lines which can't start any section are skipped
+            line = siop.goto_next_landmark(file, sshow_index)
             if not line:
                 break
             # errdump section start
             if re.search(pattern_dct['errdump_start'], line) and not collected['errdump']:
                 # when section is found corresponding collected dict values changed to True
                 collected['errdump'] = True
-                line, sw_errdump_lst = reop.extract_list_from_line(san_errdump_lst, pattern_dct, line, file, 
-                                                                    extract_pattern_name='errdump_message', 
-                                                                    save_local=True, line_add_values=chassis_info_lst)
+                min_message_date = get_min_message_date(chassis_params_sr.get('config_collection_date'), errdump_period)
+                errdump_records = extract_errdump_records(file, pattern_dct, min_message_date, message_id_lst, severity_lst)
+                # messages are converted to DataFrame by chunks so message lists are not kept for all switch messages
+                while True:
+                    errdump_chunk_lst = list(islice(errdump_records, ERRDUMP_CHUNK_SIZE))
+                    if not errdump_chunk_lst:
+                        break
+                    errdump_chunk_df = pd.DataFrame(errdump_chunk_lst, columns=errdump_columns[len(chassis_info_keys):])
+                    for i, (column, value) in enumerate(zip(errdump_columns, chassis_info_lst)):
+                        errdump_chunk_df.insert(i, column, value)
+                    san_errdump_lst.append(errdump_chunk_df)
+                    sw_errdump_lst.append(len(errdump_chunk_df.index))
             # errdump section end
-    return sw_errdump_lst
\ No newline at end of file
+    return sw_errdump_lst
+
+
+def extract_errdump_records(file, pattern_dct, min_message_date=None, message_id_lst=None, severity_lst=None):
+    """Function yields list of values for each errdump message line till the end of errdump section.
+    Messages older than min_message_date (string in errdump date format) and messages 
+    with message id or severity not in message_id_lst or severity_lst (if defined) are skipped"""
+
+    errdump_pattern = pattern_dct['errdump_message']
+    message_id_set = set(message_id_lst) if message_id_lst else None
+    severity_set = set(severity_lst) if severity_lst else None
+
+    line = file.readline()
+    while line and not pattern_dct['switchcmd_end'].search(line):
+        match = errdump_pattern.match(line)
+        if match:
+            # message_date, message_id, external_sequence_number, security_audit_flag, severity, switchname, message
+            errdump_record = [value.rstrip() if value else None for value in match.groups()]
+            message_date, message_id, *_, severity, _, _ = errdump_record
+            # errdump date format is YYYY/MM/DD-HH:MM:SS so dates are compared as strings
+            if (min_message_date is None or message_date >= min_message_date) and \
+                (message_id_set is None or message_id in message_id_set) and \
+                    (severity_set is None or severity in severity_set):
+                yield errdump_record
+        line = file.readline()
+
+
+def get_min_message_date(config_collection_date, errdump_period):
+    """Function returns the earliest errdump message date in errdump date format (errdump_period months 
+    prior to the config_collection_date). None returned if period or collection date is not defined"""
+
+    if errdump_period is None or not config_collection_date:
+        return None
+    config_collection_date = pd.to_datetime(config_collection_date, errors='coerce')
+    if pd.isna(config_collection_date):
+        return None
+    min_message_date = config_collection_date - pd.DateOffset(months=errdump_period)
+    return min_message_date.strftime('%Y/%m/%d-%H:%M:%S')
@@ -9,6 +9,7 @@ import utilities.module_execution as meop
 import utilities.servicefile_operations as sfop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
+import utilities.sshow_index_operations as siop
 
 
 def sensor_extract(chassis_params_df, project_constants_lst):
@@ -40,13 +41,13 @@ def sensor_extract(chassis_params_df, project_constants_lst):
         san_sensor_lst = []
 
         # checking each chassis for switch level parameters
-        for i, chassis_params_sr in chassis_params_df.iterrows():   
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} sensor readings'
-            print(info, end =" ")  
-
-            sw_sensor_lst = current_config_extract(san_sensor_lst, pattern_dct, chassis_params_sr)
-            meop.show_collection_status(sw_sensor_lst, max_title, len(info))     
+        chassis_params_lst = [chassis_params_sr for _, chassis_params_sr in chassis_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} sensor readings' 
+                    for i, chassis_params_sr in chassis_params_df.iterrows()]
+        meop.switch_config_extract(current_config_extract, [san_sensor_lst], 
+                                    pattern_dct, chassis_params_lst, info_lst, max_title,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
     
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'sensor_columns')
@@ -75,10 +76,12 @@ def current_config_extract(san_sensor_lst, pattern_dct, chassis_params_sr):
     # search control dictionary. continue to check sshow_file until all parameters groups are found
     collected = {'sensor': False}
 
+    sshow_index = siop.get_sshow_index(sshow_file)
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()                        
+            # lines which can't start any section are skipped
+            line = siop.goto_next_landmark(file, sshow_index)
             if not line:
                 break
             # sensor section start   
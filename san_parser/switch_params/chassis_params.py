@@ -11,7 +11,7 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
-from san_automation_constants import DIRECTOR_TYPE
+import utilities.sshow_index_operations as siop
 
 
 def chassis_params_extract(all_config_data, project_constants_lst):
@@ -47,16 +47,15 @@ def chassis_params_extract(all_config_data, project_constants_lst):
 
         
         # all_confg_data format ([swtch_name, supportshow file, (ams_maps_log files, ...)])
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_name} chassis parameters' 
+                    for i, (switch_name, *_) in enumerate(all_config_data)]
         # checking each config set(supportshow file) for chassis level parameters
-        for i, switch_config_data in enumerate(all_config_data):
-            
-            switch_name, *_ = switch_config_data
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_name} chassis parameters'
-            print(info, end =" ")
-            ch_params_lst = current_config_extract(san_chassis_params_lst, san_slot_status_lst, san_licenseport_lst, san_chassisshow_lst, 
-                                                   pattern_dct, switch_config_data, chassis_params, chassis_params_add, chassisshow_params)
-            meop.show_collection_status(ch_params_lst, max_title, len(info))
+        meop.switch_config_extract(current_config_extract, 
+                                    [san_chassis_params_lst, san_slot_status_lst, san_licenseport_lst, san_chassisshow_lst], 
+                                    pattern_dct, all_config_data, info_lst, max_title, 
+                                    chassis_params, chassis_params_add, chassisshow_params,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
         
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'chassis_columns', 'chassis_slot_columns', 'licenseport_columns', 'chassisshow_columns')
@@ -97,11 +96,14 @@ def current_config_extract(san_chassis_params_lst, san_slot_status_lst, san_lice
     vf_id_lst = list()
     chassisshow_lst = list()
     uptime, cpu_load, memory, flash = ('not found',)*4
+    # sshow_file is indexed once and index is shared with other extractors
+    sshow_index = siop.get_sshow_index(sshow_file)
 
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()
+            # lines which can't start any section are skipped
+            line = siop.goto_next_landmark(file, sshow_index)
             if not line:
                 break
             # configshow section start
@@ -185,15 +187,6 @@ def current_config_extract(san_chassis_params_lst, san_slot_status_lst, san_lice
                                                     line, file, 
                                                     extract_pattern_name='slot_status', line_add_values=[sshow_file, switch_name])
             # slot_status section end
-            # director control section start
-            # if switch is not a director it doesn't contain chassiscmd_slotshow pattern
-            # to avoid complete check of sshow file    
-            elif re.search(pattern_dct['switch_type'], line):
-                switch_type = re.match(pattern_dct['switch_type'], line).group(1).strip()
-                switch_type = int(switch_type)
-                if not switch_type in DIRECTOR_TYPE:
-                    collected['slotshow'] = True
-            # director control section end
             # chassishsow section start
             elif re.search(pattern_dct['sscmd_chassisshow'], line) and not collected['chassisshow']:
                 collected['chassisshow'] = True
@@ -247,8 +240,8 @@ def configshow_section_extract(chassis_params_dct, snmp_target_lst, syslog_lst,
 
     while not re.search(pattern_dct['switchcmd_configshow_end'],line):
         line = file.readline()
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()} 
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line) 
         # 'chassis_param_match' pattern #0
         if match_dct['chassis_param']:
             chassis_params_dct[match_dct['chassis_param'].group(1).rstrip()] = match_dct['chassis_param'].group(2).rstrip()                            
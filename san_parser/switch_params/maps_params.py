@@ -7,6 +7,7 @@ import utilities.data_structure_operations as dsop
 import utilities.database_operations as dbop
 import utilities.dataframe_operations as dfop
 import utilities.module_execution as meop
+import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
 
@@ -102,7 +103,7 @@ def current_config_extract(san_maps_params_lst, pattern_dct,
             if re.search(pattern_dct['switch_index'], line):
                 # when section is found corresponding collected dict values changed to True
                 collected['switch_index'] = True
-                match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+                match_dct = reop.match_line(pattern_dct, line)
                 # pattern #0
                 switch_index = match_dct['switch_index'].group(1)
             # logical switch index section end
@@ -132,8 +133,8 @@ def global_dash_section_extract(maps_params_dct, pattern_dct, line, file, maps_p
 
     while not re.search(pattern_dct['maps_end'],line):
         line = file.readline()
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        # dictionary with match names as keys and match result of current line with imported regular expressions as values (pattern is evaluated on request)
+        match_dct = reop.match_line(pattern_dct, line)
         # 'dashboard_match' pattern #1
         if match_dct['dashborad_param']:
             maps_params_dct[match_dct['dashborad_param'].group(1).rstrip()] = match_dct['dashborad_param'].group(2)                            
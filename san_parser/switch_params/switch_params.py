@@ -10,6 +10,7 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.sshow_index_operations as siop
 
 
 def switch_params_extract(chassis_params_df, project_constants_lst):
@@ -42,14 +43,15 @@ def switch_params_extract(chassis_params_df, project_constants_lst):
         pattern_dct, re_pattern_df = sfop.regex_pattern_import('switch', max_title)
         switch_params, switch_params_add = dfop.list_from_dataframe(re_pattern_df, 'switch_params', 'switch_params_add')
         
+        chassis_params_lst = [chassis_params_sr for _, chassis_params_sr in chassis_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch parameters. Number of LS: {chassis_params_sr["Number_of_LS"]}' 
+                    for i, chassis_params_sr in chassis_params_df.iterrows()]
         # checking each chassis for switch level parameters
-        for i, chassis_params_sr in chassis_params_df.iterrows():
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {chassis_params_sr["chassis_name"]} switch parameters. Number of LS: {chassis_params_sr["Number_of_LS"]}'
-            print(info, end =" ")
-            sw_params_lst = current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, pattern_dct, 
-                                                                    chassis_params_sr, switch_params, switch_params_add)       
-            meop.show_collection_status(sw_params_lst, max_title, len(info))
+        meop.switch_config_extract(current_config_extract, [san_switch_params_lst, san_switchshow_ports_lst], 
+                                    pattern_dct, chassis_params_lst, info_lst, max_title, 
+                                    switch_params, switch_params_add,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
                                
         # convert list to DataFrame
         headers_lst = dfop.list_from_dataframe(re_pattern_df, 'switch_columns', 'switchshow_portinfo_columns')
@@ -81,6 +83,7 @@ def current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, patt
     ls_mode = ('ON' if not chassis_params_sr["Number_of_LS"] in ['0', None] else 'OFF')
     # logical switches indexes. if switch is in Non-VF mode then ls_id is 0
     ls_ids = chassis_params_sr['LS_IDs'].split(', ') if chassis_params_sr['LS_IDs'] else ['0']               
+    sshow_index = siop.get_sshow_index(sshow_file)
     
     # check each logical switch in chassis
     for i in ls_ids:
@@ -92,7 +95,8 @@ def current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, patt
         with open(sshow_file, encoding='utf-8', errors='ignore') as file:
             # check file until all groups of parameters extracted
             while not all(collected.values()):
-                line = file.readline()                        
+                # lines which can't start any section are skipped
+                line = siop.goto_next_landmark(file, sshow_index)
                 if not line:
                     break
                 # configshow section start
@@ -110,7 +114,7 @@ def current_config_extract(san_switch_params_lst, san_switchshow_ports_lst, patt
                 # switchshow section start
                 elif re.search(pattern_dct['switchcmd_switchshow'], line) and not collected['switchshow']:
                     collected['switchshow'] = True
-                    line = reop.goto_switch_context(ls_mode_on, line, file, i)
+                    line = reop.goto_switch_context(ls_mode_on, line, file, i, sshow_index)
                     line = switchshow_section_extract(switch_params_dct, san_switchshow_ports_lst, pattern_dct, 
                                                         chassis_info_lst, line, file, i)                    
                 # switchshow section end
@@ -136,7 +140,7 @@ def switchshow_section_extract(switch_params_dct, switchshow_ports_lst, pattern_
 
     while not re.search(pattern_dct['switchcmd_end'],line):
         line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
+        match_dct = reop.match_line(pattern_dct, line)
         # 'switch_switchshow_match' pattern #1
         if match_dct['switchshow_param']:
             switch_params_dct[match_dct['switchshow_param'].group(1).rstrip()] = match_dct['switchshow_param'].group(2).rstrip()
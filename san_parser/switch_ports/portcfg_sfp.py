@@ -9,6 +9,7 @@ import utilities.module_execution as meop
 import utilities.regular_expression_operations as reop
 import utilities.report_operations as report
 import utilities.servicefile_operations as sfop
+import utilities.sshow_index_operations as siop
 
 from .portcfg_sfp_sections import (portcfgshow_section_extract,
                                    sfpshow_section_extract)
@@ -46,13 +47,14 @@ def portcfg_sfp_extract(switch_params_df, project_constants_lst):
         # list to save portcfg information for all ports in fabric
         san_portcfgshow_lst = []
         
-        for i, switch_params_sr in switch_params_df.iterrows():
-            # current operation information string
-            info = f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} ports sfp and cfg'
-            print(info, end =" ")                      
-            sw_sfpshow_lst = current_config_extract(san_sfpshow_lst, san_portcfgshow_dct, pattern_dct,
-                                    switch_params_sr, sfp_params, sfp_params_add, portcfg_params)                     
-            meop.show_collection_status(sw_sfpshow_lst, max_title, len(info))
+        switch_params_lst = [switch_params_sr for _, switch_params_sr in switch_params_df.iterrows()]
+        # current operation information strings
+        info_lst = [f'[{i+1} of {switch_num}]: {switch_params_sr["SwitchName"]} ports sfp and cfg' 
+                    for i, switch_params_sr in switch_params_df.iterrows()]
+        meop.switch_config_extract(current_config_extract, [san_sfpshow_lst, san_portcfgshow_dct], 
+                                    pattern_dct, switch_params_lst, info_lst, max_title, 
+                                    sfp_params, sfp_params_add, portcfg_params,
+                                    cache_file=dbop.get_switch_cache_file(project_constants_lst, data_names))
         # after check all config files create list of lists from dictionary. 
         # each nested list contains portcfg information for one port
         for portcfg_param in portcfg_params:
@@ -88,16 +90,18 @@ def current_config_extract(san_sfpshow_lst, san_portcfgshow_dct, pattern_dct,
 
     # search control dictionary. continue to check sshow_file until all parameters groups are found
     collected = {'sfpshow': False, 'portcfgshow': False}
+    sshow_index = siop.get_sshow_index(sshow_file)
     with open(sshow_file, encoding='utf-8', errors='ignore') as file:
         # check file until all groups of parameters extracted
         while not all(collected.values()):
-            line = file.readline()                        
+            # lines which can't start any section are skipped
+            line = siop.goto_next_landmark(file, sshow_index)
             if not line:
                 break
             # sfpshow section start
             if re.search(pattern_dct['switchcmd_sfpshow'], line) and not collected['sfpshow']:
                 collected['sfpshow'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line, sw_sfpshow_lst = sfpshow_section_extract(san_sfpshow_lst, pattern_dct, 
                                                 switch_info_lst, sfp_params, sfp_params_add, 
                                                 line, file)
@@ -105,7 +109,7 @@ def current_config_extract(san_sfpshow_lst, san_portcfgshow_dct, pattern_dct,
             # portcfgshow section start
             if re.search(pattern_dct['switchcmd_portcfgshow'], line) and not collected['portcfgshow']:
                 collected['portcfgshow'] = True
-                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index)
+                line = reop.goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index)
                 line = portcfgshow_section_extract(san_portcfgshow_dct, pattern_dct, 
                                                     switch_info_lst, portcfg_params, 
                                                     line, file)
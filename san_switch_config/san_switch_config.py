@@ -142,6 +142,7 @@ def detect_new_sw_cfg_export(export_status_lst, project_constants_lst):
         reply = meop.reply_request(query)
         if reply == 'y':
             project_constants_lst[0]['force_run'] = 1
-            print("\nAll switches configurations parsing and analysis initialized\n")
+            print("\nAll switches configurations parsing and analysis initialized")
+            print("Data of unchanged switches configurations is taken from the previous parsing\n")
 
 
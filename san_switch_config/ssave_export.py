@@ -2,12 +2,15 @@
 
 import os
 import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 
 import pandas as pd
 
 import utilities.filesystem_operations as fsop
 import utilities.module_execution as meop
-from san_automation_constants import LEFT_INDENT
+from san_automation_constants import LEFT_INDENT, SSAVE_EXPORT_WORKERS
 
 from .ssave_export_filepath import (
     get_single_section_output_filepath,
@@ -42,67 +45,100 @@ def export_ssave_files(san_ssave_files_lst, path_to_move_sshow, path_to_move_oth
     if ssave_sections_stats_df is None:
         ssave_sections_stats_df = pd.DataFrame(columns=ssave_sections_stats_columns)
 
-    for i, switch_ssave_files_lst in enumerate(san_ssave_files_lst):
-        # extracts switchname from sshow_sys filename
-        switchname = re.search(pattern_dct['switchname_sshow_sys'], os.path.basename(switch_ssave_files_lst[0])).group(1)
-        # number of ams_maps_log files in current configuration set (switch)
-        ssave_ams_maps_files_num = len(switch_ssave_files_lst[1])
-        print(f'[{i+1} of {config_set_num}]: {switchname}. Number of configs: {ssave_ams_maps_files_num+1} ...')
-        
-        # build sshow file from ssave sshow sections and export it
-        sshow_filepath, ssave_sections_stats_df = pull_switch_configuration_file(switch_ssave_files_lst[0], 
-                                                                                path_to_move_sshow, ssave_sections_stats_df, 
-                                                                                export_status_lst, pattern_dct, max_title)
-        sshow_filename = os.path.basename(sshow_filepath)
-        # current switch exported AMS_MAPS_LOG filenames and filepaths
-        ams_maps_files_lst_tmp = []
-        ams_maps_filenames_lst_tmp = []
-        # check discovered ams_maps ssave files
-        if ssave_ams_maps_files_num > 0:
+    # sshow and ams_maps files are exported in worker processes if SSAVE_EXPORT_WORKERS > 1
+    # (section files validation and status display are performed in main process in switch order)
+    parallel_export_on = SSAVE_EXPORT_WORKERS > 1
+    executor_context = ProcessPoolExecutor(max_workers=SSAVE_EXPORT_WORKERS) if parallel_export_on else nullcontext()
+    with executor_context as executor:
+        # export jobs for each switch
+        switch_export_lst = []
+        for i, switch_ssave_files_lst in enumerate(san_ssave_files_lst):
+            # extracts switchname from sshow_sys filename
+            switchname = re.search(pattern_dct['switchname_sshow_sys'], os.path.basename(switch_ssave_files_lst[0])).group(1)
+            if not parallel_export_on:
+                display_switch_export_title(i, config_set_num, switchname, switch_ssave_files_lst)
+            # build sshow file from ssave sshow sections and export it
+            sshow_export, ssave_sections_stats_df = submit_switch_configuration_export(executor, switch_ssave_files_lst[0], 
+                                                                                        path_to_move_sshow, ssave_sections_stats_df, 
+                                                                                        pattern_dct)
+            # export ssave ams_maps files
+            ams_maps_export_lst = []
             for ssave_ams_maps_file in switch_ssave_files_lst[1]:
-                # export ssave ams_maps file
-                amsmaps_filepath, _ = pull_switch_configuration_file(ssave_ams_maps_file, 
-                                                                    path_to_move_others, ssave_sections_stats_df, 
-                                                                    export_status_lst, pattern_dct, max_title)
-                ams_maps_files_lst_tmp.append(amsmaps_filepath)
-                ams_maps_filenames_lst_tmp.append(os.path.basename(amsmaps_filepath))
-        else:
-            info = ' '*LEFT_INDENT + 'No AMS_MAPS configuration found.'
-            print(info, end =" ")
-            meop.status_info('skip', max_title, len(info))
-            ams_maps_files_lst_tmp = None
-            ams_maps_filenames_lst_tmp = None
-        # append exported configuration data filenames and filepaths to the summmary list
-        exported_files_lst.append([switchname, sshow_filepath, ams_maps_files_lst_tmp])
-        exported_filenames_lst.append([switchname, sshow_filename, ams_maps_filenames_lst_tmp])    
+                ams_maps_export, _ = submit_switch_configuration_export(executor, ssave_ams_maps_file, 
+                                                                        path_to_move_others, ssave_sections_stats_df, 
+                                                                        pattern_dct)
+                ams_maps_export_lst.append(ams_maps_export)
+            switch_export_lst.append([switchname, switch_ssave_files_lst, sshow_export, ams_maps_export_lst])
+            # serial export is completed for each switch right after submit
+            if not parallel_export_on:
+                complete_switch_export(switch_export_lst[-1], exported_files_lst, exported_filenames_lst, export_status_lst, max_title)
+
+        # parallel export status is displayed in switch order
+        if parallel_export_on:
+            for i, switch_export in enumerate(switch_export_lst):
+                switchname, switch_ssave_files_lst, *_ = switch_export
+                display_switch_export_title(i, config_set_num, switchname, switch_ssave_files_lst)
+                complete_switch_export(switch_export, exported_files_lst, exported_filenames_lst, export_status_lst, max_title)
     print('\n')
     return exported_files_lst, exported_filenames_lst, ssave_sections_stats_df, export_status_lst
 
 
-def pull_switch_configuration_file(ssave_section_file, output_dir, ssave_sections_stats_df, 
-                                    export_status_lst, pattern_dct, max_title):
-    """Function to pull sshow and ams_maps configs from ssave and export it to output_dir"""
+def display_switch_export_title(i, config_set_num, switchname, switch_ssave_files_lst):
+    """Function displays switch number, switchname and number of configs to export"""
+
+    # number of ams_maps_log files in current configuration set (switch)
+    ssave_ams_maps_files_num = len(switch_ssave_files_lst[1])
+    print(f'[{i+1} of {config_set_num}]: {switchname}. Number of configs: {ssave_ams_maps_files_num+1} ...')
+
+
+def complete_switch_export(switch_export, exported_files_lst, exported_filenames_lst, export_status_lst, max_title):
+    """Function waits switch sshow and ams_maps files export, displays export status
+    and adds exported filenames and filepaths to the summary lists"""
+
+    switchname, _, sshow_export, ams_maps_export_lst = switch_export
+    sshow_filepath = complete_switch_configuration_export(sshow_export, export_status_lst, max_title)
+    sshow_filename = os.path.basename(sshow_filepath)
+    # current switch exported AMS_MAPS_LOG filenames and filepaths
+    ams_maps_files_lst_tmp = []
+    ams_maps_filenames_lst_tmp = []
+    # check discovered ams_maps ssave files
+    if ams_maps_export_lst:
+        for ams_maps_export in ams_maps_export_lst:
+            amsmaps_filepath = complete_switch_configuration_export(ams_maps_export, export_status_lst, max_title)
+            ams_maps_files_lst_tmp.append(amsmaps_filepath)
+            ams_maps_filenames_lst_tmp.append(os.path.basename(amsmaps_filepath))
+    else:
+        info = ' '*LEFT_INDENT + 'No AMS_MAPS configuration found.'
+        print(info, end =" ")
+        meop.status_info('skip', max_title, len(info))
+        ams_maps_files_lst_tmp = None
+        ams_maps_filenames_lst_tmp = None
+    # append exported configuration data filenames and filepaths to the summmary list
+    exported_files_lst.append([switchname, sshow_filepath, ams_maps_files_lst_tmp])
+    exported_filenames_lst.append([switchname, sshow_filename, ams_maps_filenames_lst_tmp])
+
+
+def submit_switch_configuration_export(executor, ssave_section_file, output_dir, ssave_sections_stats_df, pattern_dct):
+    """Function prepares sshow or ams_maps config export from ssave to output_dir.
+    Export job is submitted to executor (or deferred if executor is None).
+    Returns export details (ssave filename, exported filepath, status, export job) 
+    and updated ssave_sections_stats_df"""
 
     ssave_section_filename = os.path.basename(ssave_section_file)
-    info = ' '*LEFT_INDENT + f'{ssave_section_filename} processing'
     
     # get type of config, main and secondary export filepaths
     exported_switch_config_filepath, exported_switch_config_secondary_filepath, config_type = \
         get_export_filepath(ssave_section_filename, output_dir, pattern_dct)
     
     if config_type == 'unknown':
-        print(info, end =" ")
-        meop.status_info('unknown', max_title, len(info))
-        return '', ssave_sections_stats_df
+        return [ssave_section_filename, '', 'unknown', None], ssave_sections_stats_df
 
     # check if exported file exists on main or secondary filepaths
     config_exist_lst = fsop.validate_path_isfile(exported_switch_config_filepath, exported_switch_config_secondary_filepath)
     if config_exist_lst:
-        print(info, end =" ")
-        export_status_lst.append(meop.status_info('skip', max_title, len(info)))
-        return config_exist_lst[0], ssave_sections_stats_df
+        return [ssave_section_filename, config_exist_lst[0], 'skip', None], ssave_sections_stats_df
 
-    # export file to exported file
+    ssave_sections_stats_current_df = None
     if config_type == 'sshow':
         # validate there is no any sshow sections duplication
         ssave_sections_stats_current_df =\
@@ -111,18 +147,57 @@ def pull_switch_configuration_file(ssave_section_file, output_dir, ssave_section
         ssave_sections_stats_current_df['sshow_filename'] = os.path.basename(exported_switch_config_filepath)
         # add current folder statistics to the general statistics dataframe
         ssave_sections_stats_df = update_ssave_sections_stats(ssave_sections_stats_df, ssave_sections_stats_current_df)
+
+    export_args = (config_type, ssave_section_file, exported_switch_config_filepath, ssave_sections_stats_current_df)
+    if executor is None:
+        export_job = partial(export_switch_configuration_file, *export_args)
+    else:
+        export_job = executor.submit(export_switch_configuration_file, *export_args)
+    return [ssave_section_filename, exported_switch_config_filepath, None, export_job], ssave_sections_stats_df
+
+
+def export_switch_configuration_file(config_type, ssave_section_file, exported_switch_config_filepath, 
+                                        ssave_sections_stats_current_df):
+    """Function exports sshow (combined from ssave sshow sections) or ams_maps config 
+    to exported_switch_config_filepath"""
+
+    if config_type == 'sshow':
         # combine and export sshow sections files to exported_switch_config_filepath
         build_sshow_file(ssave_sections_stats_current_df, exported_switch_config_filepath)
     elif config_type == 'maps':
         export_single_section_file(input_filepath=ssave_section_file, output_filepath=exported_switch_config_filepath)
 
+
+def complete_switch_configuration_export(switch_configuration_export, export_status_lst, max_title):
+    """Function waits config export job completion and displays export status.
+    Returns exported config filepath"""
+
+    ssave_section_filename, exported_switch_config_filepath, status, export_job = switch_configuration_export
+    info = ' '*LEFT_INDENT + f'{ssave_section_filename} processing'
+
+    if status == 'unknown':
+        print(info, end =" ")
+        meop.status_info('unknown', max_title, len(info))
+        return exported_switch_config_filepath
+
+    if status == 'skip':
+        print(info, end =" ")
+        export_status_lst.append(meop.status_info('skip', max_title, len(info)))
+        return exported_switch_config_filepath
+
+    # deferred job is executed, submitted job result is waited
+    if isinstance(export_job, Future):
+        export_job.result()
+    else:
+        export_job()
+
     print(info, end =" ")
     # check if exported file exists
     if fsop.validate_path_isfile(exported_switch_config_filepath):
         export_status_lst.append(meop.status_info('ok', max_title, len(info)))
     else:
         export_status_lst.append(meop.status_info('fail', max_title, len(info)))
-    return exported_switch_config_filepath, ssave_sections_stats_df
+    return exported_switch_config_filepath
 
 
 def get_export_filepath(ssave_section_filename, output_dir, pattern_dct):
@@ -1,15 +1,14 @@
 """Module to build supportshow and ams_maps files"""
 
 import gzip
+import io
 import os
 import tarfile
 
 import pandas as pd
 
-import utilities.database_operations as dbop
 import utilities.module_execution as meop
-import utilities.report_operations as report
-from san_automation_constants import RELEASE
+from san_automation_constants import EXPORT_BLOCK_SIZE, RELEASE
 
 from .sshow_stats import SSHOW_SECTIONS
 
@@ -17,33 +16,47 @@ from .sshow_stats import SSHOW_SECTIONS
 def export_gzip_file(gzip_filepath, dest_filepath):
     """Function read gzip txt file and write its content to dest_filepath"""
     
+    with open(dest_filepath, "a+", encoding='utf-8', errors='ignore') as dest_file:
+        copy_gzip_file(gzip_filepath, dest_file)
+
+
+def copy_gzip_file(gzip_filepath, dest_file):
+    """Function reads gzip txt file by blocks and writes its content to opened dest_file"""
+
     with gzip.open(gzip_filepath, "rt", encoding='utf-8', errors='ignore') as gzf:
-        with open(dest_filepath, "a+", encoding='utf-8', errors='ignore') as dest_file:
-            for line in gzf:
-                # replace tabs with spaces in each line
-                tab_free_line = line.replace('\t', ' ')
-                dest_file.write(tab_free_line)
+        copy_text_blocks(gzf, dest_file)
+
+
+def copy_text_blocks(src_file, dest_file):
+    """Function reads opened src_file by blocks and writes them to opened dest_file.
+    Tabs are replaced with spaces"""
+
+    while True:
+        block = src_file.read(EXPORT_BLOCK_SIZE)
+        if not block:
+            break
+        # replace tabs with spaces in the whole block
+        dest_file.write(block.replace('\t', ' '))
             
 
 def export_tar_file(tar_filepath, dest_filepath):
     """Function opens tar archive, read txt file and write its conntent to dest_filepath.
-    If tar archive has no files or has multiple files then warning message is displayes"""
+    If tar archive has no files then warning message is displayed and nothing is exported.
+    If tar archive has multiple files then warning message is displayed and the first file is exported"""
     
     with tarfile.open(tar_filepath, "r:gz") as tf:
         # get list of all files in archive ignoring directories
-        tarfile_lst = [tarinfo.name for tarinfo in tf if tarinfo.isreg()]
-        if not tarfile_lst:
+        tarinfo_lst = [tarinfo for tarinfo in tf if tarinfo.isreg()]
+        if not tarinfo_lst:
             print('WARNING. No configuration in tar archive.')
-        elif len(tarfile_lst) > 1:
-            print('WARNING. Multiple files in tar archive.')
-        # read content of the first file
-        tar_file_content = tf.extractfile(tarfile_lst[0]).read().decode("utf-8", errors='ignore')
-        # write content to the dest_filepath
-        with open(dest_filepath, "a+") as dest_file:
-            for line in tar_file_content:
-                # replace tabs with spaces in each line
-                tab_free_line = line.replace('\t', ' ')
-                dest_file.write(tab_free_line)
+            return
+        elif len(tarinfo_lst) > 1:
+            print(f"WARNING. Multiple files in tar archive. Only '{tarinfo_lst[0].name}' is exported.")
+        # read content of the first file by blocks (line endings are kept as is) 
+        # and write it to the dest_filepath
+        with io.TextIOWrapper(tf.extractfile(tarinfo_lst[0]), encoding='utf-8', errors='ignore', newline='') as tar_member_file:
+            with open(dest_filepath, "a+", encoding='utf-8', errors='ignore') as dest_file:
+                copy_text_blocks(tar_member_file, dest_file)
 
 
 def export_single_section_file(input_filepath, output_filepath):
@@ -60,27 +73,29 @@ def export_single_section_file(input_filepath, output_filepath):
 
 def build_sshow_file(ssave_sections_stat_current_df, sshow_filepath):
     """Function concatenates sshow sections related to ssave_sections_stat_current_df file
-    and writes it to the sshow_filepath"""
+    and writes it to the sshow_filepath. Output file is opened once for header, 
+    all sections and footer"""
     
-    # insert file header
-    insert_sshow_header(ssave_sections_stat_current_df, sshow_filepath)
-    ssave_sections_stat_current_df.set_index(keys='section_name', drop=True, inplace=True)
-    for section_name in SSHOW_SECTIONS:
-        if pd.notna(ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']):
-            ssave_section_file = os.path.normpath(os.path.join(
-                ssave_sections_stat_current_df.loc[section_name, 'directory_path'],
-                ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']
-                ))
-            # insert section name
-            insert_section_header(sshow_filepath, section_name)
-            # write section content to sshow_filepath
-            export_gzip_file(gzip_filepath=ssave_section_file, dest_filepath=sshow_filepath)
-    # insert footer to the end of the file
-    insert_sshow_footer(sshow_filepath)
+    with open(sshow_filepath, "a+", encoding='utf-8', errors='ignore') as sshow_file:
+        # insert file header
+        insert_sshow_header(ssave_sections_stat_current_df, sshow_file)
+        ssave_sections_stat_current_df.set_index(keys='section_name', drop=True, inplace=True)
+        for section_name in SSHOW_SECTIONS:
+            if pd.notna(ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']):
+                ssave_section_file = os.path.normpath(os.path.join(
+                    ssave_sections_stat_current_df.loc[section_name, 'directory_path'],
+                    ssave_sections_stat_current_df.loc[section_name, 'ssave_filename']
+                    ))
+                # insert section name
+                insert_section_header(sshow_file, section_name)
+                # write section content to sshow_file
+                copy_gzip_file(gzip_filepath=ssave_section_file, dest_file=sshow_file)
+        # insert footer to the end of the file
+        insert_sshow_footer(sshow_file)
             
 
-def insert_sshow_header(ssave_sections_stat_current_df, sshow_filepath):
-    """Function inserts header to the sshow_filepath"""
+def insert_sshow_header(ssave_sections_stat_current_df, sshow_file):
+    """Function inserts header to the opened sshow_file"""
     
     title = "SupportShow rebuilt by SAN Audit Automation"
     author = 'Author: KVl'
@@ -96,21 +111,30 @@ def insert_sshow_header(ssave_sections_stat_current_df, sshow_filepath):
     str_lst = ["| " + str_ + " " * (max_str_len - len(str_) + 1) + "|" for str_ in str_lst]
     # horizontal borders
     border_str = "+" + "-" * (max_str_len + 2) + "+" 
-    # insert header to the sshow_filepath
-    report.add_log_entry(sshow_filepath, border_str, *str_lst[:3], border_str, *str_lst[3:], border_str, '')
+    # insert header to the sshow_file
+    write_entries(sshow_file, border_str, *str_lst[:3], border_str, *str_lst[3:], border_str, '')
 
 
-def insert_section_header(sshow_filepath, section_name):
+def insert_section_header(sshow_file, section_name):
     """Function inserts sshow section title to concatenated sshow file"""
     
     section_header_str = "| Section: " + section_name + " |"
     border_str = "+" + "-" * (len(section_header_str) - 2) + "+"
-    report.add_log_entry(sshow_filepath, border_str, section_header_str, border_str, '\n')
+    write_entries(sshow_file, border_str, section_header_str, border_str, '\n')
 
 
-def insert_sshow_footer(sshow_filepath):
+def insert_sshow_footer(sshow_file):
     """Function inserts sshow section title to concatenated sshow file"""
     
     footer_str = "| ... rebuilt finished |"
     border_str = "+" + "-" * (len(footer_str) - 2) + "+"
-    report.add_log_entry(sshow_filepath, border_str, footer_str, border_str, '\n')
\ No newline at end of file
+    write_entries(sshow_file, border_str, footer_str, border_str, '\n')
+
+
+def write_entries(file, *args):
+    """Function writes lines (args) to the opened file the same way as report.add_log_entry does.
+    If file is not empty then '\n' is added before first line, lines are separated with '\n'"""
+
+    if file.tell() > 0:
+        file.write('\n')
+    file.write('\n'.join(args))
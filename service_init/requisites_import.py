@@ -154,8 +154,11 @@ def import_project_steps(max_title):
 
 
 def software_path(series):
-    """Function to find software pathes for san_toolbox and s3mft"""
+    """Function to find software pathes for san_toolbox and s3mft
+    (folder path is taken for entries without file, e.g. stats_folder)"""
     
+    if pd.isna(series['file']):
+        return os.path.normpath(series['directory'])
     sw_path = os.path.join(series['directory'], series['file'])
     sw_path = os.path.normpath(sw_path)
     return sw_path
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""Tests are run from the project folder since service files (report_info.xlsx, san_automation_info.xlsx)
+are imported with relative paths"""
+
+import os
+import sys
+
+import pytest
+
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if PROJECT_FOLDER not in sys.path:
+    sys.path.insert(0, PROJECT_FOLDER)
+
+
+@pytest.fixture(autouse=True)
+def project_folder(monkeypatch):
+    """Fixture sets project folder as current working directory"""
+
+    monkeypatch.chdir(PROJECT_FOLDER)
+    return PROJECT_FOLDER
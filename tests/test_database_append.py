@@ -0,0 +1,51 @@
+"""Tests of DataFrame chunks appended to the database and read back by filtered chunks"""
+
+import pandas as pd
+import pytest
+
+import utilities.database_operations as dbop
+
+
+def create_project_constants_lst(database_folder, db_backend):
+    project_steps_df = pd.DataFrame({'report_type': ['collection']}, index=['errdump_df'])
+    report_requisites_sr = pd.Series({'customer_name': 'test', 'database_folder': str(database_folder),
+                                      'database_backend': db_backend})
+    return [project_steps_df, 80, None, report_requisites_sr]
+
+
+def create_errdump_chunk(start, stop):
+    return pd.DataFrame({'configname': 'sw01',
+                         'Message_ID': [f'MAPS-{i}' for i in range(start, stop)],
+                         # column empty in the first chunk
+                         'Message': [None if start == 0 else f'message {i}' for i in range(start, stop)]})
+
+
+@pytest.mark.parametrize('db_backend', ['sqlite', 'parquet', 'feather'])
+def test_append_database(tmp_path, db_backend):
+    if db_backend != 'sqlite':
+        pytest.importorskip('pyarrow')
+    project_constants_lst = create_project_constants_lst(tmp_path, db_backend)
+    # table saved on previous program execution is replaced
+    dbop.write_database(project_constants_lst, ['errdump_df'], create_errdump_chunk(100, 200))
+
+    errdump_lst = dbop.AppendDatabaseList(project_constants_lst, 'errdump_df')
+    errdump_lst.append(create_errdump_chunk(0, 5))
+    errdump_lst.extend([create_errdump_chunk(5, 10), create_errdump_chunk(10, 12)])
+    assert dbop.close_append_database(project_constants_lst, 'errdump_df') == 12
+    assert dbop.find_database_data(project_constants_lst, 'errdump_df') == [True]
+
+    errdump_df = dbop.read_database_chunks(project_constants_lst, 'errdump_df',
+                                           lambda chunk_df: chunk_df.loc[chunk_df['Message_ID'] >= 'MAPS-5'], chunksize=4)
+    assert errdump_df['Message_ID'].tolist() == [f'MAPS-{i}' for i in range(5, 10)]
+    assert errdump_df['Message'].tolist() == [f'message {i}' for i in range(5, 10)]
+    # all chunks filtered out
+    errdump_df = dbop.read_database_chunks(project_constants_lst, 'errdump_df', lambda chunk_df: chunk_df.iloc[0:0], chunksize=4)
+    assert errdump_df.empty and errdump_df.columns.tolist() == ['configname', 'Message_ID', 'Message']
+
+
+def test_append_database_not_found(tmp_path):
+    project_constants_lst = create_project_constants_lst(tmp_path, 'sqlite')
+
+    assert dbop.close_append_database(project_constants_lst, 'errdump_df') == 0
+    assert dbop.find_database_data(project_constants_lst, 'errdump_df') == [None]
+    assert dbop.read_database_chunks(project_constants_lst, 'errdump_df', lambda chunk_df: chunk_df, chunksize=4) is None
@@ -0,0 +1,54 @@
+"""Tests of Arrow backed string columns conversion and restore"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import utilities.database_operations as dbop
+import utilities.dataframe_operations as dfop
+
+pytest.importorskip('pyarrow')
+
+N = None
+
+
+def create_portshow_df():
+    return pd.DataFrame({
+        'Fabric_name': ['BB1', 'BB1', 'BB2'],
+        'switchName': ['sw01', N, 'sw02'],
+        'Connected_portWwn': ['10:00:00:00:c9:00:00:01', np.nan, '10:00:00:00:c9:00:00:02'],
+        # columns with not string values are not converted
+        'port': ['1', 2, '3'],
+        'Index': [1, 2, 3],
+        })
+
+
+def test_convert_arrow_string():
+    portshow_df = create_portshow_df()
+    portshow_arrow_df = dfop.convert_arrow_string(portshow_df, ['Fabric_name', 'switchName', 'Connected_portWwn', 'port', 'Index', 'absent'])
+
+    assert portshow_arrow_df[['Fabric_name', 'switchName', 'Connected_portWwn']].dtypes.map(lambda dtype: isinstance(dtype, pd.StringDtype)).all()
+    assert portshow_arrow_df[['port', 'Index']].dtypes.tolist() == portshow_df[['port', 'Index']].dtypes.tolist()
+    # empty values keep numpy semantics
+    assert portshow_arrow_df['switchName'].isna().tolist() == [False, True, False]
+    assert (portshow_arrow_df['switchName'] == 'sw01').tolist() == [True, False, False]
+    # source DataFrame is not changed
+    assert portshow_df['Fabric_name'].dtype == 'object'
+
+    portshow_restored_df = dfop.restore_arrow_string(portshow_arrow_df)
+    assert (portshow_restored_df.dtypes == 'object').tolist() == [True, True, True, True, False]
+    pd.testing.assert_frame_equal(portshow_restored_df.fillna(np.nan), portshow_df.fillna(np.nan))
+
+
+@pytest.mark.parametrize('extension', ['.parquet', '.feather'])
+def test_write_columnar_arrow_string(tmp_path, extension):
+    # columns with mixed types are not written to columnar files
+    portshow_df = create_portshow_df().drop(columns=['port'])
+    portshow_arrow_df = dfop.convert_arrow_string(portshow_df, ['Fabric_name', 'switchName'])
+    columnar_path = str(tmp_path / ('portshow_aggregated' + extension))
+
+    assert dbop.write_columnar(columnar_path, portshow_arrow_df)
+    portshow_read_df = dbop.read_columnar(columnar_path)
+    # Arrow backed strings are read as object columns
+    assert portshow_read_df[['Fabric_name', 'switchName']].dtypes.eq('object').all()
+    assert portshow_read_df['switchName'].isna().tolist() == [False, True, False]
@@ -0,0 +1,92 @@
+"""Regression tests of errdump message extraction against results of the pattern by pattern row extraction"""
+
+import pandas as pd
+import pytest
+
+import utilities.servicefile_operations as sfop
+from san_analysis.errdump.errdump import filter_errdump, get_min_message_date
+from san_analysis.errdump.errdump_aggregation import message_extract
+
+# Message_ID, Message and not empty extracted values
+MESSAGE_EXTRACT = [
+    ('MAPS-1003', 'F-Port 12, Condition=ALL_F_PORTS(CRC/MIN>10), Current Value:[CRC,25 CRCs], RuleName=defALL_F_PORTSCRC_10, Dashboard Category=Port Health.',
+        {'Message_portType': 'F-Port', 'port': '12', 'Condition': 'ALL_F_PORTS(CRC/MIN>10)', 'Current_value': 'CRC,25 CRCs', 'Rule_name': 'defALL_F_PORTSCRC_10', 'Dashboard_category': 'Port Health', 'Message_status': 'extracted'}),
+    # duplicated message
+    ('MAPS-1003', 'F-Port 12, Condition=ALL_F_PORTS(CRC/MIN>10), Current Value:[CRC,25 CRCs], RuleName=defALL_F_PORTSCRC_10, Dashboard Category=Port Health.',
+        {'Message_portType': 'F-Port', 'port': '12', 'Condition': 'ALL_F_PORTS(CRC/MIN>10)', 'Current_value': 'CRC,25 CRCs', 'Rule_name': 'defALL_F_PORTSCRC_10', 'Dashboard_category': 'Port Health', 'Message_status': 'extracted'}),
+    ('MAPS-1003', 'U_PORT.33.Port_33, U-Port 2/1, Condition=ALL_PORTS(STATE_CHG/MIN>5), Current Value:[STATE_CHG,7 ], RuleName=defALL_PORTSSTATE_CHG_5, Dashboard Category=Port Health.',
+        {'Message_portIndex': '33', 'Message_portType': 'U-Port', 'slot': '2', 'port': '1', 'Condition': 'ALL_PORTS(STATE_CHG/MIN>5)', 'Current_value': 'STATE_CHG,7 ', 'Rule_name': 'defALL_PORTSSTATE_CHG_5', 'Dashboard_category': 'Port Health', 'Message_status': 'extracted'}),
+    ('MAPS-1021', 'SFP 3/12, Condition=ALL_SFP(TEMP>85), obj:Temperature',
+        {'slot': '3', 'port': '12', 'Condition': 'ALL_SFP(TEMP>85)', 'obj': 'Temperature', 'Message_status': 'extracted'}),
+    ('MAPS-1010', 'F-Port 14, Pid 0x010e00, Condition=ALL_HOST_PORTS(C3TXTO/MIN>3), obj:C3TX_TO',
+        {'Message_portType': 'F-Port', 'port': '14', 'Message_portId': '010e00', 'Condition': 'ALL_HOST_PORTS(C3TXTO/MIN>3)', 'obj': 'C3TX_TO', 'Message_status': 'extracted'}),
+    ('AN-1010', 'Severe latency bottleneck detected at slot 2 port 15.',
+        {'slot': '2', 'port': '15', 'Condition': 'Severe latency bottleneck', 'Message_status': 'extracted'}),
+    ('AN-1003', 'Latency bottleneck on port 5. 80.00 percent of last 300 seconds were affected by latency bottleneck.',
+        {'port': '5', 'Condition': 'Latency bottleneck', 'Current_value': '80.00 percent of last 300 seconds were affected by latency bottleneck.', 'Message_status': 'extracted'}),
+    ('AN-1004', 'Slot 1, port 7 has Latency bottleneck cleared',
+        {'slot': '1', 'port': '7', 'Condition': 'Latency bottleneck cleared', 'Message_status': 'extracted'}),
+    ('FCPH-1003', 'Port 12, Link Timeout',
+        {'Message_portIndex': '12', 'Condition': 'Port 12, Link Timeout', 'Message_status': 'extracted'}),
+    ('C2-1012', 'Link Timeout on internal port ftx=1 tx=1 on Slot 2, Port 3(27) rx=1 failed.',
+        {'Message_portIndex': '3', 'slot': '2', 'Condition': 'Link Timeout on internal port ftx=1 tx=1 ', 'Message_status': 'extracted'}),
+    ('C2-1006', 'S3,P5(Bp5) user_idx:53 [PID 0x013500] Frame timeout detected, tx port 5 rx port -1, sid 10900, did 13500',
+        {'Message_portIndex': '53', 'slot': '3', 'port': '5', 'Message_portId': '013500', 'sid': '10900', 'did': '13500', 'Condition': 'Frame timeout detected', 'tx_port': '5', 'rx_port': '-1', 'Message_status': 'extracted'}),
+    ('MAPS-1003', 'Flow (SID=0x010100,DID=0x020200,Host Port=4), Condition=FLOW(TX_THROUGHPUT>10), obj:flow',
+        {'port': '4', 'sid': '010100', 'did': '020200', 'Condition': 'FLOW(TX_THROUGHPUT>10)', 'obj': 'flow', 'Message_status': 'extracted'}),
+    ('FABR-1001', 'Domain 3, Port index 12 0x030c00 isolated.',
+        {'did': '030c00', 'Condition': 'Domain 3, Port index 12 0x030c00 isolated.', 'Message_domainID': '3', 'Message_status': 'extracted'}),
+    ('SEC-1193', 'Security violation: Login failure attempt via TELNET/SSH/RSH. IP Addr: 10.0.0.12',
+        {'Condition': 'Login failure attempt via TELNET/SSH/RSH', 'Dashboard_category': 'Security violation', 'IP_Address': '10.0.0.12', 'Message_status': 'extracted'}),
+    ('SEC-3014', 'Security Violation Event: Unauthorized host with IP address 10.0.0.13 tries to establish connection on port 22.',
+        {'Condition': 'Unauthorized host', 'Dashboard_category': 'Security Violation', 'IP_Address': '10.0.0.13', 'Message_status': 'extracted'}),
+    ('TS-1008', 'NTP Server used instead of LOCL: locl: 0x0 remote: 0x1',
+        {'Condition': 'NTP Server used instead of LOCL', 'Current_value': 'locl: 0x0 remote: 0x1', 'Message_status': 'extracted'}),
+    ('LOG-1000', 'Previous message repeated 3 time(s)',
+        {'Message_repeated_times': '3', 'Message_status': 'ignored'}),
+    ('ZONE-1010', 'EX_Port 4 ELS PLOGI from did 01020a to sid 030405 wwn 10:00:00:00:c9:00:00:01 NOT ZONE',
+        {'Message_portIndex': '4', 'sid': '030405', 'did': '01020a', 'Condition': 'EX_Port 4 ELS PLOGI from did 01020a to sid 030405 wwn 10:00:00:00:c9:00:00:01 NOT ZONE', 'wwn': '10:00:00:00:c9:00:00:01', 'Message_status': 'extracted'}),
+    ('PORT-1003', 'Port 24 Faulted because of many Link Failures',
+        {'port': '24', 'Condition': 'Port 24 Faulted because of many Link Failures', 'Message_status': 'extracted'}),
+    # message not matched by any pattern is copied to Condition
+    ('HAM-1004', 'Processor rebooted - Software Fault:ASSERT',
+        {'Condition': 'Processor rebooted - Software Fault:ASSERT', 'Message_status': 'copied'}),
+    ]
+
+EXTRACTED_COLUMNS = [
+    'Message_portIndex', 'Message_portType', 'slot', 'port', 'Message_portId', 'sid', 'did',
+    'Condition', 'Message_domainID', 'Message_repeated_times', 'Message_triggered_times', 'Current_value',
+    'Rule_name', 'Dashboard_category', 'obj', 'tx_port', 'rx_port', 'wwn', 'IP_Address', 'Message_status']
+
+
+@pytest.fixture(scope='module')
+def raslog_split_pattern_dct():
+    pattern_dct, _ = sfop.regex_pattern_import('raslog_split', max_title=80)
+    return pattern_dct
+
+
+def test_message_extract(raslog_split_pattern_dct):
+    errdump_df = pd.DataFrame([message[:2] for message in MESSAGE_EXTRACT], columns=['Message_ID', 'Message'])
+    errdump_df = message_extract(errdump_df, raslog_split_pattern_dct)
+
+    assert errdump_df.columns.tolist() == ['Message_ID', 'Message', *EXTRACTED_COLUMNS]
+    message_extract_df = errdump_df.drop(columns=['Message_ID', 'Message'])
+    for (*_, extract_dct), (_, extract_sr) in zip(MESSAGE_EXTRACT, message_extract_df.iterrows()):
+        assert extract_sr.dropna().to_dict() == extract_dct
+    # Message_triggered_times is not filled by any of these messages
+    assert message_extract_df['Message_triggered_times'].isna().all()
+
+
+def test_filter_errdump():
+    switch_params_aggregated_df = pd.DataFrame({'configname': ['sw01', 'sw01', 'sw02', 'sw03'],
+                                                'config_collection_date': ['2024-06-15 10:00:00', '2024-06-15 10:00:00', None, '2024-01-31']})
+    min_message_date_sr = get_min_message_date(switch_params_aggregated_df, errdump_period=3)
+    assert min_message_date_sr.fillna('').to_dict() == {'sw01': '2024/03/15-10:00:00', 'sw02': '', 'sw03': '2023/10/31-00:00:00'}
+
+    errdump_df = pd.DataFrame({'configname': ['sw01', 'sw01', 'sw02', 'sw03', 'sw03'],
+                               'Message_date': ['2024/03/15-10:00:00', '2024/03/15-09:59:59', '2000/01/01-00:00:00',
+                                                '2023/10/31-00:00:00', '2023/10/30-23:59:59']})
+    # messages of config without collection date are kept
+    assert filter_errdump(errdump_df, min_message_date_sr).index.tolist() == [0, 2, 3]
+    assert get_min_message_date(switch_params_aggregated_df, errdump_period=None) is None
+    assert filter_errdump(errdump_df).index.tolist() == [0, 1, 2, 3, 4]
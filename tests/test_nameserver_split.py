@@ -0,0 +1,71 @@
+"""Regression tests of NameServer PortSymb and NodeSymb split against results of the row by row split"""
+
+import pandas as pd
+import pytest
+
+import utilities.servicefile_operations as sfop
+from san_analysis.portcmd.nameserver.nameserver_split import nsshow_symb_split
+
+N = None
+
+# PortSymb, NodeSymb and not empty split values
+SYMB_SPLIT = [
+    ('HPE_3PAR 8440 - 1:2:3 - LPe16002', 'HPE_3PAR 8440 - 4UW0001234 - fw:3314',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 9, 'Device_Manufacturer': 'HPE', 'Device_Model': 'HPE_3PAR 8440', 'Device_SN': '4UW0001234', 'Device_Name_reserved': 'HPE_3PAR 8440 - 4UW0001234', 'Device_Fw': '3314'}),
+    ('NetApp FC Target Adapter 0c 0c:0a', 'NetApp FAS8200 (cluster-01)',
+        {'portSymbUsed': 'yes', 'portSymbPattern': 26, 'nodeSymbUsed': 'yes', 'nodeSymbPattern': 21, 'Device_Manufacturer': 'NetApp', 'Device_Model': 'NetApp FAS8200', 'Device_Name': 'cluster-01', 'Device_Port': '0c:0a'}),
+    ('HP MSA 2040 SAN G22x', 'QMH2672 FW:v8.08.204 DVR:v10.01.00.57',
+        {'portSymbUsed': 'yes', 'portSymbPattern': 14, 'nodeSymbUsed': 'yes', 'nodeSymbPattern': 2, 'Device_Manufacturer': 'HP', 'Device_Model': 'HP MSA 2040 SAN', 'Device_Fw': 'G22x', 'HBA_Model': 'QMH2672', 'HBA_Firmware': '8.08.204', 'HBA_Driver': '10.01.00.57'}),
+    ('QLogic Port1 pWWN 21:00:00:24:ff:00:00:01', 'QMH2672 FW:v8.08.204 DVR:v10.01.00.57',
+        {'portSymbUsed': 'yes', 'portSymbPattern': 3, 'nodeSymbUsed': 'yes', 'nodeSymbPattern': 2, 'HBA_Manufacturer': 'QLogic', 'HBA_Model': 'QMH2672', 'HBA_Firmware': '8.08.204', 'HBA_Driver': '10.01.00.57'}),
+    ('NFINIDATInfiniBox', 'QLE2692 FW:v8.08.204 DVR:v10.01.00.57',
+        {'portSymbUsed': 'yes', 'portSymbPattern': 15, 'nodeSymbUsed': 'yes', 'nodeSymbPattern': 2, 'Device_Manufacturer': 'NFINIDAT', 'Device_Model': 'NFINIDATInfiniBox', 'HBA_Model': 'QLE2692', 'HBA_Firmware': '8.08.204', 'HBA_Driver': '10.01.00.57'}),
+    (N, 'Emulex LPe32002-M2 FV12.8.340.8 DV12.8.0.5 HN:esx01.local OS:VMware ESXi 7.0',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 4, 'HBA_Manufacturer': 'Emulex', 'HBA_Model': 'LPe32002-M2', 'Host_Name': 'esx01.local', 'Host_OS': 'VMware ESXi 7.0', 'HBA_Firmware': '12.8.340.8', 'HBA_Driver': '12.8.0.5'}),
+    (N, 'Emulex LPe16002 FV11.4.204.11 DV11.4.0.7 HN:localhost OS:Linux',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 4, 'HBA_Manufacturer': 'Emulex', 'HBA_Model': 'LPe16002', 'Host_OS': 'Linux', 'HBA_Firmware': '11.4.204.11', 'HBA_Driver': '11.4.0.7'}),
+    (N, 'QLogic QL45212 FCoE 8.37.30.0 8.37.2.0 host-fcoe01.',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 20, 'HBA_Manufacturer': 'QLogic', 'HBA_Model': 'QL45212', 'Host_Name': 'host-fcoe01', 'HBA_Firmware': '8.37.2.0', 'HBA_Driver': '8.37.30.0'}),
+    (N, 'Embedded-AG | ag_sw01 | 1 | 10.0.0.5 | v8.2.1c',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 25, 'Device_Name': 'ag_sw01', 'Device_Fw': 'v8.2.1c', 'IP_Address': '10.0.0.5'}),
+    (N, 'hpux01_HP-UX_B.11.31',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 6, 'Host_Name': 'hpux01', 'Host_OS': 'HP-UX_B.11.31'}),
+    (N, 'HPE Ultrium 8-SCSI Q5B2 S/N-DEC0001234',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 11, 'Device_Manufacturer': 'HPE', 'Device_Model': 'HPE Ultrium 8-SCSI', 'Device_SN': 'DEC0001234', 'Device_Fw': 'Q5B2'}),
+    ('EMC INVISTA FNM00123456 A1-FC00', 'EMC INVISTA FNM00123456 A1-FC00',
+        {'portSymbUsed': 'yes', 'portSymbPattern': 16, 'nodeSymbUsed': 'yes', 'nodeSymbPattern': 16, 'Device_Manufacturer': 'EMC', 'Device_Model': 'EMC INVISTA', 'Device_SN': 'FNM00123456', 'Device_Name': 'EMC INVISTA FNM00123456', 'Device_Port': '-FC00'}),
+    (N, 'huawei corporation',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 32, 'Device_Manufacturer': 'huawei corporation'}),
+    (N, 'QLogic qedf v8.37.30',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 35}),
+    ('QLogic-QLE2692 | 10.01.00 | srv-db01 | Linux |', N,
+        {'portSymbUsed': 'yes', 'portSymbPattern': 27, 'HBA_Manufacturer': 'QLogic', 'HBA_Model': 'QLogic-QLE2692', 'Host_Name': 'srv-db01', 'Host_OS': 'Linux ', 'HBA_Driver': '10.01.00'}),
+    ('HPE StoreOnce S/N-CZ1234ABCD Node 1 Port-1', N,
+        {'portSymbUsed': 'yes', 'portSymbPattern': 8, 'Device_Manufacturer': 'HPE', 'Device_Model': 'HPE StoreOnce', 'Device_SN': 'CZ1234ABCD', 'Device_Name': 'HPE StoreOnce CZ1234ABCD', 'Device_Port': 'Port-1'}),
+    (N, 'HPE StoreOnce S/N-CZ1234ABCD Node 1',
+        {'nodeSymbUsed': 'yes', 'nodeSymbPattern': 7, 'Device_Manufacturer': 'HPE', 'Device_Model': 'HPE StoreOnce', 'Device_SN': 'CZ1234ABCD', 'Device_Name': 'HPE StoreOnce CZ1234ABCD'}),
+    ('#port 1#', '#node 1#',
+        {'Device_Name': '#node 1#', 'Device_Port': '#port 1#'}),
+    (N, N,
+        {}),
+    ]
+
+
+@pytest.fixture(scope='module')
+def ns_split_pattern_dct():
+    pattern_dct, _ = sfop.regex_pattern_import('ns_split', max_title=80)
+    return pattern_dct
+
+
+def test_nsshow_symb_split(ns_split_pattern_dct):
+    nsshow_df = pd.DataFrame([symb[:2] for symb in SYMB_SPLIT], columns=['PortSymb', 'NodeSymb'])
+    nsshow_join_df, nsshow_unsplit_df = nsshow_symb_split(nsshow_df, ns_split_pattern_dct)
+
+    symb_split_df = nsshow_join_df.drop(columns=['PortSymb', 'NodeSymb'])
+    for (*_, split_dct), (_, split_sr) in zip(SYMB_SPLIT, symb_split_df.iterrows()):
+        assert split_sr.dropna().to_dict() == split_dct
+    # pattern numbers are float, columns not filled by any pattern are empty
+    assert symb_split_df[['portSymbPattern', 'nodeSymbPattern']].dtypes.eq('float64').all()
+    assert symb_split_df[['Device_Location', 'HBA_Description']].isna().all(axis=None)
+    # only row with not empty and not matched symb values is unsplit
+    assert nsshow_unsplit_df.index.tolist() == [17]
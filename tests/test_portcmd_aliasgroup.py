@@ -0,0 +1,37 @@
+"""Regression tests of alias group name search against results of the substring by substring search"""
+
+import pytest
+
+from san_analysis.portcmd.portcmd_aliasgroup import (find_grp_name,
+                                                     get_longest_common_subseq)
+
+
+@pytest.mark.parametrize('aliases, grp_name', [
+    ('srv01_hba1, srv01_hba2', 'srv01_hba'),
+    ('esx_host12_p1, esx_host12_p2, esx_host12_p3', 'esx_host12_p'),
+    ('db-node1_fa, db-node2_fa', 'db-node'),
+    ('msa2040_a1, msa2040_b1, msa2040_a2', 'msa2040'),
+    ('host_a1_node, node_host_a1', 'host_a1'),
+    ('BL460_SRV_01_A, BL460_SRV_01_B, bl460_srv_01_c', '460'),
+    ('aaaa, aaa', 'aaa'),
+    ('single_alias', 'single_alias'),
+    # separators are stripped
+    ('ab_x, ab_y', 'ab'),
+    # no common substring of 3 or more characters
+    ('abc, xyz', None),
+    ])
+def test_find_grp_name(aliases, grp_name):
+    assert find_grp_name(aliases) == grp_name
+
+
+@pytest.mark.parametrize('data, substr', [
+    # leftmost longest common substring of the first string is returned
+    (['xx_abc_yy_abd', 'zz_abd_ww_abc'], '_abc'),
+    (['abd_abc', 'abc_abd'], 'abd'),
+    (['aabcaab', 'caab', 'aabc'], 'aab'),
+    (['abc', 'def'], ''),
+    (['', 'abc'], ''),
+    (['abc'], ''),
+    ])
+def test_get_longest_common_subseq(data, substr):
+    assert get_longest_common_subseq(data) == substr
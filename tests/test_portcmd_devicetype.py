@@ -0,0 +1,89 @@
+"""Regression tests of device class and type definition (type_check) against row by row results"""
+
+import numpy as np
+import pandas as pd
+
+from san_analysis.portcmd.portcmd_devicetype import type_check
+
+N = None
+
+# ports with oui type, nameserver and port details
+COLUMNS = ['type', 'subtype', 'Connected_portWwn_switchshow_filled', 'Device_type', 'portType', 'switchMode', 'portState',
+           'HBA_Manufacturer', 'HBA_Model', 'Host_OS', 'HBA_Firmware', 'HBA_Driver', 'Device_Model', 'Device_SN',
+           'NodeSymb', 'Connected_portId', 'portScn_details', 'deviceType', 'deviceSubtype']
+# expected deviceType and deviceSubtype are the last two values of each row
+ROWS = [
+    # blade and synergy server hba
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:00:c9:00:00:01', 'Physical Initiator', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010100', N, N, N, 'SRV_BLADE', 'QLOGIC'],
+    ['SRV|SWITCH', 'EMULEX|BROCADE', '10:00:00:00:c9:00:00:02', 'Physical Initiator', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010200', N, N, N, 'SRV_SYNERGY', 'EMULEX'],
+    # strictly defined type
+    ['STORAGE', '3PAR', '20:00:00:02:ac:00:00:01', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010300', N, N, N, 'STORAGE', '3PAR'],
+    # SRV|SWITCH
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:05:1e:00:00:03', 'NPIV Initiator', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010400', N, N, N, 'SRV', 'QLOGIC|BROCADE'],
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:05:1e:00:00:04', N, 'E-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010500', N, N, N, 'SWITCH', 'QLOGIC|BROCADE'],
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:05:1e:aa:bb:cc', N, 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010600', N, N, N, 'SWITCH', 'QLOGIC|BROCADE'],
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:05:1e:00:00:05', N, 'N-Port', 'Access Gateway Mode', 'Online', N, N, N, N, N, N, N, N, '010700', N, N, N, 'SWITCH', 'AG'],
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:05:1e:00:00:06', N, 'F-Port', 'Native', 'Online', 'AG Brocade', N, N, N, N, N, N, N, '010800', N, N, N, 'SWITCH', 'QLOGIC|BROCADE'],
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:05:1e:00:00:07', 'Physical Unknown(initiator/target)', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010900', N, N, N, 'SWITCH', 'QLOGIC|BROCADE'],
+    ['SRV|SWITCH', 'QLOGIC|BROCADE', '10:00:00:05:1e:00:00:08', N, 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010a00', N, N, N, 'SRV', 'QLOGIC|BROCADE'],
+    # STORAGE|SWITCH
+    ['STORAGE|SWITCH', 'MSA|BROCADE', '20:70:00:c0:ff:00:00:01', 'Physical Unknown(initiator/target)', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010b00', N, N, N, 'SWITCH', 'MSA|BROCADE'],
+    ['STORAGE|SWITCH', 'MSA|BROCADE', '20:70:00:c0:ff:00:00:02', 'Physical Initiator+Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010c00', N, N, N, 'STORAGE', 'MSA|BROCADE'],
+    ['STORAGE|SWITCH', 'MSA|BROCADE', '20:70:00:c0:ff:00:00:03', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '010d00', N, 'STORAGE', 'MSA', 'STORAGE', 'MSA'],
+    # StoreOnce and D2D
+    ['STORAGE|LIB', 'EVA|ESL', '50:01:43:80:00:00:00:01', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, 'HPE StoreOnce 5100', N, N, '010e00', N, N, N, 'LIB', 'StoreOnce'],
+    ['STORAGE|LIB', 'EVA|ESL', '50:01:43:80:00:00:00:02', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, 'D2D4324', N, N, '010f00', N, N, N, 'LIB', 'D2D'],
+    # STORAGE|LIB
+    ['STORAGE|LIB', 'EVA|ESL', '50:01:43:80:00:00:00:03', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, 'Ultrium 8-SCSI', N, N, '011000', N, N, N, 'LIB', 'ESL'],
+    ['STORAGE|LIB', 'EVA|ESL', '50:01:43:80:00:00:00:04', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011100', N, N, N, 'STORAGE', 'EVA'],
+    # SRV|LIB
+    ['SRV|LIB', 'EMULEX|MSL', '10:00:00:00:c9:00:00:05', 'Physical Initiator', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011200', N, N, N, 'SRV', 'EMULEX'],
+    ['SRV|LIB', 'EMULEX|MSL', '10:00:00:00:c9:00:00:06', 'NPIV Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011300', N, N, N, 'LIB', 'MSL'],
+    ['SRV|LIB', 'EMULEX|MSL', '10:00:00:00:c9:00:00:07', 'Physical Unknown(initiator/target)', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011400', N, N, N, 'SRV', 'EMULEX'],
+    ['SRV|LIB', 'EMULEX|MSL', '10:00:00:00:c9:00:00:08', 'Physical Unknown(initiator/target)', 'F-Port', 'Native', 'Online', N, N, N, N, N, 'MSL', N, N, '011500', N, N, N, 'SRV|LIB', 'EMULEX|MSL'],
+    # SRV|STORAGE
+    ['SRV|STORAGE', 'QLOGIC|XP', '50:06:0e:80:00:00:00:01', 'Physical Initiator', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011600', N, N, N, 'SRV', 'QLOGIC'],
+    ['SRV|STORAGE', 'QLOGIC|XP', '50:06:0e:80:00:00:00:02', N, 'F-Port', 'Native', 'Online', 'QLogic', N, N, N, N, N, N, N, '011700', N, N, N, 'SRV', 'QLOGIC'],
+    ['SRV|STORAGE', 'QLOGIC|XP', '50:06:0e:80:00:00:00:03', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011800', N, N, N, 'STORAGE', 'XP'],
+    # SRV|STORAGE|LIB
+    ['SRV|STORAGE|LIB', 'QLOGIC|EVA|ESL', '50:01:10:a0:00:00:00:01', 'NPIV Initiator', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011900', N, N, N, 'SRV', 'QLOGIC'],
+    ['SRV|STORAGE|LIB', 'QLOGIC|EVA|ESL', '50:01:10:a0:00:00:00:02', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, 'HP Ultrium 6-SCSI', '011a00', N, N, N, 'LIB', 'ESL'],
+    ['SRV|STORAGE|LIB', 'QLOGIC|EVA|ESL', '50:01:10:a0:00:00:00:03', N, 'F-Port', 'Native', 'Online', 'QLogic', 'QMH2672', 'Linux', '8.08', '10.1', N, N, N, '011b00', N, N, N, 'SRV', 'QLOGIC'],
+    ['SRV|STORAGE|LIB', 'QLOGIC|EVA|ESL', '50:01:10:a0:00:00:00:04', 'Physical Target', 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011c00', N, N, N, 'STORAGE', 'EVA'],
+    # no oui
+    [N, N, N, N, 'N-Port', 'Access Gateway Mode', 'Online', N, N, N, N, N, N, N, N, N, N, N, N, 'SWITCH', 'SWITCH'],
+    [N, N, N, N, 'E-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, N, N, N, N, 'SWITCH', 'SWITCH'],
+    [N, N, N, N, 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, N, 'Trunk port, master is Port 1', N, N, N, N],
+    [N, N, '10:00:00:00:00:00:00:09', N, 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011d00', N, N, N, 'UNKNOWN', 'UNKNOWN'],
+    [N, N, N, N, 'D-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, N, N, N, N, N, N],
+    [N, N, N, N, 'U-Port', 'Native', 'No_Light', N, N, N, N, N, N, N, N, N, N, N, N, N, N],
+    [N, N, '10:00:00:00:00:00:00:0a', N, 'F-Port', 'Native', 'Online', N, N, N, N, N, N, N, N, '011e00', N, 'SRV', 'QLOGIC', 'SRV', 'QLOGIC'],
+    ]
+
+
+def create_type_check_inputs():
+    """Function returns type_check args: ports, switches oui, blade and synergy servers"""
+
+
+    port_df = pd.DataFrame([row[:-2] for row in ROWS], columns=COLUMNS)
+    switches_oui = pd.Series(['10:00:00:05:1e:aa:bb:cc', '10:00:00:05:1e:dd:ee:ff']).str.slice(start=6)
+    blade_df = pd.DataFrame({'portWwn': ['10:00:00:00:c9:00:00:01', np.nan]})
+    synergy_df = pd.DataFrame({'Connected_portWwn': ['10:00:00:00:c9:00:00:02']})
+    return port_df, switches_oui, blade_df, synergy_df
+
+
+def test_type_check_rules():
+    device_type_df = type_check(*create_type_check_inputs())
+
+    assert device_type_df.columns.tolist() == ['deviceType', 'deviceSubtype']
+    result_lst = device_type_df.astype('object').where(device_type_df.notna(), None).values.tolist()
+    assert result_lst == [row[-2:] for row in ROWS]
+
+
+def test_type_check_empty_synergy():
+    port_df, switches_oui, blade_df, _ = create_type_check_inputs()
+    device_type_df = type_check(port_df, switches_oui, blade_df, pd.DataFrame())
+
+    # synergy server hba is defined by oui rules only
+    assert device_type_df.loc[1].tolist() == ['SRV', 'EMULEX|BROCADE']
+    assert device_type_df.loc[0].tolist() == ['SRV_BLADE', 'QLOGIC']
@@ -0,0 +1,60 @@
+"""Offline tests of 3PAR configuration download from STATs with folder fetcher"""
+
+import os
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import san_parser.storage_3par.storage_3par_download as download
+from san_parser.storage_3par.storage_3par_fetcher import (create_folder_fetcher,
+                                                          get_stats_fetcher)
+
+MAX_TITLE = 80
+
+
+@pytest.fixture
+def stats_folder(tmp_path):
+    """Folder with 3PAR configuration files: 1111111 has today configuration, 
+    2222222 has outdated configuration only, 3333333 has no configuration"""
+
+    folder = tmp_path / 'stats'
+    folder.mkdir()
+    today = date.today().strftime("%y%m%d")
+    (folder / f'1111111_config_{today}.out').write_text('config 1111111')
+    (folder / '2222222_config_200101.out').write_text('config 2222222')
+    return folder
+
+
+@pytest.fixture
+def ns_3par_df():
+    return pd.DataFrame({'System_Model': ['HPE_3PAR 8440', 'HPE_3PAR 8200', 'HPE_3PAR 9450'],
+                         'Serial_Number': ['1111111', '2222222', '3333333']})
+
+
+def test_stats_fetcher_folder_selected(stats_folder):
+    software_path_sr = pd.Series({'s3mft': 's3mft.exe', 'stats_folder': str(stats_folder)})
+    fetcher = get_stats_fetcher(software_path_sr)
+    assert fetcher['find_config']('1111111')[0] == 'ok'
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_stats_download_folder(stats_folder, ns_3par_df, tmp_path, monkeypatch, workers):
+    monkeypatch.setattr(download, 'STORAGE_DOWNLOAD_WORKERS', workers)
+    download_folder = tmp_path / '3par_configs'
+    today = date.today().strftime("%y%m%d")
+
+    ns_3par_df = download.stats_download(ns_3par_df, str(download_folder), 
+                                         create_folder_fetcher(str(stats_folder)), MAX_TITLE)
+
+    assert ns_3par_df['STATs_status'].tolist() == ['ok', 'skip', 'no data']
+    assert [os.path.basename(config) if isinstance(config, str) else config for config in ns_3par_df['configname']] == \
+        [f'1111111_config_{today}.out', '2222222_config_200101.out', None]
+    assert os.listdir(download_folder) == [f'array_1111111_1111111_config_{today}.out']
+    assert (download_folder / f'array_1111111_1111111_config_{today}.out').read_text() == 'config 1111111'
+
+
+def test_stats_download_missing_folder(ns_3par_df, tmp_path):
+    fetcher = create_folder_fetcher(str(tmp_path / 'missing'))
+    with pytest.raises(SystemExit):
+        download.stats_download(ns_3par_df, str(tmp_path / '3par_configs'), fetcher, MAX_TITLE)
@@ -0,0 +1,79 @@
+"""Regression tests of switch pair search with connected devices and switch names
+against results of the switch by switch search"""
+
+import numpy as np
+import pandas as pd
+
+from san_analysis.switch_pair.switch_pair_search import (
+    create_device_match_index, create_switchname_candidates_index,
+    find_nonzero_device_connected_switch_pair,
+    find_zero_device_connected_switchname_match)
+
+N = np.nan
+
+SW_PAIR_COLUMNS = ['Connected_device_number', 'Device_number_match', 'Device_match_ratio', 
+                   'Switch_pairing_type', 'switchName_pair', 'switchWwn_pair', 'switchName_pair_by_labels',
+                   'switchName_pair_max_device_connected', 'switchWwn_pair_max_device_connected']
+
+# configname, Fabric_name, Fabric_label, switchType, switchMode, switchName, switchWwn
+SWITCHES = [
+    ['cfg_a1', 'BB', 'A', 162, 'Native', 'core_a1', 'a1'],
+    ['cfg_a2', 'BB', 'A', 162, 'Native', 'edge_a2', 'a2'],
+    ['cfg_a3', 'BB', 'A', 162, 'Native', 'spare_sw_a3', 'a3'],
+    [N, 'BB', 'A', 162, 'Native', 'noconfig_a4', 'a4'],
+    ['cfg_b1', 'BB', 'B', 162, 'Native', 'core_b1', 'b1'],
+    ['cfg_b5', 'BB', 'B', 162, 'Native', 'core_b5', 'b5'],
+    ['cfg_b2', 'BB', 'B', 162, 'Native', 'edge_b2', 'b2'],
+    ['cfg_b3', 'BB', 'B', 162, 'Native', 'spare_sw_b3', 'b3'],
+    ['cfg_b4', 'BB', 'B', 170, 'Native', 'spare_sw_b4', 'b4'],
+    ]
+
+# switchWwn and Device_Host_Name of connected devices
+DEVICES = [
+    ['a1', 'srv1'], ['a1', 'srv2'], ['a1', 'srv3'], ['a1', 'srv4'],
+    ['a2', 'srv5'], ['a2', 'srv6'], ['a2', 'srv7'], ['a2', N],
+    ['b1', 'srv1'], ['b1', 'srv2'], ['b1', 'srv3'], ['b1', 'srv4'],
+    ['b5', 'srv1'], ['b5', 'srv2'], ['b5', 'srv3'], ['b5', 'srv4'],
+    ['b2', 'srv5'], ['b2', 'srv8'], ['b2', 'srv9'],
+    ['b4', 'srv6'],
+    ]
+
+# expected SW_PAIR_COLUMNS values of each switch
+SW_PAIRS = [
+    # two candidates with the same device match, pair is chosen by switch name
+    [4, 4, 1.0, 'device_list, switch_name', 'core_b1', 'b1', N, 'core_b1, core_b5', 'b1, b5'],
+    # device match ratio is below MIN_DEVICE_NUMBER_MATCH_RATIO
+    [3, 1, 0.33, N, N, N, N, N, N],
+    # no device connected, pair is found by switch name
+    [0, 0, 0.0, 'switch_name', 'spare_sw_b3', 'b3', N, N, N],
+    # no config collected
+    [N, N, N, N, N, N, N, N, N],
+    [4, 4, 1.0, 'device_list', 'core_a1', 'a1', N, 'core_a1', 'a1'],
+    [4, 4, 1.0, 'device_list', 'core_a1', 'a1', N, 'core_a1', 'a1'],
+    [3, 1, 0.33, N, N, N, N, N, N],
+    [0, 0, 0.0, 'switch_name', 'spare_sw_a3', 'a3', N, N, N],
+    # no candidates with the same switchType
+    [1, N, N, N, N, N, N, N, N],
+    ]
+
+
+def test_switch_pair_search():
+    switch_pair_df = pd.DataFrame(SWITCHES, columns=['configname', 'Fabric_name', 'Fabric_label', 
+                                                     'switchType', 'switchMode', 'switchName', 'switchWwn'])
+    switch_pair_df = switch_pair_df.reindex(columns=[*switch_pair_df.columns, *SW_PAIR_COLUMNS])
+    devices_df = pd.DataFrame(DEVICES, columns=['switchWwn', 'Device_Host_Name'])
+    devices_df = devices_df.merge(switch_pair_df[['switchWwn', 'Fabric_name', 'Fabric_label', 'switchType', 'switchMode']], 
+                                  on='switchWwn')
+    sw_wwn_name_match_sr = switch_pair_df.set_index('switchWwn')['switchName']
+
+    device_match_index_dct = create_device_match_index(devices_df)
+    switch_pair_df[SW_PAIR_COLUMNS] = switch_pair_df.apply(
+        lambda series: find_nonzero_device_connected_switch_pair(
+            series, sw_wwn_name_match_sr, device_match_index_dct, ['A', 'B'], SW_PAIR_COLUMNS, 0.5, 0.8), axis=1)
+    switchname_candidates_index_dct = create_switchname_candidates_index(switch_pair_df)
+    switch_pair_df[SW_PAIR_COLUMNS[3:7]] = switch_pair_df.apply(
+        lambda series: find_zero_device_connected_switchname_match(
+            series, switchname_candidates_index_dct, sw_wwn_name_match_sr, SW_PAIR_COLUMNS, 0.8), axis=1)
+
+    expected_df = pd.DataFrame(SW_PAIRS, columns=SW_PAIR_COLUMNS)
+    pd.testing.assert_frame_equal(switch_pair_df[SW_PAIR_COLUMNS], expected_df, check_dtype=False)
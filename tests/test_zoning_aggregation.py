@@ -0,0 +1,63 @@
+"""Regression tests of zoning WWN type definition and WWNN, Domain_Index replacement with WWNP
+against results of the list based search"""
+
+import pandas as pd
+import pytest
+
+from san_analysis.zoning.zoning_aggregation_aux_fn import (create_wwn_index,
+                                                           replace_domain_index,
+                                                           replace_wwnn,
+                                                           wwn_type)
+
+N = None
+
+# Fabric_name, Fabric_label, PortName, NodeName, Domain_Index
+PORTSHOW = [
+    # two ports of the same node
+    ['BB', 'A', '10:00:00:00:c9:00:00:01', '20:00:00:00:c9:00:00:01', '1,1'],
+    ['BB', 'A', '10:00:00:00:c9:00:00:02', '20:00:00:00:c9:00:00:01', '1,2'],
+    # identical port and node WWNs
+    ['BB', 'A', '50:00:00:00:00:00:00:03', '50:00:00:00:00:00:00:03', '1,3'],
+    ['BB', 'A', '10:00:00:00:c9:00:00:04', '20:00:00:00:c9:00:00:04', '1,4'],
+    ['BB', 'B', '10:00:00:00:c9:00:00:05', '20:00:00:00:c9:00:00:05', '2,1'],
+    # no device connected
+    ['BB', 'A', N, N, '1,5'],
+    ]
+
+# Fabric_name, Fabric_label, zone, alias_member (WWNN with two WWNPs is unpacked to two rows) and expected Wwn_type, Strict_Wwnp, Wwnn_unpack
+ZONE_MEMBERS = [
+    ['BB', 'A', 'zone_1', '10:00:00:00:c9:00:00:01', 'Wwnp', '10:00:00:00:c9:00:00:01', N],
+    ['BB', 'A', 'zone_1', '20:00:00:00:c9:00:00:01', 'Wwnn', '10:00:00:00:c9:00:00:01', 'Да'],
+    ['BB', 'A', 'zone_1', '20:00:00:00:c9:00:00:01', 'Wwnn', '10:00:00:00:c9:00:00:02', 'Да'],
+    ['BB', 'A', 'zone_2', '50:00:00:00:00:00:00:03', 'Wwnp', '50:00:00:00:00:00:00:03', N],
+    ['BB', 'A', 'zone_2', '20:00:00:00:c9:00:00:04', 'Wwnn', '10:00:00:00:c9:00:00:04', N],
+    ['BB', 'A', 'zone_3', '1,2', N, '10:00:00:00:c9:00:00:02', N],
+    ['BB', 'A', 'zone_3', '1,5', N, N, N],
+    # WWNN from the other fabric label is not replaced
+    ['BB', 'A', 'zone_3', '20:00:00:00:c9:00:00:05', 'Wwnn', '20:00:00:00:c9:00:00:05', N],
+    ['BB', 'B', 'zone_4', '20:00:00:00:c9:00:00:05', 'Wwnn', '10:00:00:00:c9:00:00:05', N],
+    ['BB', 'B', 'zone_4', '10:00:00:00:c9:00:00:99', N, '10:00:00:00:c9:00:00:99', N],
+    ['BB', 'B', 'zone_4', '2,1', N, '10:00:00:00:c9:00:00:05', N],
+    ]
+
+RESULT_COLUMNS = ['alias_member', 'Wwn_type', 'Strict_Wwnp', 'Wwnn_unpack']
+
+
+@pytest.mark.filterwarnings('ignore::FutureWarning')
+def test_wwn_type_and_wwnp_replace():
+    portshow_aggregated_df = pd.DataFrame(PORTSHOW, columns=['Fabric_name', 'Fabric_label', 'PortName', 'NodeName', 'Domain_Index'])
+    # zone and alias members before WWNN is unpacked
+    alias_aggregated_df = pd.DataFrame([member[:4] for member in ZONE_MEMBERS], 
+                                        columns=['Fabric_name', 'Fabric_label', 'alias', 'alias_member']).drop_duplicates()
+    zoning_aggregated_df = alias_aggregated_df.rename(columns={'alias': 'zone'})
+
+    wwn_index_dct = create_wwn_index(portshow_aggregated_df)
+    zoning_aggregated_df, alias_aggregated_df = wwn_type(zoning_aggregated_df, alias_aggregated_df, wwn_index_dct)
+    zoning_aggregated_df, alias_aggregated_df = replace_wwnn(zoning_aggregated_df, alias_aggregated_df, wwn_index_dct)
+    zoning_aggregated_df = replace_domain_index(zoning_aggregated_df, wwn_index_dct)
+    alias_aggregated_df = replace_domain_index(alias_aggregated_df, wwn_index_dct)
+
+    expected_lst = [[member[3], *member[4:]] for member in ZONE_MEMBERS]
+    for aggregated_df in (zoning_aggregated_df, alias_aggregated_df):
+        result_df = aggregated_df[RESULT_COLUMNS]
+        assert result_df.astype('object').where(result_df.notna(), None).values.tolist() == expected_lst
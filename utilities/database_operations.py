@@ -1,21 +1,88 @@
-"""Module to perform operations SQLite3 database and check if data in database is empty"""
+"""Module to perform operations with SQLite3 database (or parquet/feather files) and check if data in database is empty"""
 
 
+import atexit
+import importlib.util
 import os
 import sqlite3
+import threading
 import warnings
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 
+import utilities.dataframe_operations as dfop
 from utilities.module_execution import status_info
 
+# database backends with columnar file extension (sqlite backend keeps all data in single database file)
+DB_BACKEND_EXTENSIONS = {'sqlite': None, 'parquet': '.parquet', 'feather': '.feather'}
+# schema metadata key to restore Series from columnar file
+SERIES_METADATA_KEY = b'san_automation_series'
+
+# database connections opened during program execution {db_path: connection}
+db_connection_dct = {}
+# table names in each database with opened connection {db_path: set of table names}
+db_tables_dct = {}
+# database connections are shared by analysis stages running in threads
+# (reads and writes are serialized)
+db_lock = threading.RLock()
+# tables written by chunks and not completed yet
+# {data_name: {'db_path', 'columnar_path', 'writer', 'schema', 'rows'}}
+db_append_dct = {}
+
+
+def get_db_connection(db_path):
+    """Function returns connection to the db_path database. 
+    Connection is opened on first request and kept until program execution is finished.
+    Transactions are controlled explicitly, WAL journal mode is used if database is not locked"""
+
+    if not db_path in db_connection_dct:
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        except sqlite3.OperationalError:
+            # journal mode can't be changed if database is locked by other application
+            pass
+        db_connection_dct[db_path] = conn
+        db_tables_dct[db_path] = {table_name for table_name, in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    return db_connection_dct[db_path]
+
+
+def get_db_tables(db_path):
+    """Function returns set of table names in the db_path database"""
+
+    get_db_connection(db_path)
+    return db_tables_dct[db_path]
+
+
+@atexit.register
+def close_db_connections():
+    """Function closes all database connections opened during program execution"""
+
+    for conn in db_connection_dct.values():
+        conn.close()
+    db_connection_dct.clear()
+    db_tables_dct.clear()
+
 
 def write_database(project_constants_lst, data_names, *args):
-    """Function to write table data to SQL database.
-    Args are comma separated DataFrames to save."""
+    """Function to write table data to SQL database or columnar files (database_backend in report requisites).
+    Args are comma separated DataFrames to save.
+    All DataFrames of the same database are written in single transaction."""
+
+    with db_lock:
+        write_database_tables(project_constants_lst, data_names, *args)
+
+
+def write_database_tables(project_constants_lst, data_names, *args):
+    """Function writes DataFrames to the databases (see write_database)"""
 
     project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
+    db_backend = get_db_backend(report_requisites_sr)
+    # databases with opened transaction
+    db_path_lst = []
 
     for data_name, data_exported in zip(data_names, args):
         # db_type = report_steps_dct[data_name][2]
@@ -28,15 +95,119 @@ def write_database(project_constants_lst, data_names, *args):
         # saving data for DataFrame
         if isinstance(data_exported, (pd.DataFrame, pd.Series)):
             data_exported_flat, empty_data = dataframe_flatten(data_exported)
-            substitute_names(data_exported_flat, 'write')
+            columnar_path = get_columnar_path(db_path, data_name, db_backend)
+            # save single level Index DataFrame to columnar file (dtypes and column names are kept)
+            if columnar_path and write_columnar(columnar_path, data_exported_flat):
+                # drop outdated table from database
+                if os.path.isfile(db_path) and data_name in get_db_tables(db_path):
+                    write_sql(db_path, data_name, None, max_title, info)
+                    db_path_lst.append(db_path)
             # save single level Index DataFrame to database
-            write_sql(db_path, data_name, data_exported_flat, max_title, info)
+            else:
+                columnar_path = None
+                substitute_names(data_exported_flat, 'write')
+                write_sql(db_path, data_name, data_exported_flat, max_title, info)
+                db_path_lst.append(db_path)
+            # remove outdated columnar files written with other backends
+            remove_columnar_files(db_path, data_name, keep_path=columnar_path)
             if not empty_data:
                 status_info('ok', max_title, len(info))
             else:
                 status_info('empty', max_title, len(info))
         else:
             status_info('skip', max_title, len(info))
+    # commit transaction for each database
+    for db_path in dict.fromkeys(db_path_lst):
+        commit_sql(db_path, max_title)
+
+
+def get_db_backend(report_requisites_sr):
+    """Function returns database backend defined in report requisites ('sqlite' by default)"""
+
+    return validate_db_backend(report_requisites_sr.get('database_backend'))
+
+
+@lru_cache(maxsize=None)
+def validate_db_backend(db_backend):
+    """Function verifies database backend (warning is shown once for each value).
+    Columnar backends (parquet, feather) require pyarrow package"""
+
+    db_backend = db_backend.strip().lower() if isinstance(db_backend, str) else 'sqlite'
+    if not db_backend in DB_BACKEND_EXTENSIONS:
+        print(f"\nUnknown database backend '{db_backend}'. SQLite database is used.")
+        db_backend = 'sqlite'
+    elif db_backend != 'sqlite' and importlib.util.find_spec('pyarrow') is None:
+        print(f"\npyarrow package required for '{db_backend}' database backend is not found. SQLite database is used.")
+        db_backend = 'sqlite'
+    return db_backend
+
+
+def get_columnar_path(db_path, data_name, db_backend):
+    """Function returns path of the columnar file for the data_name. 
+    Files are located in the folder named as database file without extension.
+    Returns None for sqlite backend"""
+
+    if DB_BACKEND_EXTENSIONS[db_backend] is None:
+        return None
+    columnar_folder = os.path.splitext(db_path)[0]
+    return os.path.join(columnar_folder, data_name + DB_BACKEND_EXTENSIONS[db_backend])
+
+
+def write_columnar(columnar_path, df):
+    """Function writes DataFrame (without index) or Series (with index) to the parquet or feather file.
+    Returns False if data can't be converted to arrow table (columns with mixed types or duplicated column names)"""
+
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if isinstance(df, pd.DataFrame) and not df.columns.is_unique:
+        return False
+    try:
+        if isinstance(df, pd.Series):
+            table = pa.Table.from_pandas(df.to_frame(), preserve_index=True)
+            table = table.replace_schema_metadata({**table.schema.metadata, SERIES_METADATA_KEY: b'1'})
+        else:
+            # Arrow backed string columns are saved as object columns to be read with the same missing values semantics
+            table = pa.Table.from_pandas(dfop.restore_arrow_string(df), preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, ValueError):
+        return False
+
+    os.makedirs(os.path.dirname(columnar_path), exist_ok=True)
+    # file is replaced after it's completely written
+    columnar_tmp_path = columnar_path + '.tmp'
+    if columnar_path.endswith('.parquet'):
+        pq.write_table(table, columnar_tmp_path)
+    else:
+        feather.write_feather(table, columnar_tmp_path)
+    os.replace(columnar_tmp_path, columnar_path)
+    return True
+
+
+def remove_columnar_files(db_path, data_name, keep_path=None):
+    """Function removes data_name columnar files of all backends except keep_path file"""
+
+    for db_backend in DB_BACKEND_EXTENSIONS:
+        columnar_path = get_columnar_path(db_path, data_name, db_backend)
+        if columnar_path and columnar_path != keep_path and os.path.isfile(columnar_path):
+            os.remove(columnar_path)
+
+
+def read_columnar(columnar_path):
+    """Function reads memory-mapped parquet or feather file and returns DataFrame or Series"""
+
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if columnar_path.endswith('.parquet'):
+        table = pq.read_table(columnar_path, memory_map=True)
+    else:
+        table = feather.read_table(columnar_path, memory_map=True)
+    df = table.to_pandas()
+    # revert single column DataFrame to Series
+    if table.schema.metadata and SERIES_METADATA_KEY in table.schema.metadata:
+        df = df.squeeze('columns')
+    return df
 
 
 def dataframe_flatten(df):
@@ -87,38 +258,238 @@ def substitute_names(df, operation):
             df.rename(columns=replace_dct, inplace=True)
 
 
-def write_sql(db_path, data_name, df, max_title, info):
-    """Function to write DataFrame to SQL DB"""
+def write_sql(db_path, data_name, df, max_title, info, append=False):
+    """Function to write DataFrame to SQL DB within database transaction
+    (transaction is opened if required). If df is None then data_name table is dropped.
+    If append is on then df rows are inserted to the existing data_name table"""
 
     with warnings.catch_warnings():
         warnings.filterwarnings(action="ignore", 
                                 message="The spaces in these column names will not be changed. In pandas versions < 0.14, spaces were converted to underscores.")
-        keep_index = True if isinstance(df, pd.Series) else False
         conn = None
-        status = None
         try:
-            conn = sqlite3.connect(db_path)
-            df.to_sql(name=data_name, con=conn, index=keep_index, if_exists='replace')
+            conn = get_db_connection(db_path)
+            if not conn.in_transaction:
+                conn.execute('BEGIN')
+            if df is None:
+                conn.execute(f'DROP TABLE IF EXISTS "{data_name}"')
+                db_tables_dct[db_path].discard(data_name)
+            elif append:
+                insert_sql_rows(conn, data_name, df)
+            else:
+                replace_sql_table(conn, data_name, df)
+                db_tables_dct[db_path].add(data_name)
         except (pd.io.sql.DatabaseError, sqlite3.OperationalError) as e:
-            status = status_info('fail', max_title, len(info))
+            status_info('fail', max_title, len(info))
             if 'database is locked' in e.args[0]:
                 print(f"\nCan't write {data_name} to {os.path.basename(db_path)}. DB is locked. Close it to proceed.\n")
             else:
                 print('\n', e)
-        finally:
-            if conn is not None:
-                conn.close()
-            if status=='FAIL':
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
+            exit()
+
+
+def replace_sql_table(conn, data_name, df):
+    """Function replaces data_name table with df the same way as DataFrame.to_sql with if_exists='replace' does
+    (pandas sqlite table schema is used) but within current transaction.
+    All rows are inserted with single executemany call"""
+
+    # Series is saved with index
+    if isinstance(df, pd.Series):
+        df = df.to_frame().reset_index()
+    conn.execute(f'DROP TABLE IF EXISTS "{data_name}"')
+    conn.execute(pd.io.sql.get_schema(df, data_name, con=conn))
+    insert_sql_rows(conn, data_name, df)
+
+
+def insert_sql_rows(conn, data_name, df):
+    """Function inserts df rows to the data_name table with single executemany call"""
+
+    columns = ', '.join('"' + str(column).replace('"', '""') + '"' for column in df.columns)
+    placeholders = ', '.join(['?'] * len(df.columns))
+    conn.executemany(f'INSERT INTO "{data_name}" ({columns}) VALUES ({placeholders})', get_sql_rows(df))
+
+
+def get_sql_rows(df):
+    """Function returns iterator of df rows with values converted to sqlite types
+    (missing values to NULL, datetimes to strings as DataFrame.to_sql does)"""
+
+    column_values_lst = []
+    for _, sr in df.items():
+        if pd.api.types.is_datetime64_any_dtype(sr):
+            values = [value.isoformat(' ') if pd.notna(value) else None for value in sr.astype('object')]
+        else:
+            values = sr.astype('object').where(sr.notna(), None).tolist()
+        column_values_lst.append(values)
+    return zip(*column_values_lst)
+
+
+def commit_sql(db_path, max_title):
+    """Function to commit opened transaction of the db_path database"""
+
+    conn = db_connection_dct.get(db_path)
+    if conn is None or not conn.in_transaction:
+        return
+    try:
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        info = f'Commiting {os.path.basename(db_path)}'
+        print(info, end=" ")
+        status_info('fail', max_title, len(info))
+        if 'database is locked' in e.args[0]:
+            print(f"\nCan't commit to {os.path.basename(db_path)}. DB is locked. Close it to proceed.\n")
+        else:
+            print('\n', e)
+        conn.rollback()
+        exit()
+
+
+class AppendDatabaseList:
+    """List-like container (append and extend methods only) to collect DataFrame chunks.
+    Chunks are written to the data_name table with append_database right away and not kept in the container"""
+
+    def __init__(self, project_constants_lst, data_name):
+        self.project_constants_lst = project_constants_lst
+        self.data_name = data_name
+
+    def append(self, df):
+        append_database(self.project_constants_lst, self.data_name, df)
+
+    def extend(self, df_lst):
+        for df in df_lst:
+            self.append(df)
+
+
+def get_db_path(project_constants_lst, data_name):
+    """Function returns path of the database file for the data_name (database report type)"""
+
+    project_steps_df, _, _, report_requisites_sr, *_ = project_constants_lst
+    db_type = project_steps_df.loc[data_name, 'report_type']
+    db_name = report_requisites_sr['customer_name'] + '_' + db_type + '_database.db'
+    return os.path.join(report_requisites_sr['database_folder'], db_name)
+
+
+def append_database(project_constants_lst, data_name, df):
+    """Function appends df rows to the data_name table of SQL database or columnar file
+    (database_backend in report requisites) to write large data by chunks without keeping all chunks in memory.
+    Table saved on previous program execution is replaced with the first appended df.
+    All chunks must have the same columns. Table is completed with close_append_database"""
+
+    with db_lock:
+        if not data_name in db_append_dct:
+            db_append_dct[data_name] = open_append_table(project_constants_lst, data_name, df)
+        append_table = db_append_dct[data_name]
+        max_title = project_constants_lst[1]
+        info = f'Writing {data_name} to database'
+
+        if append_table['columnar_path']:
+            import pyarrow as pa
+            try:
+                table = pa.Table.from_pandas(dfop.restore_arrow_string(df), schema=append_table['schema'], preserve_index=False)
+                append_table['writer'].write_table(table)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, ValueError) as e:
+                status_info('fail', max_title, len(info))
+                print(f"\nCan't write {data_name} chunk to {append_table['columnar_path']}.\n", e)
                 exit()
-            
+        else:
+            # column names are substituted in the shallow copy to keep df unchanged
+            df = df.copy(deep=False)
+            substitute_names(df, 'write')
+            write_sql(append_table['db_path'], data_name, df, max_title, info, append=bool(append_table['rows']))
+        append_table['rows'] += len(df.index)
+
+
+def open_append_table(project_constants_lst, data_name, df):
+    """Function returns dictionary with location of the data_name table written by chunks (see append_database).
+    Columnar file is written to the temporary file with the schema of the first chunk (df)
+    to replace file saved on previous program execution when all chunks are written.
+    SQL table is written within single transaction"""
+
+    report_requisites_sr = project_constants_lst[3]
+    db_path = get_db_path(project_constants_lst, data_name)
+    columnar_path = get_columnar_path(db_path, data_name, get_db_backend(report_requisites_sr))
+    append_table = {'db_path': db_path, 'columnar_path': None, 'writer': None, 'schema': None, 'rows': 0}
+    if not columnar_path:
+        return append_table
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    try:
+        schema = pa.Schema.from_pandas(dfop.restore_arrow_string(df), preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, ValueError):
+        # columns with mixed types are written to database
+        return append_table
+    # empty columns of the first chunk are saved as string columns
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+
+    os.makedirs(os.path.dirname(columnar_path), exist_ok=True)
+    columnar_tmp_path = columnar_path + '.tmp'
+    if columnar_path.endswith('.parquet'):
+        writer = pq.ParquetWriter(columnar_tmp_path, schema)
+    else:
+        # feather file is arrow ipc file (lz4 compression is used by default for feather files)
+        writer = pa.ipc.new_file(columnar_tmp_path, schema, options=pa.ipc.IpcWriteOptions(compression='lz4'))
+    append_table.update(columnar_path=columnar_path, writer=writer, schema=schema)
+    return append_table
+
+
+def close_append_database(project_constants_lst, data_name):
+    """Function completes data_name table written with append_database.
+    Columnar file replaces file saved on previous program execution or database transaction is commited.
+    Returns number of written rows (0 if no chunks were appended)"""
+
+    with db_lock:
+        append_table = db_append_dct.pop(data_name, None)
+        if append_table is None:
+            return 0
+
+        project_steps_df, max_title, *_ = project_constants_lst
+        db_type = project_steps_df.loc[data_name, 'report_type']
+        db_path, columnar_path = append_table['db_path'], append_table['columnar_path']
+        info = f'Writing {data_name} to {db_type} database'
+        print(info, end=" ")
+        if columnar_path:
+            append_table['writer'].close()
+            os.replace(columnar_path + '.tmp', columnar_path)
+            # drop outdated table from database
+            if os.path.isfile(db_path) and data_name in get_db_tables(db_path):
+                write_sql(db_path, data_name, None, max_title, info)
+        commit_sql(db_path, max_title)
+        # remove outdated columnar files written with other backends
+        remove_columnar_files(db_path, data_name, keep_path=columnar_path)
+        status_info('ok', max_title, len(info))
+        return append_table['rows']
+
+
+def get_switch_cache_file(project_constants_lst, data_names):
+    """Function returns path of the file to keep data extracted from each switch configuration 
+    for data_names. File is located in the folder next to the data_names database"""
+
+    project_steps_df, _, _, report_requisites_sr, *_ = project_constants_lst
+    db_type = project_steps_df.loc[data_names[0], 'report_type']
+    db_name = report_requisites_sr['customer_name'] + '_' + db_type + '_database'
+    return os.path.join(report_requisites_sr['database_folder'], db_name + '_switch_cache', data_names[0] + '.pickle')
+
 
 def read_database(project_constants_lst, *args):
-    """Function to read data from SQL.
+    """Function to read data from columnar files (database_backend in report requisites) or SQL.
     Args are comma separated DataFrames names.
     Returns list of loaded DataFrames or None if no data found.
     """
 
+    with db_lock:
+        return read_database_tables(project_constants_lst, *args)
+
+
+def read_database_tables(project_constants_lst, *args):
+    """Function reads DataFrames from the databases (see read_database)"""
+
     project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
+    db_backend = get_db_backend(report_requisites_sr)
     # list to store loaded data
     data_imported = []
 
@@ -127,14 +498,16 @@ def read_database(project_constants_lst, *args):
         db_name = report_requisites_sr['customer_name'] + '_' + db_type + '_database.db'
         
         db_path = os.path.join(report_requisites_sr['database_folder'], db_name)
-        conn = sqlite3.connect(db_path)
+        columnar_path = get_columnar_path(db_path, data_name, db_backend)
 
         info = f'Reading {data_name} from {db_type} database'
         print(info, end=" ")
-        data_name_in_db = conn.execute(
-            f"""SELECT name FROM sqlite_master WHERE type='table' 
-            AND name='{data_name}'; """).fetchall()
-        if data_name_in_db:
+        if columnar_path and os.path.isfile(columnar_path):
+            data_imported.append(read_columnar(columnar_path))
+            status_info('ok', max_title, len(info))
+            continue
+        conn = get_db_connection(db_path)
+        if data_name in db_tables_dct[db_path]:
             df = pd.read_sql(f"select * from {data_name}", con=conn)
             substitute_names(df, 'read')
             # revert single column DataFrame to Series
@@ -148,10 +521,83 @@ def read_database(project_constants_lst, *args):
         else:
             data_imported.append(None)
             status_info('no data', max_title, len(info))
-        conn.close()
     return data_imported
 
 
+def find_database_data(project_constants_lst, *args):
+    """Function checks if data saved on previous program execution without reading it.
+    Args are comma separated DataFrames names.
+    Returns list with True for found data or None if no data found (as read_database does)"""
+
+    project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
+    db_backend = get_db_backend(report_requisites_sr)
+    data_found_lst = []
+
+    with db_lock:
+        for data_name in args:
+            db_type = project_steps_df.loc[data_name, 'report_type']
+            db_path = get_db_path(project_constants_lst, data_name)
+            columnar_path = get_columnar_path(db_path, data_name, db_backend)
+
+            info = f'Checking {data_name} in {db_type} database'
+            print(info, end=" ")
+            if columnar_path and os.path.isfile(columnar_path) or data_name in get_db_tables(db_path):
+                data_found_lst.append(True)
+                status_info('ok', max_title, len(info))
+            else:
+                data_found_lst.append(None)
+                status_info('no data', max_title, len(info))
+    return data_found_lst
+
+
+def read_database_chunks(project_constants_lst, data_name, chunk_filter, chunksize):
+    """Function reads data_name DataFrame from columnar file or SQL database (see read_database)
+    by chunks of chunksize rows (feather file is read by record batches).
+    chunk_filter function is applied to each chunk so only filtered rows are kept in memory.
+    Returns DataFrame or None if no data found"""
+
+    project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
+    db_type = project_steps_df.loc[data_name, 'report_type']
+    db_path = get_db_path(project_constants_lst, data_name)
+    columnar_path = get_columnar_path(db_path, data_name, get_db_backend(report_requisites_sr))
+
+    with db_lock:
+        info = f'Reading {data_name} from {db_type} database'
+        print(info, end=" ")
+        if columnar_path and os.path.isfile(columnar_path):
+            chunk_lst = [chunk_filter(chunk_df) for chunk_df in read_columnar_chunks(columnar_path, chunksize)]
+        elif data_name in get_db_tables(db_path):
+            chunk_lst = []
+            for chunk_df in pd.read_sql(f'select * from "{data_name}"', con=get_db_connection(db_path), chunksize=chunksize):
+                substitute_names(chunk_df, 'read')
+                chunk_lst.append(chunk_filter(chunk_df))
+        else:
+            status_info('no data', max_title, len(info))
+            return None
+        status_info('ok', max_title, len(info))
+    # empty chunks are dropped to keep columns dtypes of the filtered rows
+    chunk_lst = [chunk_df for chunk_df in chunk_lst if not chunk_df.empty] or chunk_lst[:1]
+    return pd.concat(chunk_lst, ignore_index=True) if chunk_lst else None
+
+
+def read_columnar_chunks(columnar_path, chunksize):
+    """Generator yields DataFrame chunks of the memory-mapped parquet file (chunksize rows)
+    or feather file (record batches)"""
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if columnar_path.endswith('.parquet'):
+        parquet_file = pq.ParquetFile(columnar_path, memory_map=True)
+        for record_batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield record_batch.to_pandas()
+    else:
+        with pa.memory_map(columnar_path) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i).to_pandas()
+
+
 def verify_read_data(max_title, data_names, *args,  show_status=True):
     """
     Function to verify if loaded DataFrame or Series contains 'NO DATA FOUND' information string.
@@ -11,3 +11,4 @@ from .value_presentation import *
 from .value_processing import *
 from .value_verification import *
 from .dataframe_details import *
+from .dataframe_schema import *
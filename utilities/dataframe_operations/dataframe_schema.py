@@ -0,0 +1,54 @@
+"""Module to keep string columns of large DataFrames as Arrow backed strings
+and restore initial object columns"""
+
+import importlib.util
+from functools import lru_cache
+
+import pandas as pd
+
+
+def convert_arrow_string(df, columns):
+    """Function returns DataFrame with columns containing string and empty values only
+    converted to Arrow backed strings (empty values are NaN). Absent columns and columns
+    with other values are not converted. DataFrame is returned as is if pyarrow package is not found"""
+
+    arrow_string_dtype = get_arrow_string_dtype()
+    if arrow_string_dtype is None or not isinstance(df, pd.DataFrame):
+        return df
+    string_columns = [column for column in columns if column in df.columns and is_string_column(df[column])]
+    if not string_columns:
+        return df
+    return df.astype(dict.fromkeys(string_columns, arrow_string_dtype))
+
+
+def is_string_column(sr):
+    """Function checks if sr object column contains strings and empty values only"""
+
+    if sr.dtype != 'object':
+        return False
+    return pd.api.types.infer_dtype(sr.dropna(), skipna=False) in ('string', 'empty')
+
+
+def restore_arrow_string(df):
+    """Function returns DataFrame with Arrow backed string columns converted to object columns"""
+
+    if not isinstance(df, pd.DataFrame):
+        return df
+    string_columns = [column for column, dtype in df.dtypes.items() if isinstance(dtype, pd.StringDtype)]
+    if not string_columns:
+        return df
+    return df.astype(dict.fromkeys(string_columns, 'object'))
+
+
+@lru_cache(maxsize=None)
+def get_arrow_string_dtype():
+    """Function returns Arrow backed string dtype with numpy missing values semantics
+    (comparisons with NaN return False as for object columns) or None if pyarrow is not found"""
+
+    if importlib.util.find_spec('pyarrow') is None:
+        return None
+    try:
+        return pd.StringDtype('pyarrow_numpy')
+    # pandas version before 2.1
+    except (ImportError, ValueError):
+        return None
@@ -0,0 +1,130 @@
+"""Module to fingerprint switch configuration files (size, modification time, content hash)
+and keep data extracted from each switch configuration between program executions.
+Only new or changed switch configurations are extracted again"""
+
+
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+
+# number of bytes read from file at once to count content hash
+HASH_BLOCK_SIZE = 1024 * 1024
+# project root folder (all project modules are taken into account to verify cached data)
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# content hashes counted during current program execution {(filepath, size, mtime): hash}
+file_hash_dct = {}
+
+
+def get_file_fingerprint(file, fingerprint=None):
+    """Function returns file fingerprint (size, modification time, content hash).
+    If size and modification time are the same as in fingerprint then content hash is not counted"""
+
+    file_stat = os.stat(file)
+    if fingerprint and tuple(fingerprint[:2]) == (file_stat.st_size, file_stat.st_mtime_ns):
+        return fingerprint
+    file_key = (os.path.abspath(file), file_stat.st_size, file_stat.st_mtime_ns)
+    if not file_key in file_hash_dct:
+        file_hash = hashlib.blake2b()
+        with open(file, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                file_hash.update(block)
+        file_hash_dct[file_key] = file_hash.hexdigest()
+    return (file_stat.st_size, file_stat.st_mtime_ns, file_hash_dct[file_key])
+
+
+def get_switch_files(switch_config):
+    """Function returns sorted list of existing files in switch_config
+    (switch_config is list, tuple or Series with filepaths and lists of filepaths)"""
+
+    values = switch_config.values if hasattr(switch_config, 'values') and not callable(switch_config.values) else switch_config
+    switch_files = set()
+    for value in values:
+        value_lst = value if isinstance(value, (list, tuple)) else [value]
+        switch_files.update(item for item in value_lst if isinstance(item, str) and os.path.isfile(item))
+    return sorted(switch_files)
+
+
+def get_switch_key(switch_config):
+    """Function returns switch configuration key (hash of switch_config values).
+    Series name is not taken into account so key doesn't depend on switch order"""
+
+    if hasattr(switch_config, 'items') and hasattr(switch_config, 'name'):
+        switch_config = list(switch_config.items())
+    return hashlib.blake2b(pickle.dumps(switch_config)).hexdigest()
+
+
+def verify_switch_cache(switch_cache, switch_config):
+    """Function returns switch_cache if all switch configuration files are the same
+    as on previous program execution (size and modification time or content hash are equal).
+    Otherwise returns None"""
+
+    if not switch_cache:
+        return None
+    switch_files = get_switch_files(switch_config)
+    if switch_files != sorted(switch_cache['fingerprints']):
+        return None
+    for file in switch_files:
+        cached_fingerprint = switch_cache['fingerprints'][file]
+        if get_file_fingerprint(file, cached_fingerprint)[2] != cached_fingerprint[2]:
+            return None
+    return switch_cache
+
+
+def create_switch_cache(switch_config, sw_san_collected_lst, sw_collected_lst, switch_cache=None):
+    """Function returns dictionary with switch configuration files fingerprints and data extracted
+    from the switch configuration (containers and list to show collection status)"""
+
+    cached_fingerprints = switch_cache['fingerprints'] if switch_cache else {}
+    fingerprints = {file: get_file_fingerprint(file, cached_fingerprints.get(file))
+                        for file in get_switch_files(switch_config)}
+    return {'fingerprints': fingerprints, 'collected': (sw_san_collected_lst, sw_collected_lst)}
+
+
+@lru_cache(maxsize=None)
+def get_project_signature():
+    """Function returns signature of project modules (modification time of all py files).
+    Cached data is not used if any project module is changed"""
+
+    modules_mtime_lst = []
+    for dirpath, dirnames, filenames in os.walk(PROJECT_FOLDER):
+        dirnames[:] = [dirname for dirname in dirnames if not dirname.startswith(('.', '__'))]
+        modules_mtime_lst.extend((os.path.relpath(os.path.join(dirpath, filename), PROJECT_FOLDER),
+                                    os.stat(os.path.join(dirpath, filename)).st_mtime_ns)
+                                    for filename in filenames if filename.endswith('.py'))
+    return hashlib.blake2b(pickle.dumps(sorted(modules_mtime_lst))).hexdigest()
+
+
+def get_extract_signature(pattern_dct, *args):
+    """Function returns signature of extraction parameters (project modules, patterns and arguments)"""
+
+    return hashlib.blake2b(pickle.dumps((get_project_signature(), pattern_dct, args))).hexdigest()
+
+
+def load_switch_cache(cache_file, pattern_dct, *args):
+    """Function returns dictionary with data extracted from each switch configuration
+    on previous program execution {switch_key: switch_cache}.
+    Empty dictionary returned if there is no cache_file or extraction parameters are changed"""
+
+    if not os.path.isfile(cache_file):
+        return {}
+    try:
+        with open(cache_file, 'rb') as file:
+            extract_signature, switch_cache_dct = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError, ImportError):
+        return {}
+    if extract_signature != get_extract_signature(pattern_dct, *args):
+        return {}
+    return switch_cache_dct
+
+
+def save_switch_cache(cache_file, switch_cache_dct, pattern_dct, *args):
+    """Function saves data extracted from each switch configuration to the cache_file"""
+
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    # file is replaced after it's completely written
+    cache_tmp_file = cache_file + '.tmp'
+    with open(cache_tmp_file, 'wb') as file:
+        pickle.dump((get_extract_signature(pattern_dct, *args), switch_cache_dct), file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(cache_tmp_file, cache_file)
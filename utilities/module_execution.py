@@ -3,11 +3,18 @@ checking if each step is required to run"""
 
 
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from functools import wraps
+from functools import partial, wraps
 
 import utilities.data_structure_operations as dsop
-from san_automation_constants import LEFT_INDENT, MIDDLE_SPACE
+import utilities.fingerprint_operations as fpop
+from san_automation_constants import (LEFT_INDENT, MIDDLE_SPACE,
+                                      SAN_PARSER_WORKERS)
+
+# names of the data collected or analyzed during current program execution
+changed_data_names = set()
 
 
 def status_info(status, max_title, len_info_string, shift=0):
@@ -55,6 +62,138 @@ def display_status(info, max_title):
     return dec
 
 
+def switch_config_extract(current_config_extract, san_collected_lst, pattern_dct, 
+                            switch_config_lst, info_lst, max_title, *args, skip_lst=None, cache_file=None):
+    """
+    Function to extract data from each switch configuration in switch_config_lst with 
+    current_config_extract(*san_collected_lst, pattern_dct, switch_config, *args) call.
+    current_config_extract fills san_collected_lst containers (lists or dictionaries of lists)
+    and returns list used to show collection status. Switch configurations with True in skip_lst are skipped.
+    If SAN_PARSER_WORKERS is more than one switch configurations are processed in the process pool.
+    If cache_file is defined then data extracted from each switch configuration is saved to cache_file 
+    with configuration files fingerprints and only new or changed switch configurations are extracted on the next run.
+    Extracted data are added to san_collected_lst and status is displayed in switch_config_lst order.
+    """
+
+    if skip_lst is None:
+        skip_lst = [False] * len(switch_config_lst)
+    parallel_extract_on = SAN_PARSER_WORKERS > 1 and len(switch_config_lst) > 1
+
+    # serial extraction directly to san_collected_lst
+    if not parallel_extract_on and cache_file is None:
+        for switch_config, info, skip in zip(switch_config_lst, info_lst, skip_lst):
+            print(info, end =" ")
+            if skip:
+                status_info('skip', max_title, len(info))
+                continue
+            sw_collected_lst = current_config_extract(*san_collected_lst, pattern_dct, switch_config, *args)
+            show_collection_status(sw_collected_lst, max_title, len(info))
+        return
+
+    # switch configurations are extracted to empty containers and merged to san_collected_lst in switch order
+    for info, sw_san_collected_lst, sw_collected_lst, extracted_status in \
+        switch_config_results(current_config_extract, san_collected_lst, pattern_dct, 
+                                switch_config_lst, info_lst, *args, skip_lst=skip_lst, cache_file=cache_file):
+        if extracted_status == 'skip':
+            status_info('skip', max_title, len(info))
+            continue
+        for container, sw_container in zip(san_collected_lst, sw_san_collected_lst):
+            merge_container(container, sw_container)
+        if dsop.list_is_empty(sw_collected_lst):
+            status_info('no data', max_title, len(info))
+        else:
+            status_info(extracted_status, max_title, len(info))
+
+
+def switch_config_results(current_config_extract, san_collected_lst, pattern_dct, 
+                            switch_config_lst, info_lst, *args, skip_lst=None, cache_file=None):
+    """
+    Generator to extract data from each switch configuration in switch_config_lst to empty containers 
+    of the same type as san_collected_lst containers (in the process pool if SAN_PARSER_WORKERS is more than one). 
+    Information string from info_lst is displayed before waiting for the switch configuration extraction.
+    Yields (info, sw_san_collected_lst, sw_collected_lst, extracted_status) in switch_config_lst order, 
+    extracted_status is 'ok', 'cached' (switch configuration is not changed since previous program execution 
+    and data are taken from cache_file) or 'skip' (switch configuration with True in skip_lst).
+    Data extracted from each switch configuration are saved to cache_file if it's defined.
+    """
+
+    if skip_lst is None:
+        skip_lst = [False] * len(switch_config_lst)
+    parallel_extract_on = SAN_PARSER_WORKERS > 1 and len(switch_config_lst) > 1
+
+    # data extracted on previous program execution for each switch configuration
+    switch_cache_dct = fpop.load_switch_cache(cache_file, pattern_dct, *args) if cache_file else {}
+    # data extracted on current program execution for each switch configuration
+    current_switch_cache_dct = {}
+    
+    # each switch configuration is extracted to empty containers (in worker process in parallel extraction)
+    executor_context = ProcessPoolExecutor(max_workers=SAN_PARSER_WORKERS) if parallel_extract_on else nullcontext()
+    with executor_context as executor:
+        job_lst = []
+        for switch_config, skip in zip(switch_config_lst, skip_lst):
+            if skip:
+                job_lst.append((None, None))
+                continue
+            switch_key = fpop.get_switch_key(switch_config) if cache_file else None
+            switch_cache = fpop.verify_switch_cache(switch_cache_dct.get(switch_key), switch_config)
+            if switch_cache:
+                job_lst.append((switch_key, switch_cache))
+                continue
+            job_args = (current_config_extract, [empty_container(container) for container in san_collected_lst],
+                        pattern_dct, switch_config, *args)
+            if parallel_extract_on:
+                job_lst.append((switch_key, executor.submit(collect_switch_config, *job_args)))
+            else:
+                job_lst.append((switch_key, partial(collect_switch_config, *job_args)))
+        
+        # results are taken in switch order to keep status lines and collected data order
+        for (switch_key, job), switch_config, info in zip(job_lst, switch_config_lst, info_lst):
+            print(info, end =" ")
+            if job is None:
+                yield info, None, None, 'skip'
+                continue
+            # switch configuration is not changed since previous program execution
+            if isinstance(job, dict):
+                sw_san_collected_lst, sw_collected_lst = job['collected']
+                extracted_status = 'cached'
+            else:
+                sw_san_collected_lst, sw_collected_lst = job.result() if isinstance(job, Future) else job()
+                extracted_status = 'ok'
+            if cache_file:
+                current_switch_cache_dct[switch_key] = fpop.create_switch_cache(switch_config, sw_san_collected_lst, sw_collected_lst, 
+                                                                                switch_cache=job if isinstance(job, dict) else None)
+            yield info, sw_san_collected_lst, sw_collected_lst, extracted_status
+    if cache_file:
+        fpop.save_switch_cache(cache_file, current_switch_cache_dct, pattern_dct, *args)
+
+
+def collect_switch_config(current_config_extract, sw_san_collected_lst, pattern_dct, switch_config, *args):
+    """Function runs current_config_extract for a single switch in the worker process.
+    Returns filled containers and list to show collection status"""
+
+    sw_collected_lst = current_config_extract(*sw_san_collected_lst, pattern_dct, switch_config, *args)
+    return sw_san_collected_lst, sw_collected_lst
+
+
+def empty_container(container):
+    """Function returns empty list for list and dictionary with the same keys 
+    and empty lists as values for dictionary of lists"""
+
+    if isinstance(container, dict):
+        return {key: [] for key in container}
+    return []
+
+
+def merge_container(container, sw_container):
+    """Function adds data collected for the single switch (sw_container) to the container"""
+
+    if isinstance(container, dict):
+        for key, values in sw_container.items():
+            container.setdefault(key, []).extend(values)
+    else:
+        container.extend(sw_container)
+
+
 def reply_request(question: str, reply_options = ['y', 'yes', 'n', 'no'], show_reply = False):
     """Function to ask user for input until its in reply options"""
 
@@ -168,6 +307,8 @@ def verify_force_run(data_names, data_lst, project_steps_df, max_title, analyzed
     #  then analyze extracted config data  
     if not all(data_check) or any(force_extract_keys_lst) or any(analyzed_data_flags):
         force_run = True
+        # data is re-collected or re-analyzed (used to force processing of the dependent data)
+        changed_data_names.update(data_names)
     return force_run
 
 
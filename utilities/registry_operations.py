@@ -0,0 +1,79 @@
+"""Module to keep data passed between program phases in the named data registry.
+Data is published to the registry by name or loaded on first request with the loader
+registered for the data names. Data released from the registry after its last use"""
+
+
+# registry keys: 'data' - published data {data_name: data},
+# 'loaders' - loaders not run yet {data_name: (data_names, loader, required_names)},
+# 'released' - names of the released data,
+# 'release_pending' - names of the data released but still required by the loaders not run yet
+
+
+def create_data_registry():
+    """Function returns empty data registry"""
+
+    return {'data': {}, 'loaders': {}, 'released': set(), 'release_pending': set()}
+
+
+def register_data_loader(registry, data_names, loader, *required_names):
+    """Function registers loader for the data_names. Loader is run on the first request
+    of any data from data_names with data of required_names passed as args.
+    Loader returns data in data_names order (single data is returned as is)"""
+
+    for data_name in data_names:
+        registry['loaders'][data_name] = (data_names, loader, required_names)
+
+
+def publish_data(registry, data_names, *args):
+    """Function adds data (args) to the registry with data_names"""
+
+    for data_name, data in zip(data_names, args):
+        registry['data'][data_name] = data
+        registry['released'].discard(data_name)
+
+
+def get_data(registry, data_name):
+    """Function returns data_name data from the registry.
+    If data is not loaded yet then loader of the data is run"""
+
+    if data_name in registry['data']:
+        return registry['data'][data_name]
+    if data_name in registry['released']:
+        raise KeyError(f'{data_name} is released from the data registry')
+    if not data_name in registry['loaders']:
+        raise KeyError(f'{data_name} is not found in the data registry')
+
+    data_names, loader, required_names = registry['loaders'][data_name]
+    required_data_lst = [get_data(registry, required_name) for required_name in required_names]
+    loaded_data = loader(*required_data_lst)
+    if len(data_names) == 1:
+        loaded_data = [loaded_data]
+    for loaded_name in data_names:
+        registry['loaders'].pop(loaded_name, None)
+    publish_data(registry, data_names, *loaded_data)
+    # data required by the loader is released if it's not required by other loaders
+    release_data(registry, *registry['release_pending'])
+    return registry['data'][data_name]
+
+
+def get_data_lst(registry, *data_names):
+    """Function returns list of data_names data from the registry"""
+
+    return [get_data(registry, data_name) for data_name in data_names]
+
+
+def release_data(registry, *data_names):
+    """Function removes data_names data from the registry to free memory.
+    Data required by the loaders which are not run yet is released after these loaders are run.
+    Loaders of released data are not run"""
+
+    required_names = {required_name for _, _, loader_required_names in registry['loaders'].values()
+                        for required_name in loader_required_names}
+    for data_name in data_names:
+        if data_name in required_names:
+            registry['release_pending'].add(data_name)
+            continue
+        registry['release_pending'].discard(data_name)
+        registry['data'].pop(data_name, None)
+        registry['loaders'].pop(data_name, None)
+        registry['released'].add(data_name)
@@ -1,13 +1,40 @@
 import re
 
 import utilities.data_structure_operations as dsop
+import utilities.sshow_index_operations as siop
 
 
-def goto_switch_context(ls_mode_on, line, file, switch_index):
+class LineMatchDict(dict):
+    """Dictionary with pattern names as keys and match results of the line as values.
+    Line is matched with the pattern only when pattern name is requested first time
+    so only patterns checked in the current section are evaluated"""
+
+    def __init__(self, pattern_dct, line):
+        super().__init__()
+        self.pattern_dct = pattern_dct
+        self.line = line
+
+    def __missing__(self, pattern_name):
+        match = self.pattern_dct[pattern_name].match(self.line)
+        self[pattern_name] = match
+        return match
+
+
+def match_line(pattern_dct, line):
+    """Function returns dictionary with match results of the line 
+    with imported regular expressions (pattern is evaluated on first request)"""
+
+    return LineMatchDict(pattern_dct, line)
+
+
+def goto_switch_context(ls_mode_on, line, file, switch_index, sshow_index=None):
     """Function to move cursor to the switch_index context 
-    within section of the corresponding command if Logical switch mode is ON"""
+    within section of the corresponding command if Logical switch mode is ON.
+    If sshow_index is passed cursor is moved with context offsets from the index"""
 
-    if ls_mode_on:
+    if ls_mode_on and sshow_index:
+        line = siop.goto_switch_context(file, sshow_index, switch_index)
+    elif ls_mode_on:
         while not re.search(fr'^CURRENT CONTEXT -- {switch_index} *, \d+$',line):
             line = file.readline()
             if not line:
@@ -32,12 +59,11 @@ def extract_list_from_line(global_filled_lst, pattern_dct,
         # list to store current function call result
         local_filled_lst = []
 
-    while not re.search(pattern_dct[stop_pattern_name], line):
+    while not pattern_dct[stop_pattern_name].search(line):
         if first_line_skip:
             line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
         # if matched line found
-        if match_dct[extract_pattern_name]:
+        if pattern_dct[extract_pattern_name].match(line):
             if isinstance(line_add_values, (tuple, list)):
                 extracted_line_lst = dsop.line_to_list(pattern_dct[extract_pattern_name], line, *line_add_values)
             else:
@@ -67,15 +93,12 @@ def extract_key_value_from_line(global_filled_dct, pattern_dct,
         # list to store current function call result
         local_filled_dct = []
     
-    while not re.search(pattern_dct[stop_pattern_name],line):
+    while not pattern_dct[stop_pattern_name].search(line):
         if first_line_skip:
             line = file.readline()
-        # dictionary with match names as keys and match result of current line with all imported regular expressions as values
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
         # name_value_pair_match
-        if match_dct[extract_pattern_name]:
-            
-            extracted_key_value = match_dct[extract_pattern_name]
+        extracted_key_value = pattern_dct[extract_pattern_name].match(line)
+        if extracted_key_value:
             key = extracted_key_value.group(1).strip()
             value = extracted_key_value.group(2).strip()
             if not value:
@@ -105,12 +128,12 @@ def extract_value_from_line(global_filled_lst, pattern_dct,
         # list to store current function call result
         local_filled_lst = []
 
-    while not re.search(pattern_dct[stop_pattern_name], line):
+    while not pattern_dct[stop_pattern_name].search(line):
         if first_line_skip:
             line = file.readline()
-        match_dct = {pattern_name: pattern_dct[pattern_name].match(line) for pattern_name in pattern_dct.keys()}
-        if match_dct[extract_pattern_name]:
-            value = match_dct[extract_pattern_name].group(1).strip()
+        extracted_value = pattern_dct[extract_pattern_name].match(line)
+        if extracted_value:
+            value = extracted_value.group(1).strip()
             global_filled_lst.append(value)
             if save_local:
                 local_filled_lst.append(value)                                            
@@ -1,22 +1,40 @@
-"""Module to export dataframes and table of contents to report excel file"""
+"""Module to export dataframes and table of contents to report excel file.
+DataFrames are collected in report session during program execution and 
+each report file is written once (on report completion or program exit)"""
 
+import atexit
 import os
 import sys
+import threading
 from datetime import date
 
 import openpyxl
 import pandas as pd
 
 import utilities.filesystem_operations as fsop
+from san_automation_constants import REPORT_BATCH_EXPORT, REPORT_WRITE_ONLY
 from utilities.module_execution import status_info
 
-from .worksheet_operations import format_workbook, hyperlink_content
+from .worksheet_operations import (format_data_worksheet, hyperlink_content,
+                                   write_only_content_worksheet,
+                                   write_only_data_worksheet)
+
+CONTENT_SHEET_TITLE = 'Содержание'
+CONTENT_COLUMNS = ['Закладка', 'Название таблицы']
+
+# DataFrames waiting to be written to report files {file_path: {sheet_title: (df, description, freeze_column)}}.
+# After report completion session is closed and DataFrames are written right away
+report_session_dct = {'sheets': {}, 'batch_export': REPORT_BATCH_EXPORT, 'max_title': None}
+# report session is shared by analysis stages running in threads
+report_session_lock = threading.RLock()
 
 
 def dataframe_to_excel(df, sheet_title, project_constants_lst, 
-                        current_date=str(date.today()), force_flag = False, freeze_column='A'):
-    """Check if excel file exists, write DataFrame, create or update table of contents,
-    change DataFrame text and presentation format."""
+                        current_date=str(date.today()), force_flag = False, freeze_column='A', write_now=False):
+    """Check if DataFrame need to be exported, add DataFrame to report session.
+    Report file with table of contents and formatted DataFrame is written 
+    on report completion or right away if write_now flag is on (file is required to be filled by user)
+    or batch export is off"""
     
     project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
     report_type, export_flag, df_decription = project_steps_df.loc[sheet_title, ['report_type', 'export_to_excel', 'description']].values
@@ -39,27 +57,21 @@ def dataframe_to_excel(df, sheet_title, project_constants_lst,
     # and DataFrame is not empty
     if (force_flag or export_flag) and not df.empty:
         fsop.create_folder(report_requisites_sr['today_report_folder'], max_title, display_status=False)
-        file_mode = 'a' if os.path.isfile(file_path) else 'w'
         df = df.apply(pd.to_numeric, errors='ignore')
-        try:
-            if_sheet_exists_param = 'replace' if file_mode == 'a' else None
-            content_df, item_exist = generate_table_of_contents(file_path, file_mode, sheet_title, df_decription)
-            df_flat = drop_multindex(df)
-            # write table of contents and data dataframe to the excel file
-            with pd.ExcelWriter(file_path, mode=file_mode, if_sheet_exists=if_sheet_exists_param, engine='openpyxl') as writer:
-                if file_mode == 'w' or not item_exist:
-                    content_df.to_excel(writer, sheet_name='Содержание', index=False)
-                df_flat.to_excel(writer, sheet_name=sheet_title,  startrow=2, index=False)
-            # format table of contents and data worksheets
-            workbook = openpyxl.load_workbook(file_path)
-            format_workbook(workbook, sheet_title, df_decription, freeze_column)
-            workbook.save(file_path)
-        except PermissionError:
-            status_info('fail', max_title, len(info))
-            print('\nPermission denied. Close the file.\n')
-            sys.exit()
-        else:
-            status_info('ok', max_title, len(info))
+        df_flat = drop_multindex(df)
+        with report_session_lock:
+            report_session_dct['max_title'] = max_title
+            report_session_dct['sheets'].setdefault(file_path, {})[sheet_title] = (df_flat, df_decription, freeze_column)
+            write_file = write_now or not report_session_dct['batch_export']
+            if write_file:
+                try:
+                    write_report_file(file_path)
+                except PermissionError:
+                    status_info('fail', max_title, len(info))
+                    print('\nPermission denied. Close the file.\n')
+                    sys.exit()
+        # queued DataFrame export status is displayed after report file is written (see write_report_session)
+        status_info('ok' if write_file else 'queued', max_title, len(info))
         return file_path        
     else:
         # if save key is on but DataFrame empty
@@ -68,27 +80,121 @@ def dataframe_to_excel(df, sheet_title, project_constants_lst,
         else:            
             status_info('skip', max_title, len(info))
         return None
-    
 
-def generate_table_of_contents(file_path, file_mode, sheet_title, df_decription):
-    """"Function to create or recreate table of contents if file is newly created or new sheet added"""
-
-    item_exist = None 
-    # if file exists and there is no sheet_title in contents add new item to the existing content
-    if  file_mode == 'a':
-        existing_content_df = pd.read_excel(file_path, sheet_name='Содержание')
-        item_exist = sheet_title in existing_content_df['Закладка'].values
-        if not item_exist:
-            # content item to add
-            content_df = pd.DataFrame([[sheet_title, df_decription]], columns=['Закладка', 'Название таблицы'])
-            # concatenate existing items to the current
-            content_df = pd.concat([existing_content_df, content_df])
+
+def write_report_file(file_path, sort_weight_sr=None):
+    """Function writes all DataFrames collected in report session for the file_path 
+    with single workbook load and save. Table of contents is created or updated,
+    data worksheets are formatted and hyperlinks are created in the same pass.
+    If sort_weight_sr is defined then table of contents items and worksheets are sorted"""
+
+    sheets_dct = report_session_dct['sheets'].pop(file_path, {})
+    if not sheets_dct and sort_weight_sr is None:
+        return
+    # write-only mode is applicable for new files only (existing workbook can't be opened in write-only mode)
+    if REPORT_WRITE_ONLY and not os.path.isfile(file_path):
+        write_only_report_file(file_path, sheets_dct, sort_weight_sr)
+        return
+    
+    file_mode = 'a' if os.path.isfile(file_path) else 'w'
+    if_sheet_exists_param = 'replace' if file_mode == 'a' else None
+    with pd.ExcelWriter(file_path, mode=file_mode, if_sheet_exists=if_sheet_exists_param, engine='openpyxl') as writer:
+        workbook = writer.book
+        content_df = generate_table_of_contents(workbook, sheets_dct, sort_weight_sr)
+        content_df.to_excel(writer, sheet_name=CONTENT_SHEET_TITLE, index=False)
+        for sheet_title, (df_flat, df_decription, freeze_column) in sheets_dct.items():
+            df_flat.to_excel(writer, sheet_name=sheet_title,  startrow=2, index=False)
+            # format data worksheet
+            format_data_worksheet(workbook, sheet_title, df_decription, freeze_column)
+        # create hyperlinks for all items of table of contents
+        hyperlink_content(workbook)
+        # sort worksheets
+        if sort_weight_sr is not None:
+            workbook._sheets.sort(key=lambda ws: sort_weight_sr[ws.title])
+
+
+def write_only_report_file(file_path, sheets_dct, sort_weight_sr=None):
+    """Function writes DataFrames collected in report session for the file_path to the new 
+    file in openpyxl write-only mode (rows are streamed to the file, memory usage is lower for very large sheets)"""
+
+    workbook = openpyxl.Workbook(write_only=True)
+    content_df = generate_table_of_contents(workbook, sheets_dct, sort_weight_sr)
+    sheet_titles = [CONTENT_SHEET_TITLE, *sheets_dct]
+    # worksheets can't be moved in write-only mode so they are created in sorted order
+    if sort_weight_sr is not None:
+        sheet_titles.sort(key=lambda sheet_title: sort_weight_sr[sheet_title])
+    for sheet_title in sheet_titles:
+        if sheet_title == CONTENT_SHEET_TITLE:
+            write_only_content_worksheet(workbook, CONTENT_SHEET_TITLE, content_df)
         else:
-            content_df = existing_content_df
-    # if file is newly created then create contents with single sheet_title
-    elif file_mode == 'w':
-        content_df = pd.DataFrame([[sheet_title, df_decription]], columns=['Закладка', 'Название таблицы'])
-    return content_df, item_exist
+            df_flat, df_decription, freeze_column = sheets_dct[sheet_title]
+            write_only_data_worksheet(workbook, sheet_title, df_flat, df_decription, freeze_column)
+    workbook.save(file_path)
+
+
+def write_report_session(sort_weight_dct=None):
+    """Function writes all report files with DataFrames collected in report session.
+    sort_weight_dct contains sort weights for the report files which need to be sorted {file_path: sort_weight_sr}"""
+
+    if sort_weight_dct is None:
+        sort_weight_dct = {}
+    file_path_lst = list(dict.fromkeys([*report_session_dct['sheets'], *sort_weight_dct]))
+    for file_path in file_path_lst:
+        # sorted file is written only if it exists or has DataFrames to write
+        if not file_path in report_session_dct['sheets'] and not os.path.isfile(file_path):
+            continue
+        # titles of the DataFrames queued in report session for the file
+        sheet_title_lst = list(report_session_dct['sheets'].get(file_path, {}))
+        info = f'Writing {os.path.basename(file_path)} file'
+        print(info, end =" ")
+        try:
+            write_report_file(file_path, sort_weight_dct.get(file_path))
+        except PermissionError:
+            status_info('fail', report_session_dct['max_title'], len(info))
+            show_sheets_status(sheet_title_lst, 'fail')
+            print('\nPermission denied. Close the file.\n')
+            sys.exit()
+        else:
+            status_info('ok', report_session_dct['max_title'], len(info))
+            show_sheets_status(sheet_title_lst, 'ok')
+
+
+def show_sheets_status(sheet_title_lst, status):
+    """Function to show export status of the DataFrames queued in report session 
+    after report file is written"""
+
+    for sheet_title in sheet_title_lst:
+        info = ' '*16 + f'Exporting {sheet_title} table'
+        print(info, end =" ")
+        status_info(status, report_session_dct['max_title'], len(info))
+
+
+@atexit.register
+def write_report_session_on_exit():
+    """Function writes DataFrames left in report session if program execution is stopped before report completion"""
+
+    if report_session_dct['sheets']:
+        print('\n')
+        write_report_session()
+    
+
+def generate_table_of_contents(workbook, sheets_dct, sort_weight_sr=None):
+    """"Function to create or update table of contents with items for sheets_dct titles.
+    If sort_weight_sr is defined then items are sorted"""
+
+    content_df = pd.DataFrame([[sheet_title, df_decription] for sheet_title, (_, df_decription, _) in sheets_dct.items()], 
+                                columns=CONTENT_COLUMNS)
+    # if workbook has table of contents add new items to the existing content
+    if CONTENT_SHEET_TITLE in workbook.sheetnames:
+        existing_content_df = pd.DataFrame(workbook[CONTENT_SHEET_TITLE].iter_rows(min_row=2, max_col=2, values_only=True), 
+                                            columns=CONTENT_COLUMNS)
+        existing_content_df.dropna(subset=[CONTENT_COLUMNS[0]], inplace=True)
+        content_df = content_df.loc[~content_df[CONTENT_COLUMNS[0]].isin(existing_content_df[CONTENT_COLUMNS[0]])]
+        content_df = pd.concat([existing_content_df, content_df])
+    # sort table of contents items
+    if sort_weight_sr is not None:
+        content_df.sort_values(by=[CONTENT_COLUMNS[0]], key=lambda menu_sr: menu_sr.map(sort_weight_sr), inplace=True)
+    return content_df
 
 
 def drop_multindex(df):
@@ -103,39 +209,26 @@ def drop_multindex(df):
 
 
 def report_format_completion(project_constants_lst, current_date=str(date.today())):
-    """Function to reorder sheets and items in table of contents"""
+    """Function to write report files collected in report session, 
+    reorder sheets and items in table of contents of the report file.
+    After report completion DataFrames are written right away"""
 
     project_steps_df, max_title, _, report_requisites_sr, *_ = project_constants_lst
     
+    report_session_dct['max_title'] = max_title
+    sort_weight_dct = {}
     # verify if any report DataFrame need to be saved
     mask_report = project_steps_df['report_type'] == 'report'
     mask_save = project_steps_df['export_to_excel'] == 1
 
     if not project_steps_df.loc[mask_report & mask_save].empty:
+        file_name = report_requisites_sr['customer_name'] + '_' + report_requisites_sr['project_title'] + '_tables_' + current_date + '.xlsx'
+        file_path = os.path.join(report_requisites_sr['today_report_folder'], file_name)
+        sort_weight_dct[file_path] = project_steps_df['sort_weight']
 
+    if report_session_dct['sheets'] or sort_weight_dct:
         print('\n')
         info = f'Completing the report'.upper()
-        print(info, end =" ")
-
-        file_name = report_requisites_sr['customer_name'] + '_' + report_requisites_sr['project_title'] + '_tables_' + current_date + '.xlsx'
-        file_path = os.path.join(report_requisites_sr['today_report_folder'], file_name)
-        try:
-            with pd.ExcelWriter(file_path, mode='a', if_sheet_exists= 'replace', engine='openpyxl') as writer: 
-                # import table of contents
-                content_df = pd.read_excel(writer, sheet_name='Содержание')
-                # sort table of contents items
-                content_df.sort_values(by=['Закладка'], key=lambda menu_sr: project_steps_df.loc[menu_sr, 'sort_weight'], inplace=True)
-                # write content to report file
-                content_df.to_excel(writer, sheet_name='Содержание', index = False)
-            workbook = openpyxl.load_workbook(file_path)
-            # create hyperlinks for all items of table of contents
-            hyperlink_content(workbook)
-            # sort worksheets
-            workbook._sheets.sort(key=lambda ws: project_steps_df.loc[ws.title, 'sort_weight'])
-            workbook.save(file_path)
-        except PermissionError:
-            status_info('fail', max_title, len(info))
-            print('\nPermission denied. Close the file.\n')
-            exit()
-        else:
-            status_info('ok', max_title, len(info)) 
\ No newline at end of file
+        print(info)
+        write_report_session(sort_weight_dct)
+    report_session_dct['batch_export'] = False
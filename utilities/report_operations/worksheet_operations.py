@@ -1,7 +1,8 @@
 """Module to format worksheet in report excel file"""
 
 import openpyxl
-from openpyxl.styles import Alignment, Font
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 from openpyxl.utils import get_column_letter
 
 
@@ -10,6 +11,13 @@ def format_workbook(workbook, sheet_title, df_decription, freeze_column):
 
     # create hyperlinks for all items of table of contents
     hyperlink_content(workbook)
+    # format data worksheet
+    format_data_worksheet(workbook, sheet_title, df_decription, freeze_column)
+
+
+def format_data_worksheet(workbook, sheet_title, df_decription, freeze_column):
+    """Function to format data worksheet"""
+
     # add DataFrame description and link to the table of contents
     add_dataframe_title(workbook, sheet_title, df_decription)
     # change worksheet text format
@@ -102,3 +110,71 @@ def add_header_filter(workbook, sheet_title, header_row_num: int=3):
     worksheet = workbook[sheet_title]
     FullRange = "A" + str(header_row_num) + ":" + get_column_letter(worksheet.max_column) + str(worksheet.max_row)
     worksheet.auto_filter.ref = FullRange
+
+
+def write_only_content_worksheet(workbook, content_title, content_df):
+    """Function to add table of contents with hyperlinks to the write-only workbook"""
+
+    ws_content = workbook.create_sheet(content_title)
+    ws_content.freeze_panes = 'B2'
+    # column widths should be set before rows are written
+    set_columns_best_fit(ws_content, len(content_df.columns))
+    ws_content.append(write_only_header_cells(ws_content, content_df.columns, Font(bold=True)))
+    for bookmark_title, df_decription in content_df.itertuples(index=False):
+        bookmark_cell = write_only_hyperlink_cell(ws_content, sheet_name=bookmark_title, cell_ref='A1')
+        ws_content.append([bookmark_cell, df_decription])
+
+
+def write_only_data_worksheet(workbook, sheet_title, df, df_decription, freeze_column, header_row_num: int=3):
+    """Function to add DataFrame with description, link to the table of contents and header
+    to the write-only workbook. Rows are streamed to the file, data cells keep default format"""
+
+    ws = workbook.create_sheet(sheet_title)
+    # worksheet properties should be set before rows are written
+    ws.freeze_panes = freeze_column + str(header_row_num + 1)
+    ws.auto_filter.ref = "A" + str(header_row_num) + ":" + get_column_letter(max(len(df.columns), 1)) + str(len(df) + header_row_num)
+    set_columns_best_fit(ws, len(df.columns))
+    # add table title and hyperlink to the table of contents
+    title_cell = WriteOnlyCell(ws, value=df_decription)
+    title_cell.font = Font(bold=True)
+    ws.append([title_cell])
+    ws.append([write_only_hyperlink_cell(ws, sheet_name='Содержание', cell_ref='A2', display_name='К содержанию')])
+    ws.append(write_only_header_cells(ws, df.columns, Font(size=10, bold=True), Alignment(wrapText=True)))
+    # empty values are written as empty cells
+    df = df.astype(object).where(df.notna(), None)
+    for row in df.itertuples(index=False, name=None):
+        ws.append(row)
+
+
+def write_only_header_cells(ws, columns, font, alignment=None):
+    """Function returns header cells for the write-only worksheet"""
+
+    border_side = Side(style='thin')
+    header_cells = []
+    for column in columns:
+        cell = WriteOnlyCell(ws, value=column)
+        cell.font = font
+        cell.border = Border(left=border_side, right=border_side, top=border_side, bottom=border_side)
+        if alignment:
+            cell.alignment = alignment
+        header_cells.append(cell)
+    return header_cells
+
+
+def write_only_hyperlink_cell(ws, sheet_name, cell_ref='A1', display_name=None):
+    """Function returns cell with hyperlink to the sheet_name for the write-only worksheet"""
+
+    if display_name is None:
+        display_name = sheet_name
+    cell = WriteOnlyCell(ws, value=display_name)
+    to_location = "'{0}'!{1}".format(sheet_name, cell_ref)
+    cell.hyperlink = openpyxl.worksheet.hyperlink.Hyperlink(display=display_name, ref='', location=to_location)
+    cell.font = openpyxl.styles.fonts.Font(u='single', color=openpyxl.styles.colors.BLUE)
+    return cell
+
+
+def set_columns_best_fit(ws, column_number):
+    """Function to make column_number columns of the worksheet best fit"""
+
+    for col_number in range(column_number):
+        ws.column_dimensions[get_column_letter(col_number + 1)].bestFit = True
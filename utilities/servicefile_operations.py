@@ -1,6 +1,7 @@
 """Module to import data from service files (san_automation_info.xlsx and report_info.xlsx)"""
 
 import os
+import pickle
 import re
 import sys
 import warnings
@@ -8,8 +9,22 @@ import warnings
 import pandas as pd
 import xlrd
 
+import utilities.fingerprint_operations as fpop
 from utilities.module_execution import status_info
 
+# service file which sheets are saved to the snapshot file next to it 
+# (all sheets are imported from snapshot if service file content is not changed)
+SERVICE_FILE = 'san_automation_info.xlsx'
+SERVICE_SNAPSHOT_SUFFIX = '_snapshot.pickle'
+# header row of the service file sheets
+SERVICE_HEADER = 2
+
+# sheets imported from service files during current program execution 
+# {filepath: (file signature, {(sheet_title, columns, index_name, header): DataFrame})}
+service_sheets_cache = {}
+# regular expressions imported during current program execution {(filepath, sheet_title): (file signature, pattern_dct)}
+pattern_dct_cache = {}
+
 
 def columns_import(sheet_title, max_title, *args, 
                     init_file = 'san_automation_info.xlsx', display_status=True):
@@ -66,7 +81,7 @@ def dataframe_import(sheet_title, max_title, init_file='san_automation_info.xlsx
         print(info, end = ' ')
     # try read data in excel
     try:
-        dataframe = pd.read_excel(init_file, sheet_name=sheet_title, usecols=columns, index_col=index_name, header=header)
+        dataframe = read_service_sheet(init_file, sheet_title, columns, index_name, header)
     # if file is not found
     except FileNotFoundError:
         if display_status:
@@ -74,7 +89,7 @@ def dataframe_import(sheet_title, max_title, init_file='san_automation_info.xlsx
         print(f'File not found. Check if file {init_file} exists.')
         sys.exit()
     # if sheet is not found
-    except xlrd.biffh.XLRDError:
+    except (xlrd.biffh.XLRDError, KeyError):
         if display_status:
             status_info('fail', max_title, len(info))
         print(f'Sheet {sheet_title} not found in {init_file}. Check if it exists.')
@@ -85,16 +100,94 @@ def dataframe_import(sheet_title, max_title, init_file='san_automation_info.xlsx
     return dataframe
 
 
+def get_service_file_signature(init_file):
+    """Function returns service file signature (size and modification time)"""
+
+    init_file_stat = os.stat(init_file)
+    return (init_file_stat.st_size, init_file_stat.st_mtime_ns)
+
+
+def read_service_sheet(init_file, sheet_title, columns=None, index_name=None, header=SERVICE_HEADER):
+    """Function returns copy of the sheet_title DataFrame imported from init_file.
+    Each sheet is imported from excel once during program execution and imported again only if 
+    init_file size or modification time changed. All SERVICE_FILE sheets are imported at once 
+    (from snapshot file if SERVICE_FILE content is not changed since snapshot was saved)"""
+
+    init_file_key = os.path.abspath(init_file)
+    init_file_signature = get_service_file_signature(init_file)
+    sheet_key = (sheet_title, tuple(columns) if isinstance(columns, list) else columns, index_name, header)
+
+    cached_signature, sheets_dct = service_sheets_cache.get(init_file_key, (None, None))
+    if cached_signature != init_file_signature:
+        sheets_dct = load_service_snapshot(init_file) if os.path.basename(init_file) == SERVICE_FILE else {}
+        service_sheets_cache[init_file_key] = (init_file_signature, sheets_dct)
+
+    if not sheet_key in sheets_dct:
+        default_sheet_key = (sheet_title, None, None, SERVICE_HEADER)
+        # columns are taken from the sheet imported with default parameters in sheet columns order (as usecols does)
+        if sheet_key[2:] == default_sheet_key[2:] and isinstance(columns, list) and default_sheet_key in sheets_dct \
+            and set(columns).issubset(sheets_dct[default_sheet_key].columns):
+            sheet_df = sheets_dct[default_sheet_key]
+            sheets_dct[sheet_key] = sheet_df[[column for column in sheet_df.columns if column in columns]].copy()
+        elif sheet_key == default_sheet_key and os.path.basename(init_file) == SERVICE_FILE:
+            # sheet not found in SERVICE_FILE
+            raise KeyError(sheet_title)
+        else:
+            sheets_dct[sheet_key] = pd.read_excel(init_file, sheet_name=sheet_title, usecols=columns, 
+                                                  index_col=index_name, header=header)
+    return sheets_dct[sheet_key].copy()
+
+
+def load_service_snapshot(init_file):
+    """Function returns dictionary with all init_file sheets imported with default parameters
+    {(sheet_title, None, None, SERVICE_HEADER): DataFrame}. Sheets are loaded from snapshot file
+    if it's saved for the same init_file content. Otherwise sheets are imported from excel and saved to snapshot file"""
+
+    snapshot_file = os.path.splitext(init_file)[0] + SERVICE_SNAPSHOT_SUFFIX
+    # snapshot is valid for the same service file content and pandas version
+    *_, init_file_hash = fpop.get_file_fingerprint(init_file)
+    snapshot_signature = (init_file_hash, pd.__version__)
+
+    if os.path.isfile(snapshot_file):
+        try:
+            with open(snapshot_file, 'rb') as file:
+                cached_snapshot_signature, sheets_dct = pickle.load(file)
+            if cached_snapshot_signature == snapshot_signature:
+                return sheets_dct
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError, ImportError, TypeError):
+            pass
+
+    sheets_dct = {(sheet_title, None, None, SERVICE_HEADER): sheet_df
+                    for sheet_title, sheet_df in pd.read_excel(init_file, sheet_name=None, header=SERVICE_HEADER).items()}
+    # file is replaced after it's completely written
+    snapshot_tmp_file = snapshot_file + '.tmp'
+    try:
+        with open(snapshot_tmp_file, 'wb') as file:
+            pickle.dump((snapshot_signature, sheets_dct), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(snapshot_tmp_file, snapshot_file)
+    except OSError:
+        pass
+    return sheets_dct
+
+
 def regex_pattern_import(sheet_title, max_title):
     """Function to import regex tepmplates"""
     
     re_pattern_df = dataframe_import(sheet_title, max_title)
+    # compiled patterns are taken from cache if service file is not changed
+    pattern_key = (os.path.abspath(SERVICE_FILE), sheet_title)
+    service_file_signature = get_service_file_signature(SERVICE_FILE)
+    cached_signature, pattern_dct = pattern_dct_cache.get(pattern_key, (None, None))
+    if cached_signature == service_file_signature:
+        return dict(pattern_dct), re_pattern_df
+
     pattern_names = re_pattern_df['pattern_name'].dropna().to_list()
     patterns = re_pattern_df['pattern_value'].dropna().to_list()
     if len(pattern_names) == len(patterns):
         patterns = [re.compile(fr"{element}", re.IGNORECASE) for element in patterns]
         pattern_dct = dict(zip(pattern_names, patterns))
-        return pattern_dct, re_pattern_df
+        pattern_dct_cache[pattern_key] = (service_file_signature, pattern_dct)
+        return dict(pattern_dct), re_pattern_df
     else:
         print("ERROR. 'pattern_name' and 'pattern' columns have different length. Check data in {sheet_title} tab")
         exit()
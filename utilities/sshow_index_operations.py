@@ -0,0 +1,110 @@
+"""Module to build sshow file index (byte offsets of section headers, command start and end lines,
+switch contexts) once per file and move file cursor with the index instead of reading sshow line by line"""
+
+
+import os
+import re
+from bisect import bisect_left
+
+# sshow section header inserted by sshow_build.insert_section_header and rebuilt sshow footer
+SECTION_HEADER_PATTERN = re.compile(rb'^\| (?:Section: (?P<section_name>\w+) |(?P<footer>\.\.\. rebuilt finished) *)\|\r?$')
+# logical switch context and base switch context lines within switchcmd output
+SWITCH_CONTEXT_PATTERN = re.compile(rb'^CURRENT CONTEXT -- (?P<switch_index>\d+) *, \d+\r?$')
+BASESWITCH_CONTEXT_PATTERN = re.compile(rb'^BASE +SWITCH +CONTEXT *-- *FID: *(?P<fid>\d+) *\r?$')
+# switchcmd start lines (all commands end with colon), configshow begin/end lines in brackets
+# and command end lines ('real 0m0.01s', '** SS CMD END **')
+COMMAND_PATTERN = re.compile(rb'^(?:.*: *|\[.+\] *|real [\w.]+.*|.*\*\* SS CMD END \*\* *)\r?$')
+
+# sshow indexes built during current program execution
+sshow_index_cache = {}
+
+
+def get_sshow_index(sshow_file):
+    """Function returns sshow_file index. Index is built on first request and
+    rebuilt only if sshow_file size or modification time changed"""
+
+    sshow_file_stat = os.stat(sshow_file)
+    sshow_file_signature = (sshow_file_stat.st_size, sshow_file_stat.st_mtime_ns)
+    sshow_file_key = os.path.abspath(sshow_file)
+
+    if sshow_file_key in sshow_index_cache:
+        cached_signature, sshow_index = sshow_index_cache[sshow_file_key]
+        if cached_signature == sshow_file_signature:
+            return sshow_index
+    sshow_index = build_sshow_index(sshow_file)
+    sshow_index_cache[sshow_file_key] = (sshow_file_signature, sshow_index)
+    return sshow_index
+
+
+def build_sshow_index(sshow_file):
+    """Function reads sshow_file once and returns dictionary with byte offsets of
+    section headers, switch contexts, base switch contexts and
+    landmarks (all lines where any switchcmd section may start)"""
+
+    sshow_index = {'sections': {}, 'contexts': {}, 'base_contexts': {}, 'landmarks': []}
+    offset = 0
+    with open(sshow_file, 'rb') as file:
+        for line in file:
+            section_match = SECTION_HEADER_PATTERN.match(line) if line.startswith(b'| ') else None
+            if section_match:
+                if section_match.group('section_name'):
+                    section_name = section_match.group('section_name').decode()
+                    sshow_index['sections'].setdefault(section_name, offset)
+                sshow_index['landmarks'].append(offset)
+            elif line.startswith(b'CURRENT CONTEXT'):
+                context_match = SWITCH_CONTEXT_PATTERN.match(line)
+                if context_match:
+                    switch_index = context_match.group('switch_index').decode()
+                    sshow_index['contexts'].setdefault(switch_index, []).append(offset)
+            elif line.startswith(b'BASE'):
+                context_match = BASESWITCH_CONTEXT_PATTERN.match(line)
+                if context_match:
+                    fid = context_match.group('fid').decode()
+                    sshow_index['base_contexts'].setdefault(fid, []).append(offset)
+            elif COMMAND_PATTERN.match(line):
+                sshow_index['landmarks'].append(offset)
+            offset += len(line)
+    return sshow_index
+
+
+def goto_offset(file, offsets):
+    """Function moves cursor to the first offset from sorted offsets list
+    which is not less than current cursor position and returns line at this offset.
+    If there is no such offset cursor moved to the end of file and empty string returned"""
+
+    offset_id = bisect_left(offsets, file.tell())
+    if offset_id == len(offsets):
+        file.seek(0, os.SEEK_END)
+        return ''
+    file.seek(offsets[offset_id])
+    return file.readline()
+
+
+def goto_next_landmark(file, sshow_index):
+    """Function moves cursor to the next line where switchcmd section or sshow section may start.
+    Used instead of file.readline() to skip lines which can't match any section start pattern"""
+
+    return goto_offset(file, sshow_index['landmarks'])
+
+
+def goto_section(file, sshow_index, section_name):
+    """Function moves cursor to the section_name header of the rebuilt sshow file.
+    Returns header line or empty string if section is absent"""
+
+    if not section_name in sshow_index['sections']:
+        file.seek(0, os.SEEK_END)
+        return ''
+    file.seek(sshow_index['sections'][section_name])
+    return file.readline()
+
+
+def goto_switch_context(file, sshow_index, switch_index):
+    """Function moves cursor to the next 'CURRENT CONTEXT -- switch_index' line"""
+
+    return goto_offset(file, sshow_index['contexts'].get(str(switch_index), []))
+
+
+def goto_baseswitch_context(file, sshow_index, fid):
+    """Function moves cursor to the next 'BASE SWITCH CONTEXT -- FID: fid' line"""
+
+    return goto_offset(file, sshow_index['base_contexts'].get(str(fid), []))